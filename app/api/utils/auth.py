@@ -1,6 +1,7 @@
 import uuid
 from fastapi import Depends, HTTPException
 from app.application.services.auth_service import AuthService
+from app.infrastructure.cache.principal_cache import principal_cache
 from app.infrastructure.database.repositories.curator_repository import (
     CuratorRepository,
     curator_repository_getter,
@@ -14,10 +15,17 @@ async def validate_curator(
     authorization: HTTPAuthorizationCredentials = Depends(security),
     curator_service: CuratorRepository = Depends(curator_repository_getter),
 ) -> tuple[uuid.UUID, str]:
-    curator_id = AuthService.get_curator_id_from_access(authorization.credentials)
-    curator = await curator_service.get_by_id(curator_id)
-    if not curator:
+    curator_id, jti, _ = AuthService.get_access_claims(authorization.credentials)
+    # Токен без jti нельзя отозвать точечно, его всегда проверяем по БД
+    valid, revoked = await principal_cache.check(curator_id, jti) if jti else (False, False)
+    if revoked:
+        raise HTTPException(status_code=401, detail="Access token has been revoked")
+    if valid:
+        return curator_id, authorization.credentials
+    if not await curator_service.exists(curator_id):
         raise HTTPException(status_code=401, detail="Incorrect access token")
+    if jti:
+        await principal_cache.set_valid(curator_id, jti)
     return curator_id, authorization.credentials
 
 
@@ -0,0 +1,119 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from urllib.parse import quote
+from botocore.exceptions import ClientError
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+from app.core.config import settings
+from app.infrastructure.s3_storage.s3_client import S3Client, iter_body
+
+
+def _http_date(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Файл не найден в хранилище"
+    )
+
+
+def _if_range_matches(if_range: str, head: dict) -> bool:
+    """If-Range: диапазон отдается, только если объект не менялся (RFC 9110, 13.1.5)"""
+    if if_range.startswith(('"', "W/")):
+        # Сравнение только сильных ETag
+        return not if_range.startswith("W/") and if_range == head.get("ETag")
+    date = _http_date(if_range)
+    last_modified = head.get("LastModified")
+    return date is not None and last_modified is not None and last_modified.replace(microsecond=0) == date
+
+
+async def stream_object(
+    request: Request,
+    s3_client: S3Client,
+    object_name: str,
+    filename: str | None = None,
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """
+    Отдать объект S3 потоком с поддержкой Range (206) и условных запросов.
+    ETag и Last-Modified берутся из S3, условия проверяет сам S3.
+    В памяти держится один чанк, поэтому большие видео можно перематывать
+    без нагрузки на API.
+    """
+    headers = request.headers
+    range_header = headers.get("range")
+    if range_header is not None and not range_header.startswith("bytes="):
+        range_header = None
+    if_range = headers.get("if-range")
+    if range_header is not None and if_range is not None:
+        head = await s3_client.head_object(object_name)
+        if head is None:
+            raise _not_found()
+        if not _if_range_matches(if_range, head):
+            range_header = None
+
+    if_none_match = headers.get("if-none-match")
+    if_match = headers.get("if-match")
+    try:
+        obj = await s3_client.open_object(
+            object_name,
+            range_header=range_header,
+            if_match=if_match,
+            if_none_match=if_none_match,
+            # Даты учитываются, только если нет соответствующего условия по ETag
+            if_modified_since=None if if_none_match else _http_date(headers.get("if-modified-since")),
+            if_unmodified_since=None if if_match else _http_date(headers.get("if-unmodified-since")),
+        )
+    except ClientError as e:
+        code = e.response.get("Error", {}).get("Code")
+        metadata = e.response.get("ResponseMetadata", {})
+        http_status = metadata.get("HTTPStatusCode")
+        if code in ("404", "NoSuchKey", "NotFound"):
+            raise _not_found()
+        if http_status == status.HTTP_304_NOT_MODIFIED:
+            s3_headers = metadata.get("HTTPHeaders", {})
+            not_modified = {"Cache-Control": cache_control}
+            for name in ("ETag", "Last-Modified"):
+                if name.lower() in s3_headers:
+                    not_modified[name] = s3_headers[name.lower()]
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=not_modified)
+        if http_status == status.HTTP_412_PRECONDITION_FAILED:
+            return Response(status_code=status.HTTP_412_PRECONDITION_FAILED)
+        if http_status == status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE:
+            head = await s3_client.head_object(object_name)
+            size = head.get("ContentLength", 0) if head else 0
+            return Response(
+                status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+        raise
+
+    response_headers = {
+        "Accept-Ranges": "bytes",
+        "Content-Length": str(obj["ContentLength"]),
+        "Cache-Control": cache_control,
+    }
+    if obj.get("ETag"):
+        response_headers["ETag"] = obj["ETag"]
+    if obj.get("LastModified"):
+        response_headers["Last-Modified"] = format_datetime(
+            obj["LastModified"].astimezone(timezone.utc), usegmt=True
+        )
+    if obj.get("ContentRange"):
+        response_headers["Content-Range"] = obj["ContentRange"]
+    if filename:
+        response_headers["Content-Disposition"] = f"inline; filename*=UTF-8''{quote(filename)}"
+    return StreamingResponse(
+        iter_body(obj["Body"], settings.s3.download_chunk_size),
+        status_code=status.HTTP_206_PARTIAL_CONTENT if obj.get("ContentRange") else status.HTTP_200_OK,
+        media_type=obj.get("ContentType") or "application/octet-stream",
+        headers=response_headers,
+    )
@@ -0,0 +1,27 @@
+from typing import Optional
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.infrastructure.database.pagination import decode_cursor
+
+
+class PageParams(BaseModel):
+    limit: int
+    cursor: Optional[str] = None
+
+
+def pagination_params(
+    limit: int = Query(
+        settings.pagination.default_limit, ge=1, le=settings.pagination.max_limit
+    ),
+    cursor: Optional[str] = Query(None, description="Курсор из next_cursor предыдущей страницы"),
+) -> PageParams:
+    if cursor is not None:
+        try:
+            decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+            )
+    return PageParams(limit=limit, cursor=cursor)
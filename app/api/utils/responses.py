@@ -1,6 +1,45 @@
-from fastapi.responses import JSONResponse
+from typing import AsyncIterator, Sequence
+
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
 
 
 class OkResponse(JSONResponse):
     def __init__(self, message: str):
         super().__init__(status_code=200, content={"detail": message})
+
+
+class ModelResponse(Response):
+    """
+    JSON из уже провалидированной pydantic-модели. FastAPI не проверяет
+    Response повторно по response_model, а pydantic-core сериализует
+    модель сразу в байты без промежуточного dict и json.dumps.
+    response_model в декораторе остается для документации.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
+
+
+def _to_json(item: BaseModel) -> bytes:
+    return item.__pydantic_serializer__.to_json(item)
+
+
+async def ndjson_chunks(batches: AsyncIterator[Sequence[BaseModel]]) -> AsyncIterator[bytes]:
+    """NDJSON: модель на строку, пачка моделей на chunk ответа"""
+    async for batch in batches:
+        if batch:
+            yield b"".join(_to_json(item) + b"\n" for item in batch)
+
+
+async def json_array_chunks(batches: AsyncIterator[Sequence[BaseModel]]) -> AsyncIterator[bytes]:
+    """Один JSON-массив, отдаваемый по частям: пачка моделей на chunk"""
+    yield b"["
+    separator = b""
+    async for batch in batches:
+        if batch:
+            yield separator + b",".join(_to_json(item) for item in batch)
+            separator = b","
+    yield b"]"
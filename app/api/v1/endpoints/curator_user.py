@@ -1,11 +1,12 @@
 import uuid
 from fastapi import APIRouter, File, UploadFile
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from app.application.dto.curator import (
     CuratorPATCH,
     CuratorPOST,
     CuratorPostBase,
 )
+from app.application.dto.upload import PresignedUpload, UploadComplete, UploadUrlRequest
 from app.application.services.curator_service import (
     CuratorService,
     curator_service_getter,
@@ -16,7 +17,11 @@ from app.application.services.auth_service import (
 )
 from app.domain.entities.auth_tokens.auth_token import AuthToken
 from app.api.utils.auth import validate_curator
+from app.api.utils.downloads import stream_object
 from app.api.utils.responses import OkResponse
+from app.api.utils.pagination import PageParams, pagination_params
+from app.application.dto.pagination import Page
+from app.domain.entities.persons.curator import Curator
 
 
 router = APIRouter(
@@ -73,7 +78,7 @@ async def logout_curator(
         service: CuratorService = Depends(curator_service_getter),
         credentials: tuple[uuid.UUID, str] = Depends(validate_curator)):
     try:
-        await service.logout_curator(refresh_token)
+        await service.logout_curator(refresh_token, credentials[1])
     except ValueError:
         raise HTTPException(status_code=401, detail="Invalid Refresh Token")
     return OkResponse("successfully logout")
@@ -99,17 +104,35 @@ async def get_me(
     return await service.get_by_id(curator_id)
 
 
+@router.get("/{curator_id}/avatar", response_class=Response)
+async def get_curator_avatar(
+        request: Request,
+        curator_id: uuid.UUID,
+        service: CuratorService = Depends(curator_service_getter)):
+    """Аватар куратора потоком, с ETag и условными запросами"""
+    key = await service.get_avatar_key(curator_id)
+    return await stream_object(
+        request, service.s3_client, key, cache_control="public, max-age=300"
+    )
+
+
 @router.get("/{curator_id}")
 async def get_curator(curator_id: uuid.UUID, service: CuratorService = Depends(curator_service_getter)):
     return await service.get_by_id(curator_id)
 
 
-@router.get("/")
-async def list_curators(service: CuratorService = Depends(curator_service_getter)):
-    return await service.get_list()
+@router.get("/", response_model=Page[Curator])
+async def list_curators(
+        page: PageParams = Depends(pagination_params),
+        service: CuratorService = Depends(curator_service_getter)):
+    return await service.get_page(page.limit, page.cursor)
 
 
-@router.post("/avatar")
+@router.post(
+    "/avatar",
+    deprecated=True,
+    description="Файл проходит через API. Используйте /avatar/upload-url и /avatar/complete.",
+)
 async def upload_file(
     file: UploadFile = File(...),
     service: CuratorService = Depends(curator_service_getter),
@@ -122,3 +145,28 @@ async def upload_file(
     if not updated_curator:
         raise HTTPException(status_code=401, detail="User with this id was not found")
     return updated_curator
+
+
+@router.post("/avatar/upload-url", response_model=PresignedUpload)
+async def create_avatar_upload(
+    data: UploadUrlRequest,
+    service: CuratorService = Depends(curator_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator),
+):
+    """Подписанная форма для загрузки аватара напрямую в S3"""
+    curator_id, _ = credentials
+    return await service.create_avatar_upload(curator_id, data)
+
+
+@router.post("/avatar/complete")
+async def complete_avatar_upload(
+    data: UploadComplete,
+    service: CuratorService = Depends(curator_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator),
+):
+    """Сохранить ссылку на загруженный в S3 аватар"""
+    curator_id, _ = credentials
+    updated_curator = await service.complete_avatar_upload(curator_id, data)
+    if not updated_curator:
+        raise HTTPException(status_code=401, detail="User with this id was not found")
+    return updated_curator
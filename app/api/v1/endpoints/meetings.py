@@ -1,7 +1,9 @@
+import uuid
 from uuid import UUID
 from datetime import datetime
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from typing import List, Literal, Optional
+from fastapi import APIRouter, Body, Depends, Header, HTTPException, Path, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
 from app.application.dto.meeting import (
     MeetingCreate,
@@ -14,6 +16,18 @@ from app.application.dto.task import (
     TaskResponse,
     MeetingTaskCreate,
 )
+from app.application.dto.batch import BatchResult
+from app.application.dto.upload import (
+    ArtifactByHash,
+    ArtifactUploadComplete,
+    MultipartUploadComplete,
+    MultipartUploadCreate,
+    MultipartUploadResponse,
+    PresignedUpload,
+    UploadedPart,
+    UploadUrlRequest,
+)
+from app.application.dto.pagination import Page
 from app.application.services.meeting_service import (
     MeetingService,
     meeting_service_getter,
@@ -22,7 +36,22 @@ from app.application.services.task_service import (
     TaskService,
     task_service_getter,
 )
+from app.application.services.artifact_service import (
+    ArtifactService,
+    artifact_service_getter,
+)
+from app.application.services.multipart_upload_service import (
+    MAX_PARTS,
+    MultipartUploadService,
+    multipart_upload_service_getter,
+)
+from app.domain.entities.artifacts.artifact import Artifact
 from app.domain.enums.meeting_status import MeetingStatus
+from app.api.utils.auth import validate_curator
+from app.api.utils.downloads import stream_object
+from app.api.utils.pagination import PageParams, pagination_params
+from app.api.utils.responses import ModelResponse, json_array_chunks, ndjson_chunks
+from app.core.config import settings
 
 router = APIRouter(
     prefix="/meetings",
@@ -51,14 +80,52 @@ async def create_meeting(
 
 @router.get(
     "/all",
-    response_model=List[MeetingResponse],
+    response_model=Page[MeetingResponse],
     summary="Получить все встречи всех команд",
 )
 async def get_all_meetings(
+    page: PageParams = Depends(pagination_params),
     service: MeetingService = Depends(meeting_service_getter),
 ):
-    """Получить все встречи всех команд, отсортированные по времени."""
-    return await service.get_all_meetings()
+    """
+    Получить встречи всех команд, отсортированные по времени.
+
+    Постраничная выдача: limit - размер страницы, cursor - значение next_cursor
+    из предыдущего ответа.
+    """
+    return ModelResponse(await service.get_all_meetings(page.limit, page.cursor))
+
+
+@router.get(
+    "/all/stream",
+    summary="Выгрузить все встречи всех команд потоком",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {
+                "application/x-ndjson": {},
+                "application/json": {},
+            },
+            "description": "Встречи в формате MeetingResponse",
+        }
+    },
+)
+async def stream_all_meetings(
+    format: Literal["ndjson", "json"] = Query(
+        "ndjson", description="ndjson - встреча на строку, json - один массив"
+    ),
+    service: MeetingService = Depends(meeting_service_getter),
+):
+    """
+    Все встречи всех команд, отсортированные по времени, без пагинации.
+
+    Строки читаются серверным курсором и отдаются пачками по мере чтения:
+    память и время до первого байта не зависят от размера таблицы.
+    """
+    batches = service.stream_all_meetings(settings.pagination.stream_batch_size)
+    if format == "json":
+        return StreamingResponse(json_array_chunks(batches), media_type="application/json")
+    return StreamingResponse(ndjson_chunks(batches), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -113,7 +180,8 @@ async def complete_meeting(
     
     При завершении:
     1. Статус встречи меняется на COMPLETED
-    2. Невыполненные задачи автоматически переносятся на следующую запланированную встречу
+    2. Невыполненные задачи переносятся на следующую запланированную встречу в фоне,
+       после ответа
     3. Если следующей встречи нет, задачи остаются в текущей встрече
     """
     return await service.complete_meeting(meeting_id)
@@ -168,6 +236,22 @@ async def create_task_for_meeting(
     return await task_service.create_for_meeting(meeting_id, data)
 
 
+# Объявлен до /{meeting_id}/tasks/{task_id}, иначе "batch" разберется как task_id
+@router.post(
+    "/{meeting_id}/tasks/batch",
+    response_model=BatchResult[TaskResponse],
+    status_code=status.HTTP_201_CREATED,
+    summary="Создать задачи для встречи пакетом",
+)
+async def create_tasks_for_meeting_batch(
+    meeting_id: UUID,
+    data: List[TaskCreate] = Body(..., min_length=1, max_length=settings.batch.max_size),
+    task_service: TaskService = Depends(task_service_getter),
+):
+    """Создать список задач и привязать их к встрече одной транзакцией."""
+    return await task_service.create_batch_for_meeting(meeting_id, data)
+
+
 @router.get(
     "/{meeting_id}/tasks",
     response_model=List[TaskResponse],
@@ -221,6 +305,224 @@ async def remove_task_from_meeting(
     return Response(f"Successfully removed task {task_id} from meeting {meeting_id}", 200)
 
 
+# Эндпоинты для артефактов встречи (записи, файлы)
+
+@router.post(
+    "/{meeting_id}/artifacts/upload-url",
+    response_model=PresignedUpload,
+    summary="Получить подписанную форму для загрузки файла встречи",
+)
+async def create_meeting_artifact_upload(
+    meeting_id: UUID,
+    data: UploadUrlRequest,
+    service: ArtifactService = Depends(artifact_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """
+    Выдать форму для загрузки файла напрямую в хранилище, минуя API.
+    После загрузки нужно вызвать POST /{meeting_id}/artifacts с полученным key.
+    """
+    return await service.create_meeting_upload(meeting_id, data)
+
+
+@router.post(
+    "/{meeting_id}/artifacts",
+    response_model=Artifact,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Подтвердить загрузку файла встречи",
+)
+async def complete_meeting_artifact_upload(
+    meeting_id: UUID,
+    data: ArtifactUploadComplete,
+    service: ArtifactService = Depends(artifact_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """
+    Проверить, что файл есть в хранилище, и создать артефакт встречи.
+    Артефакт создается в статусе PROCESSING: хеш и перенос файла идут
+    в фоне, скачать файл можно, когда статус станет READY.
+    """
+    return await service.complete_meeting_upload(meeting_id, data)
+
+
+@router.get(
+    "/{meeting_id}/artifacts",
+    response_model=List[Artifact],
+    summary="Получить артефакты встречи",
+)
+async def get_meeting_artifacts(
+    meeting_id: UUID,
+    service: ArtifactService = Depends(artifact_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """Получить список артефактов, привязанных к встрече."""
+    return await service.get_meeting_artifacts(meeting_id)
+
+
+@router.post(
+    "/{meeting_id}/artifacts/by-hash",
+    response_model=Artifact,
+    status_code=status.HTTP_201_CREATED,
+    summary="Привязать уже загруженный файл по хешу",
+)
+async def link_meeting_artifact_by_hash(
+    meeting_id: UUID,
+    data: ArtifactByHash,
+    service: ArtifactService = Depends(artifact_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """
+    Привязать к встрече файл, который уже есть в хранилище, без загрузки.
+
+    Клиент считает SHA-256 файла и вызывает этот эндпоинт перед загрузкой:
+    на 404 файл нужно загрузить через upload-url или составную загрузку.
+    """
+    return await service.link_meeting_content(meeting_id, data)
+
+
+@router.get(
+    "/{meeting_id}/artifacts/{artifact_id}/content",
+    summary="Скачать файл артефакта",
+    response_class=Response,
+    responses={
+        200: {"content": {"application/octet-stream": {}}},
+        206: {"description": "Запрошенный диапазон байт"},
+        304: {"description": "Файл не изменился"},
+        416: {"description": "Диапазон вне файла"},
+    },
+)
+async def download_meeting_artifact(
+    request: Request,
+    meeting_id: UUID,
+    artifact_id: UUID,
+    service: ArtifactService = Depends(artifact_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """
+    Отдать файл артефакта потоком. Поддерживаются Range (перемотка видео),
+    If-None-Match / If-Modified-Since и If-Range.
+    """
+    artifact, key = await service.get_meeting_file(meeting_id, artifact_id)
+    return await stream_object(request, service.s3_client, key, filename=artifact.name)
+
+
+@router.delete(
+    "/{meeting_id}/artifacts/{artifact_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Отвязать артефакт от встречи",
+)
+async def remove_meeting_artifact(
+    meeting_id: UUID,
+    artifact_id: UUID,
+    service: ArtifactService = Depends(artifact_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """Отвязать артефакт; файл удаляется, когда на него не осталось ссылок."""
+    await service.remove_meeting_artifact(meeting_id, artifact_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# Составная загрузка больших файлов (записей встреч)
+
+@router.post(
+    "/{meeting_id}/artifacts/uploads",
+    response_model=MultipartUploadResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="Начать составную загрузку файла встречи",
+)
+async def initiate_meeting_artifact_upload(
+    meeting_id: UUID,
+    data: MultipartUploadCreate,
+    service: MultipartUploadService = Depends(multipart_upload_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """
+    Начать загрузку файла по частям (для файлов больше нескольких сотен МБ).
+
+    Файл режется на part_count частей по part_size байт, части загружаются
+    через PUT .../parts/{part_number} в любом порядке и параллельно.
+    После обрыва загруженные части видны в GET .../uploads/{upload_id}.
+    """
+    return await service.initiate(meeting_id, data)
+
+
+@router.get(
+    "/{meeting_id}/artifacts/uploads/{upload_id}",
+    response_model=MultipartUploadResponse,
+    summary="Получить состояние составной загрузки",
+)
+async def get_meeting_artifact_upload(
+    meeting_id: UUID,
+    upload_id: UUID,
+    service: MultipartUploadService = Depends(multipart_upload_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """Статус загрузки и список уже загруженных частей."""
+    return await service.get(meeting_id, upload_id)
+
+
+@router.put(
+    "/{meeting_id}/artifacts/uploads/{upload_id}/parts/{part_number}",
+    response_model=UploadedPart,
+    summary="Загрузить часть файла",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/octet-stream": {"schema": {"type": "string", "format": "binary"}}},
+        }
+    },
+)
+async def upload_meeting_artifact_part(
+    request: Request,
+    meeting_id: UUID,
+    upload_id: UUID,
+    part_number: int = Path(..., ge=1, le=MAX_PARTS),
+    content_length: Optional[int] = Header(None),
+    service: MultipartUploadService = Depends(multipart_upload_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """
+    Загрузить часть с номером part_number, тело запроса - байты части.
+    Повторная загрузка той же части заменяет предыдущую.
+    """
+    return await service.upload_part(
+        meeting_id, upload_id, part_number, request.stream(), content_length
+    )
+
+
+@router.post(
+    "/{meeting_id}/artifacts/uploads/{upload_id}/complete",
+    response_model=Artifact,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Завершить составную загрузку",
+)
+async def complete_meeting_artifact_upload_parts(
+    meeting_id: UUID,
+    upload_id: UUID,
+    data: MultipartUploadComplete,
+    service: MultipartUploadService = Depends(multipart_upload_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """Собрать файл из загруженных частей и создать артефакт встречи в статусе PROCESSING."""
+    return await service.complete(meeting_id, upload_id, data)
+
+
+@router.delete(
+    "/{meeting_id}/artifacts/uploads/{upload_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Прервать составную загрузку",
+)
+async def abort_meeting_artifact_upload(
+    meeting_id: UUID,
+    upload_id: UUID,
+    service: MultipartUploadService = Depends(multipart_upload_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """Прервать загрузку и удалить загруженные части."""
+    await service.abort(meeting_id, upload_id)
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
 # Эндпоинты для фильтрации встреч
 
 @router.get(
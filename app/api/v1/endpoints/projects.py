@@ -16,6 +16,8 @@ from app.application.services.projects_service import (
 from app.domain.entities.projects.project import Project
 from app.domain.entities.projects.project_team import ProjectTeam
 from app.api.utils.auth import validate_curator
+from app.api.utils.pagination import PageParams, pagination_params
+from app.application.dto.pagination import Page
 
 
 router = APIRouter(
@@ -40,12 +42,13 @@ async def create_project(
     return await service.create(data)
 
 
-@router.get("/", response_model=List[Project], summary="Список всех проектов")
+@router.get("/", response_model=Page[Project], summary="Список всех проектов")
 async def list_projects(
+    page: PageParams = Depends(pagination_params),
     service: ProjectService = Depends(project_service_getter),
 ):
-    """Получить список всех проектов (с фильтрами можно расширить позже)."""
-    return await service.get_list()
+    """Получить страницу списка проектов (с фильтрами можно расширить позже)."""
+    return await service.get_page(page.limit, page.cursor)
 
 
 @router.get(
@@ -2,8 +2,12 @@ from uuid import UUID
 from typing import List
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
 from app.api.utils.auth import validate_curator
+from app.api.utils.pagination import PageParams, pagination_params
+from app.api.utils.responses import ModelResponse
+from app.application.dto.batch import BatchResult
+from app.application.dto.pagination import Page
 from app.application.dto.student import StudentCreate, StudentUpdate
 from app.application.services.students_service import (
     StudentService,
@@ -15,6 +19,7 @@ from app.application.services.team_member_service import (
     team_member_service_getter,
 )
 from app.domain.entities.teams.team_member import TeamMember
+from app.core.config import settings
 
 router = APIRouter(
     prefix="/students",
@@ -38,13 +43,29 @@ async def create_student(
     return await service.create(data)
 
 
-@router.get("/", response_model=List[Student], summary="Список всех студентов")
+@router.post(
+    "/batch",
+    response_model=BatchResult[Student],
+    status_code=status.HTTP_201_CREATED,
+    summary="Создать студентов пакетом",
+)
+async def create_students_batch(
+    data: List[StudentCreate] = Body(..., min_length=1, max_length=settings.batch.max_size),
+    service: StudentService = Depends(student_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """Создать список студентов одной транзакцией, результат по каждому элементу."""
+    return await service.create_batch(data)
+
+
+@router.get("/", response_model=Page[Student], summary="Список всех студентов")
 async def list_students(
+    page: PageParams = Depends(pagination_params),
     service: StudentService = Depends(student_service_getter),
     credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
 ):
-    """Получить список всех студентов."""
-    return await service.get_list()
+    """Получить страницу списка студентов (курсорная пагинация)."""
+    return ModelResponse(await service.get_page(page.limit, page.cursor))
 
 
 @router.get(
@@ -2,8 +2,12 @@ from uuid import UUID
 from typing import List
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi import APIRouter, Body, Depends, HTTPException, Response, status
 from app.api.utils.auth import validate_curator
+from app.api.utils.pagination import PageParams, pagination_params
+from app.api.utils.responses import ModelResponse
+from app.application.dto.batch import BatchResult
+from app.application.dto.pagination import Page
 from app.application.dto.project_team import ProjectTeamWithInfo
 from app.application.dto.team import TeamCreate, TeamUpdate
 from app.application.dto.team_member import TeamMemberCreate, TeamMemberUpdate
@@ -19,6 +23,7 @@ from app.application.services.team_service import TeamService, team_service_gett
 from app.domain.entities.projects.project_team import ProjectTeam
 from app.domain.entities.teams.team import Team
 from app.domain.entities.teams.team_member import TeamMember
+from app.core.config import settings
 
 router = APIRouter(
     prefix="/teams",
@@ -42,12 +47,13 @@ async def create_team(
     return await service.create(data)
 
 
-@router.get("/", response_model=List[Team], summary="Список всех команд")
+@router.get("/", response_model=Page[Team], summary="Список всех команд")
 async def list_teams(
+    page: PageParams = Depends(pagination_params),
     service: TeamService = Depends(team_service_getter),
 ):
-    """Получить список всех команд."""
-    return await service.get_list()
+    """Получить страницу списка команд (курсорная пагинация)."""
+    return ModelResponse(await service.get_page(page.limit, page.cursor))
 
 
 @router.get(
@@ -126,6 +132,22 @@ async def add_student_to_team(
     return await service.add_student_to_team(team_id, data)
 
 
+@router.post(
+    "/{team_id}/students/batch",
+    response_model=BatchResult[TeamMember],
+    status_code=status.HTTP_201_CREATED,
+    summary="Добавить студентов в команду пакетом",
+)
+async def add_students_to_team_batch(
+    team_id: UUID,
+    data: List[TeamMemberCreate] = Body(..., min_length=1, max_length=settings.batch.max_size),
+    service: TeamMemberService = Depends(team_member_service_getter),
+    credentials: tuple[uuid.UUID, str] = Depends(validate_curator)
+):
+    """Добавить список студентов в команду, для каждого вернуть created/already_exists/not_found."""
+    return await service.add_students_to_team_batch(team_id, data)
+
+
 @router.get(
     "/{team_id}/students",
     response_model=List[TeamMember],  # Используем доменную сущность
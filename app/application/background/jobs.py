@@ -0,0 +1,66 @@
+import logging
+from typing import Any
+from uuid import UUID
+
+from app.application.services.artifact_service import ArtifactService
+from app.application.services.meeting_service import MeetingService
+from app.core.database import db_helper
+from app.domain.events import ArtifactUploaded, MeetingCompleted
+from app.infrastructure.database.repositories.artifact_repository import ArtifactRepository
+from app.infrastructure.database.repositories.meeting_repository import MeetingRepository
+from app.infrastructure.database.repositories.meeting_task_repository import (
+    MeetingTaskRepository,
+)
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+from app.infrastructure.database.repositories.team_repository import TeamRepository
+from app.infrastructure.msBroker.broker import broker
+from app.infrastructure.msBroker.outbox import outbox_relay
+from app.infrastructure.s3_storage.s3_client import artifact_s3_client
+
+logger = logging.getLogger("jobs")
+
+CARRY_OVER_TASKS_JOB = "meetings.carry_over_tasks"
+STORE_ARTIFACT_JOB = "artifacts.store_upload"
+
+
+@broker.handler(CARRY_OVER_TASKS_JOB)
+async def carry_over_tasks(payload: dict[str, Any]) -> None:
+    """Перенос незавершенных задач после завершения встречи"""
+    meeting_id = UUID(payload["meeting_id"])
+    async with db_helper.async_session_factory() as session:
+        service = MeetingService(
+            MeetingRepository(session),
+            TaskRepository(session),
+            MeetingTaskRepository(session),
+            TeamRepository(session),
+        )
+        carried = await service.carry_over_tasks(meeting_id)
+    if carried:
+        logger.info(f"Carried over {carried} tasks from meeting {meeting_id}")
+
+
+def _artifact_service(session) -> ArtifactService:
+    return ArtifactService(
+        ArtifactRepository(session), MeetingRepository(session), artifact_s3_client
+    )
+
+
+@broker.handler(STORE_ARTIFACT_JOB, queue="artifacts")
+async def store_artifact(payload: dict[str, Any]) -> None:
+    """Хеш загруженного файла и перенос под ключ по содержимому"""
+    artifact_id = UUID(payload["artifact_id"])
+    async with db_helper.async_session_factory() as session:
+        await _artifact_service(session).store_upload(artifact_id)
+
+
+@broker.on_dead_letter(STORE_ARTIFACT_JOB)
+async def fail_artifact(payload: dict[str, Any]) -> None:
+    """Попытки обработки исчерпаны: артефакт не остается в PROCESSING"""
+    artifact_id = UUID(payload["artifact_id"])
+    async with db_helper.async_session_factory() as session:
+        await _artifact_service(session).fail_upload(artifact_id)
+    logger.warning(f"Artifact {artifact_id} processing failed")
+
+
+outbox_relay.forward(MeetingCompleted, CARRY_OVER_TASKS_JOB)
+outbox_relay.forward(ArtifactUploaded, STORE_ARTIFACT_JOB)
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+
+from app.application.services.artifact_service import ArtifactService
+from app.application.services.multipart_upload_service import MultipartUploadService
+from app.core.config import settings
+from app.core.database import db_helper
+from app.infrastructure.database.repositories.artifact_repository import ArtifactRepository
+from app.infrastructure.database.repositories.meeting_repository import MeetingRepository
+from app.infrastructure.database.repositories.multipart_upload_repository import (
+    MultipartUploadRepository,
+)
+from app.infrastructure.s3_storage.s3_client import artifact_s3_client
+
+logger = logging.getLogger("upload_cleanup")
+
+
+async def cleanup_stale_uploads() -> int:
+    """Прервать все зависшие составные загрузки, пачками по cleanup_batch_size"""
+    total = 0
+    while True:
+        async with db_helper.async_session_factory() as session:
+            meeting_repo = MeetingRepository(session)
+            service = MultipartUploadService(
+                MultipartUploadRepository(session),
+                ArtifactService(ArtifactRepository(session), meeting_repo, artifact_s3_client),
+                meeting_repo,
+                artifact_s3_client,
+            )
+            aborted = await service.abort_stale()
+        total += aborted
+        if aborted < settings.s3.multipart.cleanup_batch_size:
+            return total
+
+
+async def requeue_stale_artifacts() -> int:
+    """Заново поставить обработку всех зависших в PROCESSING артефактов"""
+    total = 0
+    while True:
+        async with db_helper.async_session_factory() as session:
+            service = ArtifactService(
+                ArtifactRepository(session), MeetingRepository(session), artifact_s3_client
+            )
+            requeued = await service.requeue_stale_uploads()
+        total += requeued
+        if requeued < settings.s3.artifact_requeue_batch_size:
+            return total
+
+
+async def run_upload_cleanup() -> None:
+    """
+    Периодическая очистка, запускается в lifespan приложения.
+    Несколько процессов не мешают друг другу: строки берутся с SKIP LOCKED.
+    """
+    while True:
+        try:
+            aborted = await cleanup_stale_uploads()
+            if aborted:
+                logger.info(f"Processed {aborted} stale multipart uploads")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Stale multipart upload cleanup failed")
+        try:
+            requeued = await requeue_stale_artifacts()
+            if requeued:
+                logger.info(f"Requeued processing of {requeued} stale artifacts")
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            logger.exception("Stale artifact requeue failed")
+        await asyncio.sleep(settings.s3.multipart.cleanup_interval)
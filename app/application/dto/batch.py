@@ -0,0 +1,20 @@
+from typing import Generic, Optional, TypeVar
+from pydantic import BaseModel
+
+from app.domain.enums.batch_item_status import BatchItemStatus
+
+T = TypeVar("T")
+
+
+class BatchItemResult(BaseModel, Generic[T]):
+    """DTO результата обработки одного элемента пакета"""
+    index: int
+    status: BatchItemStatus
+    item: Optional[T] = None
+    detail: Optional[str] = None
+
+
+class BatchResult(BaseModel, Generic[T]):
+    """DTO результата пакетной операции, элементы в порядке запроса"""
+    created: int
+    items: list[BatchItemResult[T]]
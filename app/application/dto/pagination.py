@@ -0,0 +1,10 @@
+from typing import Generic, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """DTO страницы списка с курсором на следующую страницу"""
+    items: list[T]
+    next_cursor: Optional[str] = None
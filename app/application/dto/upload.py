@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.domain.entities.custom_types import MediumText, NameField
+from app.domain.enums.artifact_type import ArtifactType
+from app.domain.enums.upload_status import UploadStatus
+
+
+class UploadUrlRequest(BaseModel):
+    """DTO запроса подписанной ссылки на загрузку"""
+    filename: str = Field(..., min_length=1, max_length=255, examples=["recording.mp4"])
+    content_type: str = Field(..., min_length=1, max_length=255, examples=["video/mp4"])
+    size: int = Field(..., gt=0, description="Размер файла в байтах")
+
+
+class PresignedUpload(BaseModel):
+    """
+    Подписанная форма загрузки: клиент отправляет multipart POST на url
+    со всеми fields и файлом в поле file, затем вызывает complete с key
+    """
+    key: str
+    url: str
+    fields: dict[str, str]
+    expires_at: datetime
+
+
+class UploadComplete(BaseModel):
+    """DTO подтверждения загрузки"""
+    key: str = Field(..., min_length=1, max_length=1024)
+
+
+class ArtifactDetails(BaseModel):
+    """DTO описания артефакта, создаваемого из загруженного файла"""
+    name: NameField = Field(..., examples=["Запись встречи"])
+    description: MediumText = Field(None, examples=["Описание артефакта"])
+    type: ArtifactType = ArtifactType.VIDEO
+
+
+class ArtifactUploadComplete(UploadComplete, ArtifactDetails):
+    """DTO подтверждения загрузки артефакта"""
+
+
+class ArtifactByHash(ArtifactDetails):
+    """
+    DTO привязки уже загруженного содержимого: клиент считает хеш файла
+    до загрузки и, если такой файл уже есть, не загружает его повторно
+    """
+    sha256: str = Field(..., pattern=r"^[0-9a-f]{64}$")
+    size: int = Field(..., gt=0, description="Размер файла в байтах")
+
+
+class MultipartUploadCreate(UploadUrlRequest):
+    """DTO начала составной загрузки"""
+
+
+class MultipartUploadComplete(ArtifactDetails):
+    """DTO завершения составной загрузки"""
+
+
+class UploadedPart(BaseModel):
+    """DTO загруженной части"""
+    part_number: int
+    size: int
+    etag: str
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MultipartUploadResponse(BaseModel):
+    """
+    Состояние составной загрузки. Клиент режет файл на part_count частей
+    по part_size байт (последняя меньше) и загружает их в любом порядке,
+    в том числе параллельно. После обрыва по parts видно, что догрузить.
+    """
+    id: UUID
+    meeting_id: UUID
+    filename: str
+    content_type: str
+    size: int
+    part_size: int
+    part_count: int
+    status: UploadStatus
+    artifact_id: Optional[UUID] = None
+    parts: List[UploadedPart] = []
+    created_at: datetime
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,367 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+from typing import List
+from botocore.exceptions import ClientError
+from fastapi import Depends, HTTPException, status
+
+from app.application.services.base_service import BaseService
+from app.application.dto.upload import (
+    ArtifactByHash,
+    ArtifactDetails,
+    ArtifactUploadComplete,
+    PresignedUpload,
+    UploadUrlRequest,
+)
+from app.core.config import settings
+from app.domain.entities.artifacts.artifact import Artifact
+from app.domain.enums.artifact_status import ArtifactStatus
+from app.domain.enums.artifact_type import ArtifactType
+from app.domain.events import ArtifactUploaded
+from app.infrastructure.database.models.artifacts.artifact import ArtifactModel
+from app.infrastructure.database.models.artifacts.artifact_blob import ArtifactBlobModel
+from app.infrastructure.database.repositories.artifact_repository import (
+    ArtifactRepository,
+    artifact_repository_getter,
+)
+from app.infrastructure.database.repositories.meeting_repository import (
+    MeetingRepository,
+    meeting_repository_getter,
+)
+from app.infrastructure.s3_storage.s3_client import (
+    S3Client,
+    artifact_s3_client_getter,
+    build_object_key,
+    content_key,
+)
+
+
+class ArtifactService(BaseService[ArtifactModel, Artifact]):
+    """
+    Артефакты встреч (записи, файлы).
+    Файлы загружаются клиентом напрямую в S3 по подписанной форме,
+    API только выдает форму и фиксирует загруженный объект.
+    У каждой загрузки свой артефакт (название, описание, тип), а одинаковое
+    содержимое хранится один раз под ключом по SHA-256 (artifact_blobs со
+    счетчиком ссылок) и удаляется вместе с последним артефактом.
+    Артефакт, зависший в PROCESSING дольше artifact_processing_timeout,
+    обрабатывается заново фоновой очисткой и может быть удален.
+    """
+
+    orm_model = ArtifactModel
+    pyd_scheme = Artifact
+
+    def __init__(
+        self,
+        artifact_repo: ArtifactRepository,
+        meeting_repo: MeetingRepository,
+        s3_client: S3Client,
+    ):
+        super().__init__(artifact_repo)
+        self._meeting_repo = meeting_repo
+        self.s3_client = s3_client
+
+    async def _ensure_meeting(self, meeting_id: UUID) -> None:
+        if not await self._meeting_repo.exists(meeting_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Встреча с ID {meeting_id} не найдена"
+            )
+
+    @staticmethod
+    def _meeting_prefix(meeting_id: UUID) -> str:
+        return f"meetings/{meeting_id}"
+
+    async def create_meeting_upload(
+        self, meeting_id: UUID, data: UploadUrlRequest
+    ) -> PresignedUpload:
+        """Выдать подписанную форму загрузки файла встречи"""
+        await self._ensure_meeting(meeting_id)
+        if data.size > settings.s3.artifact_max_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Файл больше {settings.s3.artifact_max_size} байт"
+            )
+        key = build_object_key(self._meeting_prefix(meeting_id), data.filename)
+        expires_in = settings.s3.presign_expires
+        form = self.s3_client.presign_post(
+            key, data.content_type, settings.s3.artifact_max_size, expires_in
+        )
+        return PresignedUpload(
+            key=key,
+            url=form["url"],
+            fields=form["fields"],
+            expires_at=datetime.now(tz=timezone.utc) + timedelta(seconds=expires_in),
+        )
+
+    async def complete_meeting_upload(
+        self, meeting_id: UUID, data: ArtifactUploadComplete
+    ) -> Artifact:
+        """Зафиксировать загруженный в S3 файл как артефакт встречи"""
+        if data.type == ArtifactType.LINK:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Ссылка не загружается как файл"
+            )
+        # Ключ выдается только через upload-url, чужие префиксы не принимаем
+        if not data.key.startswith(f"{self._meeting_prefix(meeting_id)}/"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Ключ объекта не относится к этой встрече"
+            )
+        await self._ensure_meeting(meeting_id)
+        head = await self.s3_client.head_object(data.key)
+        if head is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Файл не найден в хранилище, загрузка не завершена"
+            )
+        return await self.register_upload(
+            meeting_id, data.key, head.get("ContentLength"), head.get("ContentType"), data
+        )
+
+    async def register_upload(
+        self,
+        meeting_id: UUID,
+        staging_key: str,
+        size: int | None,
+        content_type: str | None,
+        details: ArtifactDetails,
+    ) -> Artifact:
+        """
+        Создать артефакт загруженного файла в статусе PROCESSING и привязать
+        к встрече. Хеш и перенос под ключ по содержимому делает фоновая
+        задача по событию ArtifactUploaded, через API байты файла не проходят.
+        """
+        async with self._uow:
+            artifact = await self._repo.create(ArtifactModel(
+                name=details.name,
+                description=details.description,
+                type=details.type,
+                url=f"s3://{self.s3_client.bucket}/{staging_key}",
+                status=ArtifactStatus.PROCESSING,
+                storage_key=staging_key,
+                size=size,
+                content_type=content_type,
+            ))
+            await self._repo.add_meeting_link(artifact.id, meeting_id)
+            self._outbox.add_events(ArtifactUploaded(artifact_id=artifact.id))
+        return self._to_schema(artifact)
+
+    async def store_upload(self, artifact_id: UUID) -> None:
+        """
+        Фоновая обработка загрузки: посчитать SHA-256, перенести файл под
+        ключ по содержимому и сделать артефакт READY. Блокировка содержимого
+        берется только на поиск и привязку, копирование в S3 идет вне
+        транзакции. Повторный запуск продолжает с шага, на котором упал.
+        """
+        async with self._uow:
+            artifact = await self._repo.get_by_id(artifact_id)
+        if artifact is None or artifact.status != ArtifactStatus.PROCESSING:
+            return
+        staging_key = artifact.storage_key
+        if artifact.blob_id is None:
+            try:
+                sha256 = await self.s3_client.sha256_object(staging_key)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchKey"):
+                    raise
+                # Загруженной копии нет: файл не дошел или его уже перенес
+                # параллельный запуск задачи, тогда статус уже не PROCESSING
+                await self.fail_upload(artifact_id)
+                return
+            blob = await self._reference_blob(artifact, sha256)
+        else:
+            async with self._uow:
+                blob = await self._repo.get_blob_by_id(artifact.blob_id)
+        if not blob.stored:
+            # Ссылка уже учтена, поэтому объект не удалят, пока идет копирование
+            await self.s3_client.copy_object(staging_key, blob.storage_key)
+            async with self._uow:
+                await self._repo.mark_blob_stored(blob.id)
+        await self.s3_client.delete_object(staging_key)
+        async with self._uow:
+            await self._repo.update(artifact, {
+                "status": ArtifactStatus.READY,
+                "storage_key": blob.storage_key,
+                "url": f"s3://{self.s3_client.bucket}/{blob.storage_key}",
+            })
+
+    async def fail_upload(self, artifact_id: UUID) -> None:
+        """Отметить обработку загрузки неудачной, вызывается и для задачи в dead letter"""
+        async with self._uow:
+            await self._repo.fail_processing(artifact_id)
+
+    async def requeue_stale_uploads(self) -> int:
+        """
+        Заново поставить обработку артефактов, зависших в PROCESSING: задача
+        потеряна при перезапуске или еще не доставлена. Событие пишется в
+        outbox вместе с updated_at, так что следующий проход повторит задачу
+        не раньше, чем через artifact_processing_timeout.
+        Возвращает число артефактов (не больше artifact_requeue_batch_size).
+        """
+        config = settings.s3
+        cutoff = datetime.now(tz=timezone.utc) - timedelta(
+            seconds=config.artifact_processing_timeout
+        )
+        async with self._uow:
+            artifacts = await self._repo.get_stale_processing_locked(
+                cutoff, config.artifact_requeue_batch_size
+            )
+            await self._repo.touch([artifact.id for artifact in artifacts])
+            self._outbox.add_events(*(
+                ArtifactUploaded(artifact_id=artifact.id) for artifact in artifacts
+            ))
+        return len(artifacts)
+
+    async def _reference_blob(self, artifact: ArtifactModel, sha256: str) -> ArtifactBlobModel:
+        """Найти или создать содержимое и учесть ссылку артефакта на него"""
+        async with self._uow:
+            await self._repo.lock_content(sha256)
+            blob = await self._repo.get_blob(sha256)
+            if blob is None:
+                blob = await self._repo.create_blob(ArtifactBlobModel(
+                    sha256=sha256,
+                    storage_key=content_key(sha256),
+                    size=artifact.size,
+                    content_type=artifact.content_type,
+                    ref_count=0,
+                    stored=False,
+                ))
+            if await self._repo.attach_blob(artifact.id, blob):
+                await self._repo.add_blob_refs(blob.id, 1)
+        return blob
+
+    async def link_meeting_content(self, meeting_id: UUID, data: ArtifactByHash) -> Artifact:
+        """
+        Создать артефакт встречи на уже хранящийся файл без повторной загрузки.
+        Название, описание и тип берутся из запроса, содержимое общее
+        """
+        if data.type == ArtifactType.LINK:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Ссылка не загружается как файл"
+            )
+        await self._ensure_meeting(meeting_id)
+        async with self._uow:
+            await self._repo.lock_content(data.sha256)
+            blob = await self._repo.get_blob(data.sha256)
+            if blob is None or not blob.stored or blob.size != data.size:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Файл с таким хешем не найден, его нужно загрузить"
+                )
+            artifact = await self._repo.create(ArtifactModel(
+                name=data.name,
+                description=data.description,
+                type=data.type,
+                url=f"s3://{self.s3_client.bucket}/{blob.storage_key}",
+                status=ArtifactStatus.READY,
+                blob_id=blob.id,
+                storage_key=blob.storage_key,
+                size=blob.size,
+                content_type=blob.content_type,
+                sha256=blob.sha256,
+            ))
+            await self._repo.add_blob_refs(blob.id, 1)
+            await self._repo.add_meeting_link(artifact.id, meeting_id)
+        return self._to_schema(artifact)
+
+    async def remove_meeting_artifact(self, meeting_id: UUID, artifact_id: UUID) -> None:
+        """
+        Отвязать артефакт от встречи; без оставшихся связей он удаляется,
+        а файл удаляется вместе с последним артефактом на это содержимое.
+        Объекты S3 удаляются только после коммита
+        """
+        staging_key = None
+        released_blob = None
+        stale_before = datetime.now(tz=timezone.utc) - timedelta(
+            seconds=settings.s3.artifact_processing_timeout
+        )
+        async with self._uow:
+            artifact = await self._repo.get_by_id(artifact_id)
+            if artifact is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Артефакт с ID {artifact_id} не найден"
+                )
+            link = await self._repo.get_meeting_link(artifact_id, meeting_id)
+            if link is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Артефакт не привязан к этой встрече"
+                )
+            if (
+                artifact.status == ArtifactStatus.PROCESSING
+                and artifact.created_at > stale_before
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail="Файл еще обрабатывается, удалить его можно после обработки"
+                )
+            await self._repo.delete_link(link.id)
+            if await self._repo.count_links(artifact_id) > 0:
+                return
+            await self._repo.delete_by_id(artifact_id)
+            if artifact.status != ArtifactStatus.READY:
+                # Файл не дошел до хранилища по хешу, осталась загруженная копия
+                staging_key = artifact.storage_key
+            if artifact.blob_id is not None:
+                await self._repo.lock_content(artifact.sha256)
+                if await self._repo.add_blob_refs(artifact.blob_id, -1) == 0:
+                    blob = await self._repo.get_blob_by_id(artifact.blob_id)
+                    released_blob = (blob.sha256, blob.storage_key)
+                    await self._repo.delete_blob(blob.id)
+        if staging_key is not None:
+            await self.s3_client.delete_object(staging_key)
+        if released_blob is not None:
+            await self._delete_content(*released_blob)
+
+    async def _delete_content(self, sha256: str, storage_key: str) -> None:
+        """
+        Удалить объект содержимого, строка которого удалена закоммиченной
+        транзакцией. Под блокировкой содержимого: если тот же файл успели
+        загрузить снова, содержимое создано заново и объект не трогается
+        """
+        async with self._uow:
+            await self._repo.lock_content(sha256)
+            if await self._repo.get_blob(sha256) is None:
+                await self.s3_client.delete_object(storage_key)
+
+    async def get_meeting_file(self, meeting_id: UUID, artifact_id: UUID) -> tuple[Artifact, str]:
+        """
+        Артефакт встречи и ключ его файла в бакете. Транзакция закрывается
+        до ответа: пока файл передается потоком, соединение с БД уже в пуле
+        """
+        async with self._uow:
+            artifact = await self._repo.get_by_id(artifact_id)
+            link = await self._repo.get_meeting_link(artifact_id, meeting_id)
+        if artifact is None or link is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Артефакт с ID {artifact_id} не найден у встречи"
+            )
+        if artifact.storage_key is None or artifact.status == ArtifactStatus.FAILED:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="У артефакта нет файла в хранилище"
+            )
+        if artifact.status == ArtifactStatus.PROCESSING:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Файл еще обрабатывается"
+            )
+        return self._to_schema(artifact), artifact.storage_key
+
+    async def get_meeting_artifacts(self, meeting_id: UUID) -> List[Artifact]:
+        """Получить артефакты встречи"""
+        await self._ensure_meeting(meeting_id)
+        artifacts = await self._repo.get_by_meeting_id(meeting_id)
+        return self._to_schemas(artifacts)
+
+
+def artifact_service_getter(
+    artifact_repo: ArtifactRepository = Depends(artifact_repository_getter),
+    meeting_repo: MeetingRepository = Depends(meeting_repository_getter),
+    s3_client: S3Client = Depends(artifact_s3_client_getter),
+) -> ArtifactService:
+    return ArtifactService(artifact_repo, meeting_repo, s3_client)
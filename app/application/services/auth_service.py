@@ -1,27 +1,25 @@
 from fastapi import Depends, HTTPException
 import jwt
 import uuid
-from passlib.context import CryptContext
 from app.core.config import settings
 from datetime import datetime, timedelta, timezone
 from app.application.services.base_service import BaseService
 from app.domain.entities.auth_tokens.auth_token import AuthToken
 from app.infrastructure.database.models import RefreshTokenModel
+from app.infrastructure.security.password_hasher import password_hasher
 from app.infrastructure.database.repositories.token_repository import (
     TokenRepository,
     token_repository_getter,
 )
 import hashlib
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 class AuthService(BaseService[RefreshTokenModel, AuthToken]):
     orm_model = RefreshTokenModel
     pyd_scheme = AuthToken
 
     def __init__(self, token_repo: TokenRepository):
-        self._repo = token_repo
+        super().__init__(token_repo)
 
     async def create_token_pair(
         self, user_id: uuid.UUID,
@@ -29,7 +27,8 @@ class AuthService(BaseService[RefreshTokenModel, AuthToken]):
         access = self._create_access_token(user_id)
         refresh = self._create_refresh_token(user_id)
         orm_refresh = self._to_orm(refresh)
-        await self._repo.create(orm_refresh)
+        async with self._uow:
+            await self._repo.create(orm_refresh)
         return access, refresh
 
     async def revoke_token_pair(
@@ -40,11 +39,14 @@ class AuthService(BaseService[RefreshTokenModel, AuthToken]):
         existing_token = await self._repo.get_by_token_hash(hashed_token)
         if not existing_token:
             raise ValueError
-        await self._repo.update(existing_token, {"is_revoked": True})
+        async with self._uow:
+            await self._repo.update(existing_token, {"is_revoked": True})
 
     async def refresh_token_pair(self, refresh_token: str, curator_id: uuid.UUID) -> tuple[AuthToken, AuthToken]:
-        await self.revoke_token_pair(refresh_token)
-        token_pair = await self.create_token_pair(curator_id)
+        # Отзыв старой пары и выпуск новой - одна транзакция
+        async with self._uow:
+            await self.revoke_token_pair(refresh_token)
+            token_pair = await self.create_token_pair(curator_id)
         return token_pair
 
     def _to_orm(self, pyd_scheme: AuthToken) -> RefreshTokenModel:
@@ -60,8 +62,8 @@ class AuthService(BaseService[RefreshTokenModel, AuthToken]):
         return hashlib.sha256(string_.encode("utf-8")).hexdigest()
 
     @staticmethod
-    def get_hashed_pass(string_: str) -> str:
-        return pwd_context.hash(string_)
+    async def get_hashed_pass(string_: str) -> str:
+        return await password_hasher.hash(string_)
 
     @staticmethod
     def _create_access_token(curator_id: uuid.UUID) -> AuthToken:
@@ -100,12 +102,18 @@ class AuthService(BaseService[RefreshTokenModel, AuthToken]):
         )
 
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        return await password_hasher.verify(plain_password, hashed_password)
 
     @staticmethod
     def get_curator_id_from_access(token: str) -> uuid.UUID:
         """Метод для обработки входящего токена авторизации в заголовках"""
+        curator_id, _, _ = AuthService.get_access_claims(token)
+        return curator_id
+
+    @staticmethod
+    def get_access_claims(token: str) -> tuple[uuid.UUID, str, int]:
+        """Id куратора, jti и время истечения (unix time) из access-токена"""
         try:
             payload = jwt.decode(
                 token,
@@ -118,7 +126,7 @@ class AuthService(BaseService[RefreshTokenModel, AuthToken]):
                 raise HTTPException(
                     status_code=401, detail="Could not validate credentials"
                 )
-            return curator_id
+            return uuid.UUID(curator_id), payload.get("jti", ""), payload["exp"]
         except Exception as e:
             print(e)
             raise HTTPException(status_code=401, detail="Invalid authorization token")
@@ -1,9 +1,13 @@
-from typing import Generic, TypeVar
+from functools import cache
+from typing import Any, Generic, Iterable, Mapping, Sequence, TypeVar
 from app.infrastructure.database.repositories.base_repository import (
     BaseRepository,
 )
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
+from app.application.dto.pagination import Page
 from app.infrastructure.database.entity_base import BaseEntity
+from app.infrastructure.database.repositories.outbox_repository import OutboxRepository
+from app.infrastructure.database.unit_of_work import UnitOfWork
 from uuid import UUID
 
 
@@ -11,6 +15,12 @@ TModel = TypeVar("TModel", bound=BaseEntity)
 P_OUT = TypeVar("P_OUT", bound=BaseModel)
 
 
+@cache
+def _list_adapter(scheme: type[P_OUT]) -> TypeAdapter[list[P_OUT]]:
+    """Валидатор списка схем, строится один раз на схему"""
+    return TypeAdapter(list[scheme])
+
+
 class BaseService(Generic[TModel, P_OUT]):
     orm_model: type[TModel]
     pyd_scheme: type[P_OUT]
@@ -20,6 +30,9 @@ class BaseService(Generic[TModel, P_OUT]):
         base_repo: BaseRepository[TModel],
     ):
         self._repo = base_repo
+        self._uow = UnitOfWork(base_repo.session)
+        # События пишутся в ту же транзакцию, что и изменения сервиса
+        self._outbox = OutboxRepository(base_repo.session)
 
     def _to_orm(self, scheme) -> TModel:
         return self.orm_model(**scheme.model_dump(exclude_unset=True))
@@ -27,16 +40,43 @@ class BaseService(Generic[TModel, P_OUT]):
     def _to_schema(self, orm_model: TModel) -> P_OUT:
         return self.pyd_scheme.model_validate(orm_model, from_attributes=True)
 
+    def _to_schemas(self, orm_models: Sequence[TModel]) -> list[P_OUT]:
+        """
+        Список схем одним вызовом валидатора. Загруженные атрибуты строки
+        берутся из __dict__ без дескрипторов SQLAlchemy; строка с
+        незагруженными полями схемы читается через атрибуты, как в _to_schema
+        """
+        fields = self.pyd_scheme.model_fields.keys()
+        rows = [
+            item.__dict__ if fields <= item.__dict__.keys() else item
+            for item in orm_models
+        ]
+        return _list_adapter(self.pyd_scheme).validate_python(rows, from_attributes=True)
+
+    def _schema_fields(self) -> Iterable[str]:
+        """Поля схемы: колонки для чтения строками без ORM-объектов"""
+        return self.pyd_scheme.model_fields.keys()
+
+    def _rows_to_schemas(self, rows: Sequence[Mapping[str, Any]]) -> list[P_OUT]:
+        """Список схем из строк запроса колонок _schema_fields"""
+        return _list_adapter(self.pyd_scheme).validate_python(rows)
+
     async def delete(self, obj_id: UUID) -> bool:
-        obj = await self._repo.get_by_id(obj_id)
-        if not obj:
-            return False
-        await self._repo.delete(obj)
-        return True
+        async with self._uow:
+            return await self._repo.delete_by_id(obj_id)
 
     async def get_list(self, **filter_attrs) -> list[P_OUT]:
         items = await self._repo.get_list(**filter_attrs)
-        return [self._to_schema(item) for item in items]
+        return self._to_schemas(items)
+
+    async def get_page(
+        self, limit: int, cursor: str | None = None, **filter_attrs
+    ) -> Page[P_OUT]:
+        items, next_cursor = await self._repo.get_page(limit, cursor, **filter_attrs)
+        return Page[self.pyd_scheme](
+            items=self._to_schemas(items),
+            next_cursor=next_cursor,
+        )
 
     async def get_by_id(self, obj_id: UUID) -> P_OUT | None:
         obj = await self._repo.get_by_id(obj_id)
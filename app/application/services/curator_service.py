@@ -1,11 +1,14 @@
-from fastapi import Depends, UploadFile
+from datetime import datetime, timedelta, timezone
+from fastapi import Depends, HTTPException, UploadFile, status
 from app.application.dto.curator import (
     CuratorPOST,
     CuratorPATCH,
     CuratorPostBase,
 )
+from app.application.dto.upload import PresignedUpload, UploadComplete, UploadUrlRequest
 from app.application.services.auth_service import AuthService, auth_service_getter
 from app.core.config import settings
+from app.infrastructure.cache.principal_cache import principal_cache
 from app.infrastructure.database.models import CuratorModel
 from app.domain.entities.persons.curator import Curator
 from app.application.services.base_service import BaseService
@@ -14,7 +17,11 @@ from app.infrastructure.database.repositories.curator_repository import (
     CuratorRepository,
     curator_repository_getter,
 )
-from app.infrastructure.s3_storage.s3_client import S3Client
+from app.infrastructure.s3_storage.s3_client import (
+    S3Client,
+    build_object_key,
+    curator_s3_client_getter,
+)
 from uuid import UUID
 from sqlalchemy.exc import IntegrityError
 
@@ -32,12 +39,11 @@ class CuratorService(BaseService[CuratorModel, Curator]):
         self,
         curator_repo: CuratorRepository,
         auth_service: AuthService,
+        s3_client: S3Client,
     ):
         super().__init__(curator_repo)
         self.auth_service = auth_service
-        self.s3_client = S3Client(
-            settings.s3.curator_bucket.name, settings.s3.curator_bucket.policy,
-        )
+        self.s3_client = s3_client
 
     def _to_orm(self, scheme_: CuratorPOST) -> CuratorModel:
         return CuratorModel(
@@ -57,36 +63,39 @@ class CuratorService(BaseService[CuratorModel, Curator]):
 
     async def _create(self, new_obj: CuratorPOST) -> CuratorModel:
         orm_model = self._to_orm(new_obj)
-        created_obj = await self._repo.create(orm_model)
+        async with self._uow:
+            created_obj = await self._repo.create(orm_model)
         return created_obj
 
     async def update(self, new_data: CuratorPATCH, curator_id: UUID) -> Curator | None:
-        old_obj = await self._repo.get_by_id(curator_id)
-        if not old_obj:
+        async with self._uow:
+            updated_obj = await self._repo.update_by_id(
+                curator_id, new_data.model_dump(exclude_unset=True)
+            )
+        if not updated_obj:
             return None
-        updated_obj = await self._repo.update(
-            old_obj, new_data.model_dump(exclude_unset=True)
-        )
         return self._to_schema(updated_obj)
 
     async def register_curator(
         self, curator_data: CuratorPOST
     ) -> tuple[AuthToken, AuthToken] | None:
-        hashed_pass = self.auth_service.get_hashed_pass(curator_data.password)
+        hashed_pass = await self.auth_service.get_hashed_pass(curator_data.password)
         curator_data.password = hashed_pass
+        # Куратор и его refresh-токен сохраняются одним коммитом
         try:
-            created_obj = await self._create(curator_data)
-            auth_tokens = await self.auth_service.create_token_pair(created_obj.id)
-            return auth_tokens
+            async with self._uow:
+                created_obj = await self._create(curator_data)
+                auth_tokens = await self.auth_service.create_token_pair(created_obj.id)
         except IntegrityError:
             return None
+        return auth_tokens
 
     async def login_curator(
         self,
         curator_data: CuratorPostBase,
         existing_curator: CuratorModel,
     ) -> tuple[AuthToken, AuthToken] | None:
-        is_password_correct = self.auth_service.verify_password(
+        is_password_correct = await self.auth_service.verify_password(
             curator_data.password, existing_curator.hashed_password
         )
         if not is_password_correct:
@@ -94,8 +103,12 @@ class CuratorService(BaseService[CuratorModel, Curator]):
         auth_tokens = await self.auth_service.create_token_pair(existing_curator.id)
         return auth_tokens
 
-    async def logout_curator(self, refresh_token: str) -> None:
+    async def logout_curator(self, refresh_token: str, access_token: str) -> None:
         await self.auth_service.revoke_token_pair(refresh_token)
+        # Access-токен живет до exp, поэтому отзываем его в кеше принципалов
+        curator_id, jti, expires_at = self.auth_service.get_access_claims(access_token)
+        if jti:
+            await principal_cache.revoke(curator_id, jti, expires_at)
 
     async def upload_avatar(
         self,
@@ -105,18 +118,83 @@ class CuratorService(BaseService[CuratorModel, Curator]):
         avatar_file_path = build_avatar_path(
             curator_id, file.filename if file.filename else "default.jpg"
         )
-        self.s3_client.put_object(avatar_file_path, file)
+        await self.s3_client.put_object(avatar_file_path, file)
         data_to_update = CuratorPATCH(
             avatar_s3_path=f"{settings.s3.public_host}/{settings.s3.curator_bucket.name}{avatar_file_path}")
         return await self.update(data_to_update, curator_id)
 
+    async def create_avatar_upload(
+        self, curator_id: UUID, data: UploadUrlRequest
+    ) -> PresignedUpload:
+        """Подписанная форма для загрузки аватара напрямую в S3"""
+        if not data.content_type.startswith("image/"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Аватар должен быть изображением"
+            )
+        if data.size > settings.s3.avatar_max_size:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File too large")
+        key = build_object_key(avatar_prefix(curator_id), data.filename)
+        expires_in = settings.s3.presign_expires
+        form = self.s3_client.presign_post(
+            key, data.content_type, settings.s3.avatar_max_size, expires_in
+        )
+        return PresignedUpload(
+            key=key,
+            url=form["url"],
+            fields=form["fields"],
+            expires_at=datetime.now(tz=timezone.utc) + timedelta(seconds=expires_in),
+        )
+
+    async def complete_avatar_upload(
+        self, curator_id: UUID, data: UploadComplete
+    ) -> Curator | None:
+        """Проверить, что аватар загружен в S3, и сохранить ссылку на него"""
+        if not data.key.startswith(f"{avatar_prefix(curator_id)}/"):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Ключ объекта не относится к этому куратору"
+            )
+        if await self.s3_client.head_object(data.key) is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Файл не найден в хранилище, загрузка не завершена"
+            )
+        data_to_update = CuratorPATCH(avatar_s3_path=self.s3_client.public_url(data.key))
+        return await self.update(data_to_update, curator_id)
+
+    async def get_avatar_key(self, curator_id: UUID) -> str:
+        """Ключ объекта аватара в бакете кураторов"""
+        # Транзакция закрывается до ответа: пока аватар передается потоком,
+        # соединение с БД уже возвращено в пул
+        async with self._uow:
+            curator = await self._repo.get_by_id(curator_id)
+        if curator is None or not curator.avatar_s3_path:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Аватар не найден"
+            )
+        # Ключ - путь публичной ссылки внутри бакета, так хранятся и старые аватары
+        prefix = self.s3_client.public_url("")
+        if not curator.avatar_s3_path.startswith(prefix):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Аватар хранится вне бакета кураторов"
+            )
+        return curator.avatar_s3_path[len(prefix):]
+
 
 def curator_service_getter(
     curator_repository: CuratorRepository = Depends(curator_repository_getter),
     auth_service: AuthService = Depends(auth_service_getter),
+    s3_client: S3Client = Depends(curator_s3_client_getter),
 ) -> CuratorService:
-    return CuratorService(curator_repository, auth_service)
+    return CuratorService(curator_repository, auth_service, s3_client)
 
 
 def build_avatar_path(curator_id: UUID, file_name: str) -> str:
     return f"/avatars/{curator_id}/{file_name}"
+
+
+def avatar_prefix(curator_id: UUID) -> str:
+    return f"avatars/{curator_id}"
@@ -1,15 +1,15 @@
 from uuid import UUID
 from datetime import datetime
 from fastapi import Depends, HTTPException, status
-from typing import List, Optional
-from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from typing import AsyncIterator, List, Optional
 
 from app.application.services.base_service import BaseService
 from app.application.dto.meeting import MeetingCreate, MeetingUpdate, MeetingResponse
 from app.application.dto.task import TaskResponse
+from app.application.dto.pagination import Page
 from app.domain.entities.meetings.meetings import Meeting
 from app.infrastructure.database.models.meetings.meeting import MeetingModel
+from app.infrastructure.database.models.meetings.meeting_task import MeetingTaskModel
 from app.infrastructure.database.repositories.meeting_repository import (
     MeetingRepository,
     meeting_repository_getter,
@@ -27,6 +27,13 @@ from app.infrastructure.database.repositories.team_repository import (
     team_repository_getter,
 )
 from app.domain.enums.meeting_status import MeetingStatus
+from app.domain.events import MeetingCanceled, MeetingCompleted, TaskCarriedOver
+
+# События смены статуса встречи, общие для отдельных ручек и PATCH
+_STATUS_EVENTS = {
+    MeetingStatus.COMPLETED: MeetingCompleted,
+    MeetingStatus.CANCELED: MeetingCanceled,
+}
 
 
 class MeetingService(BaseService[MeetingModel, MeetingResponse]):
@@ -61,6 +68,7 @@ class MeetingService(BaseService[MeetingModel, MeetingResponse]):
         await self._validate_team_exists(data.team_id)
 
         # Если указана предыдущая встреча, проверяем ее существование
+        previous_meeting = None
         if data.previous_meeting_id:
             previous_meeting = await self._meeting_repo.get_by_id(data.previous_meeting_id)
             if not previous_meeting:
@@ -74,18 +82,15 @@ class MeetingService(BaseService[MeetingModel, MeetingResponse]):
                     detail="Предыдущая встреча должна принадлежать той же команде"
                 )
 
-        # Создаем встречу
+        # Создаем встречу и обновляем связь у предыдущей одной транзакцией
         meeting_data = data.model_dump(exclude_unset=True)
         orm_obj = MeetingModel(**meeting_data)
-        created_obj = await self._repo.create(orm_obj)
-        
-        # Обновляем связь следующей встречи у предыдущей
-        if data.previous_meeting_id:
-            previous_meeting = await self._meeting_repo.get_by_id(data.previous_meeting_id)
+        async with self._uow:
+            created_obj = await self._repo.create(orm_obj)
+
             if previous_meeting:
-                # Используем update метод репозитория для обновления
                 await self._meeting_repo.update(
-                    previous_meeting, 
+                    previous_meeting,
                     {"next_meeting_id": created_obj.id}
                 )
 
@@ -105,16 +110,32 @@ class MeetingService(BaseService[MeetingModel, MeetingResponse]):
         meetings = await self._meeting_repo.get_by_team_id(
             team_id, status, from_date, to_date
         )
-        return [self._to_schema(meeting) for meeting in meetings]
+        return self._to_schemas(meetings)
     
-    async def get_all_meetings(self) -> List[MeetingResponse]:
-        meetings = await self._meeting_repo.get_all_ordered_by_date()
-        return [self._to_schema(meeting) for meeting in meetings]
+    async def get_all_meetings(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> Page[MeetingResponse]:
+        meetings, next_cursor = await self._meeting_repo.get_all_rows_ordered_by_date(
+            self._schema_fields(), limit, cursor
+        )
+        return Page[MeetingResponse](
+            items=self._rows_to_schemas(meetings),
+            next_cursor=next_cursor,
+        )
+
+    async def stream_all_meetings(
+        self, batch_size: int
+    ) -> AsyncIterator[list[MeetingResponse]]:
+        """Все встречи всех команд по времени, пачками по batch_size"""
+        batches = self._meeting_repo.stream_all_rows_ordered_by_date(
+            self._schema_fields(), batch_size
+        )
+        async for rows in batches:
+            yield self._rows_to_schemas(rows)
 
     async def complete_meeting(self, meeting_id: UUID) -> MeetingResponse:
-        """Завершить встречу и перенести незавершенные задачи"""
-        # Получаем встречу с задачами
-        meeting = await self._meeting_repo.get_meeting_with_tasks(meeting_id)
+        """Завершить встречу, незавершенные задачи переносятся в фоне"""
+        meeting = await self._meeting_repo.get_by_id(meeting_id)
         if not meeting:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -127,38 +148,50 @@ class MeetingService(BaseService[MeetingModel, MeetingResponse]):
                 detail="Встреча уже завершена"
             )
 
-        # Находим следующую запланированную встречу для этой команды
-        next_meeting = await self._meeting_repo.get_upcoming_meeting(UUID(str(meeting.team_id)))
-        
-        # Если есть следующая встреча, переносим незавершенные задачи
-        if next_meeting:
-            # Получаем задачи текущей встречи
-            from app.infrastructure.database.models.meetings.meeting_task import MeetingTaskModel
-            
-            query = (
-                select(MeetingTaskModel)
-                .where(MeetingTaskModel.meeting_id == meeting_id)
-                .options(selectinload(MeetingTaskModel.task))
+        async with self._uow:
+            await self._meeting_repo.update(meeting, {"status": MeetingStatus.COMPLETED})
+            # Перенос задач запускается по событию (application/background/jobs.py)
+            self._outbox.add_events(
+                MeetingCompleted(meeting_id=meeting.id, team_id=meeting.team_id)
             )
-            result = await self._meeting_repo.session.execute(query)
-            meeting_tasks = result.scalars().all()
-            
-            # Переносим незавершенные задачи
-            for meeting_task in meeting_tasks:
-                if not meeting_task.task.is_completed:
-                    # Создаем новую связь для следующей встречи
-                    new_meeting_task = MeetingTaskModel(
-                        meeting_id=next_meeting.id,
-                        task_id=meeting_task.task.id
-                    )
-                    await self._meeting_task_repo.create(new_meeting_task)
+        return self._to_schema(meeting)
 
-        # Обновляем статус встречи
-        meeting.status = MeetingStatus.COMPLETED
-        await self._meeting_repo.session.commit()
-        await self._meeting_repo.session.refresh(meeting)
+    async def carry_over_tasks(self, meeting_id: UUID) -> int:
+        """
+        Перенести незавершенные задачи завершенной встречи на следующую
+        запланированную встречу команды. Уже перенесенные задачи пропускаются,
+        поэтому повтор задачи очереди не создает дублей.
+        Возвращает число перенесенных задач.
+        """
+        async with self._uow:
+            meeting = await self._meeting_repo.get_by_id(meeting_id)
+            if meeting is None or meeting.status != MeetingStatus.COMPLETED:
+                return 0
+            next_meeting = await self._meeting_repo.get_upcoming_meeting(meeting.team_id)
+            if next_meeting is None:
+                return 0
 
-        return self._to_schema(meeting)
+            tasks = await self._task_repo.get_by_meeting_id(meeting_id)
+            carried_ids = {
+                link.task_id
+                for link in await self._meeting_task_repo.get_by_meeting_id(next_meeting.id)
+            }
+            # Все связи уходят одним flush при коммите
+            carried = [
+                task for task in tasks
+                if not task.is_completed and task.id not in carried_ids
+            ]
+            self._meeting_task_repo.session.add_all(
+                MeetingTaskModel(meeting_id=next_meeting.id, task_id=task.id)
+                for task in carried
+            )
+            self._outbox.add_events(*(
+                TaskCarriedOver(
+                    task_id=task.id, from_meeting_id=meeting_id, to_meeting_id=next_meeting.id
+                )
+                for task in carried
+            ))
+        return len(carried)
 
     async def cancel_meeting(self, meeting_id: UUID) -> MeetingResponse:
         """Отменить встречу"""
@@ -175,9 +208,11 @@ class MeetingService(BaseService[MeetingModel, MeetingResponse]):
                 detail="Нельзя отменить завершенную встречу"
             )
 
-        meeting.status = MeetingStatus.CANCELED
-        await self._meeting_repo.session.commit()
-        await self._meeting_repo.session.refresh(meeting)
+        async with self._uow:
+            await self._meeting_repo.update(meeting, {"status": MeetingStatus.CANCELED})
+            self._outbox.add_events(
+                MeetingCanceled(meeting_id=meeting.id, team_id=meeting.team_id)
+            )
 
         return self._to_schema(meeting)
 
@@ -208,15 +243,34 @@ class MeetingService(BaseService[MeetingModel, MeetingResponse]):
         self, new_data: MeetingUpdate, meeting_id: UUID
     ) -> MeetingResponse | None:
         """Обновить встречу"""
-        old_obj = await self._meeting_repo.get_by_id(meeting_id)
-        if not old_obj:
+        update_data = new_data.model_dump(exclude_unset=True)
+        new_status = update_data.get("status")
+        async with self._uow:
+            previous_status = None
+            if new_status is not None:
+                # Прежний статус под блокировкой: событие перехода публикуется один раз
+                meeting = await self._meeting_repo.get_for_update(meeting_id)
+                if meeting is not None:
+                    previous_status = meeting.status
+                if (
+                    previous_status == MeetingStatus.COMPLETED
+                    and new_status == MeetingStatus.CANCELED
+                ):
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail="Нельзя отменить завершенную встречу"
+                    )
+            updated_obj = await self._repo.update_by_id(meeting_id, update_data)
+            event_type = _STATUS_EVENTS.get(new_status)
+            if updated_obj and event_type and previous_status != new_status:
+                self._outbox.add_events(
+                    event_type(meeting_id=updated_obj.id, team_id=updated_obj.team_id)
+                )
+        if not updated_obj:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Встреча с ID {meeting_id} не найдена"
             )
-
-        update_data = new_data.model_dump(exclude_unset=True)
-        updated_obj = await self._repo.update(old_obj, update_data)
         return self._to_schema(updated_obj)
 
 
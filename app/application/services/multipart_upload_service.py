@@ -0,0 +1,336 @@
+import base64
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+from tempfile import SpooledTemporaryFile
+from typing import AsyncIterator, Sequence
+from uuid import UUID
+from botocore.exceptions import BotoCoreError, ClientError
+from fastapi import Depends, HTTPException, status
+
+from app.application.services.artifact_service import (
+    ArtifactService,
+    artifact_service_getter,
+)
+from app.application.services.base_service import BaseService
+from app.application.dto.upload import (
+    MultipartUploadComplete,
+    MultipartUploadCreate,
+    MultipartUploadResponse,
+    UploadedPart,
+)
+from app.core.config import settings
+from app.domain.entities.artifacts.artifact import Artifact
+from app.domain.enums.artifact_type import ArtifactType
+from app.domain.enums.upload_status import UploadStatus
+from app.infrastructure.database.models.artifacts.multipart_upload import MultipartUploadModel
+from app.infrastructure.database.models.artifacts.multipart_upload_part import (
+    MultipartUploadPartModel,
+)
+from app.infrastructure.database.repositories.meeting_repository import (
+    MeetingRepository,
+    meeting_repository_getter,
+)
+from app.infrastructure.database.repositories.multipart_upload_repository import (
+    MultipartUploadRepository,
+    multipart_upload_repository_getter,
+)
+from app.infrastructure.s3_storage.s3_client import (
+    S3Client,
+    artifact_s3_client_getter,
+    build_object_key,
+)
+
+logger = logging.getLogger("multipart_upload")
+
+# Ограничение S3 на число частей одной загрузки
+MAX_PARTS = 10_000
+_MIB = 1024 * 1024
+
+
+def choose_part_size(size: int) -> int:
+    """Размер части из настроек, увеличенный так, чтобы частей было не больше MAX_PARTS"""
+    min_part_size = -(-size // MAX_PARTS)
+    part_size = max(settings.s3.multipart.part_size, min_part_size)
+    return -(-part_size // _MIB) * _MIB
+
+
+class MultipartUploadService(BaseService[MultipartUploadModel, MultipartUploadResponse]):
+    """
+    Составная загрузка больших файлов встречи (записей) в S3.
+    Состояние хранится в Postgres: какие части загружены и с каким ETag,
+    поэтому после обрыва клиент догружает только недостающие части.
+    Часть проходит через API потоком во временный файл, в памяти держится
+    не больше spool_max_memory байт на запрос независимо от размера файла.
+    """
+
+    orm_model = MultipartUploadModel
+    pyd_scheme = MultipartUploadResponse
+
+    def __init__(
+        self,
+        upload_repo: MultipartUploadRepository,
+        artifact_service: ArtifactService,
+        meeting_repo: MeetingRepository,
+        s3_client: S3Client,
+    ):
+        super().__init__(upload_repo)
+        self.artifact_service = artifact_service
+        self._meeting_repo = meeting_repo
+        self.s3_client = s3_client
+
+    @staticmethod
+    def _not_found(upload_id: UUID) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Загрузка с ID {upload_id} не найдена"
+        )
+
+    @staticmethod
+    def _check_in_progress(upload: MultipartUploadModel) -> None:
+        if upload.status != UploadStatus.IN_PROGRESS:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Загрузка уже в статусе {upload.status}"
+            )
+
+    async def initiate(
+        self, meeting_id: UUID, data: MultipartUploadCreate
+    ) -> MultipartUploadResponse:
+        """Начать составную загрузку файла встречи"""
+        if not await self._meeting_repo.exists(meeting_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Встреча с ID {meeting_id} не найдена"
+            )
+        if data.size > settings.s3.multipart.max_size:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Файл больше {settings.s3.multipart.max_size} байт"
+            )
+        key = build_object_key(f"meetings/{meeting_id}", data.filename)
+        s3_upload_id = await self.s3_client.create_multipart_upload(key, data.content_type)
+        upload = MultipartUploadModel(
+            meeting_id=meeting_id,
+            storage_key=key,
+            s3_upload_id=s3_upload_id,
+            filename=data.filename,
+            content_type=data.content_type,
+            size=data.size,
+            part_size=choose_part_size(data.size),
+            status=UploadStatus.IN_PROGRESS,
+            parts=[],
+        )
+        async with self._uow:
+            created = await self._repo.create(upload)
+        return self._to_schema(created)
+
+    async def get(self, meeting_id: UUID, upload_id: UUID) -> MultipartUploadResponse:
+        """Состояние загрузки со списком загруженных частей"""
+        upload = await self._repo.get_with_parts(upload_id)
+        if upload is None or upload.meeting_id != meeting_id:
+            raise self._not_found(upload_id)
+        return self._to_schema(upload)
+
+    async def upload_part(
+        self,
+        meeting_id: UUID,
+        upload_id: UUID,
+        part_number: int,
+        body: AsyncIterator[bytes],
+        content_length: int | None = None,
+    ) -> UploadedPart:
+        """
+        Загрузить часть. Соединение с БД не держится, пока часть передается:
+        проверка и запись части идут в отдельных коротких транзакциях.
+        """
+        async with self._uow:
+            upload = await self._repo.get_by_id(upload_id)
+            if upload is None or upload.meeting_id != meeting_id:
+                raise self._not_found(upload_id)
+            self._check_in_progress(upload)
+        if not 1 <= part_number <= upload.part_count:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Номер части должен быть от 1 до {upload.part_count}"
+            )
+        expected = upload.expected_part_size(part_number)
+        if content_length is not None and content_length != expected:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Часть {part_number} должна быть размером {expected} байт"
+            )
+
+        # Сверх spool_max_memory часть пишется во временный файл (page cache,
+        # запись небольших чанков не блокирует loop заметно)
+        with SpooledTemporaryFile(max_size=settings.s3.multipart.spool_max_memory) as buffer:
+            md5 = hashlib.md5()
+            received = 0
+            async for chunk in body:
+                received += len(chunk)
+                if received > expected:
+                    break
+                md5.update(chunk)
+                buffer.write(chunk)
+            if received != expected:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Часть {part_number} должна быть размером {expected} байт"
+                )
+            buffer.seek(0)
+            try:
+                etag = await self.s3_client.upload_part(
+                    upload.storage_key,
+                    upload.s3_upload_id,
+                    part_number,
+                    buffer,
+                    expected,
+                    base64.b64encode(md5.digest()).decode(),
+                )
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") == "NoSuchUpload":
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="Загрузка прервана"
+                    )
+                raise
+
+        async with self._uow:
+            # Завершение не начнется, пока часть не записана, и наоборот
+            upload = await self._repo.get_locked(upload_id, shared=True)
+            if upload is None:
+                raise self._not_found(upload_id)
+            self._check_in_progress(upload)
+            part = await self._repo.upsert_part(upload_id, part_number, etag, expected)
+        return UploadedPart.model_validate(part)
+
+    async def complete(
+        self, meeting_id: UUID, upload_id: UUID, data: MultipartUploadComplete
+    ) -> Artifact:
+        """
+        Собрать объект из частей и создать артефакт встречи.
+        Блокировка строки не держится, пока S3 собирает объект: статус
+        ASSEMBLING коммитится до вызова S3, а результат записывается второй
+        короткой транзакцией. Если сборка прервалась, повторный complete
+        продолжит ее. Хеш и перенос под ключ по содержимому выполняет
+        фоновая задача, артефакт до ее окончания в статусе PROCESSING.
+        """
+        if data.type == ArtifactType.LINK:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Ссылка не загружается как файл"
+            )
+        async with self._uow:
+            upload = await self._repo.get_locked(upload_id)
+            if upload is None or upload.meeting_id != meeting_id:
+                raise self._not_found(upload_id)
+            if upload.status != UploadStatus.ASSEMBLING:
+                self._check_in_progress(upload)
+            parts = await self._repo.get_parts(upload.id)
+            missing = sorted(
+                set(range(1, upload.part_count + 1)) - {part.part_number for part in parts}
+            )
+            if missing:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Не загружены части: {missing[:50]}"
+                )
+            # Новые части и отмена отклоняются, пока объект собирается
+            await self._repo.update(upload, {"status": UploadStatus.ASSEMBLING})
+
+        try:
+            await self._assemble(upload, parts)
+        except (BotoCoreError, ClientError):
+            # Части остаются в S3: их можно перезагрузить и повторить complete
+            async with self._uow:
+                upload = await self._repo.get_locked(upload_id)
+                if upload.status == UploadStatus.ASSEMBLING:
+                    await self._repo.update(upload, {"status": UploadStatus.IN_PROGRESS})
+            raise
+
+        async with self._uow:
+            upload = await self._repo.get_locked(upload_id)
+            if upload.status != UploadStatus.ASSEMBLING:
+                # Результат уже записал параллельный вызов complete
+                self._check_in_progress(upload)
+            artifact = await self.artifact_service.register_upload(
+                meeting_id, upload.storage_key, upload.size, upload.content_type, data
+            )
+            await self._repo.update(
+                upload, {"status": UploadStatus.COMPLETED, "artifact_id": artifact.id}
+            )
+            # ETag частей больше не нужны, после сборки объекта S3 их удалил
+            await self._repo.delete_parts(upload.id)
+        return artifact
+
+    async def _assemble(
+        self, upload: MultipartUploadModel, parts: Sequence[MultipartUploadPartModel]
+    ) -> None:
+        """Собрать объект в S3, вне транзакции"""
+        try:
+            await self.s3_client.complete_multipart_upload(
+                upload.storage_key,
+                upload.s3_upload_id,
+                [{"PartNumber": part.part_number, "ETag": part.etag} for part in parts],
+            )
+        except ClientError as e:
+            # Загрузку уже собрал прерванный или параллельный вызов complete
+            if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                raise
+            if await self.s3_client.head_object(upload.storage_key) is None:
+                raise
+
+    async def abort(self, meeting_id: UUID, upload_id: UUID) -> None:
+        """Прервать загрузку и удалить загруженные части из S3"""
+        async with self._uow:
+            upload = await self._repo.get_locked(upload_id)
+            if upload is None or upload.meeting_id != meeting_id:
+                raise self._not_found(upload_id)
+            if upload.status == UploadStatus.ABORTED:
+                return
+            self._check_in_progress(upload)
+            await self._abort(upload)
+
+    async def _abort(self, upload: MultipartUploadModel) -> None:
+        await self.s3_client.abort_multipart_upload(upload.storage_key, upload.s3_upload_id)
+        await self._repo.update(upload, {"status": UploadStatus.ABORTED})
+        await self._repo.delete_parts(upload.id)
+
+    async def abort_stale(self) -> int:
+        """
+        Прервать загрузки без новых частей дольше stale_after секунд.
+        Пачка помечается ABORTING и коммитится до вызовов S3: блокировки
+        строк и соединение не держатся на время сетевых запросов.
+        Загрузка, которую S3 не прервал, остается ABORTING и повторяется
+        через stale_after, не занимая начало очереди следующих проходов.
+        Возвращает число взятых загрузок (не больше cleanup_batch_size).
+        """
+        config = settings.s3.multipart
+        cutoff = datetime.now(tz=timezone.utc) - timedelta(seconds=config.stale_after)
+        async with self._uow:
+            uploads = await self._repo.get_stale_locked(cutoff, config.cleanup_batch_size)
+            await self._repo.mark_aborting([upload.id for upload in uploads])
+        for upload in uploads:
+            try:
+                await self.s3_client.abort_multipart_upload(upload.storage_key, upload.s3_upload_id)
+            except ClientError as e:
+                # NoSuchUpload: S3 уже прервал загрузку в прошлый раз
+                if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                    logger.warning(f"Failed to abort stale upload {upload.id}: {e}")
+                    continue
+            except BotoCoreError as e:
+                logger.warning(f"Failed to abort stale upload {upload.id}: {e}")
+                continue
+            async with self._uow:
+                await self._repo.update(upload, {"status": UploadStatus.ABORTED})
+                await self._repo.delete_parts(upload.id)
+        return len(uploads)
+
+
+def multipart_upload_service_getter(
+    upload_repo: MultipartUploadRepository = Depends(multipart_upload_repository_getter),
+    artifact_service: ArtifactService = Depends(artifact_service_getter),
+    meeting_repo: MeetingRepository = Depends(meeting_repository_getter),
+    s3_client: S3Client = Depends(artifact_s3_client_getter),
+) -> MultipartUploadService:
+    return MultipartUploadService(upload_repo, artifact_service, meeting_repo, s3_client)
@@ -11,6 +11,7 @@ from app.application.dto.project_team import (
     ProjectTeamResponse,
     ProjectTeamWithInfo,
 )
+from app.infrastructure.database.models.projects.project import ProjectModel
 from app.infrastructure.database.models.projects.project_team import ProjectTeamModel
 from app.infrastructure.database.repositories.project_team_repository import (
     ProjectTeamRepository,
@@ -44,8 +45,8 @@ class ProjectTeamService(BaseService[ProjectTeamModel, ProjectTeamResponse]):
 
     async def _validate_project_and_team_exist(
         self, project_id: UUID, team_id: UUID
-    ) -> None:
-        """Проверить существование проекта и команды"""
+    ) -> ProjectModel:
+        """Проверить существование проекта и команды, возвращает проект"""
         project = await self._project_repo.get_by_id(project_id)
         if not project:
             raise HTTPException(
@@ -59,21 +60,14 @@ class ProjectTeamService(BaseService[ProjectTeamModel, ProjectTeamResponse]):
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Команда с ID {team_id} не найдена",
             )
+        return project
 
     async def assign_team_to_project(
         self, project_id: UUID, data: ProjectTeamCreate
     ) -> ProjectTeamResponse:
         """Назначить команду на проект"""
         # Проверяем существование проекта и команды
-        await self._validate_project_and_team_exist(project_id, data.team_id)
-
-        # Получаем информацию о проекте для проверок
-        project = await self._project_repo.get_by_id(project_id)
-        if not project:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Проект с ID {project_id} не найден",
-            )
+        project = await self._validate_project_and_team_exist(project_id, data.team_id)
 
         # Проверяем, что у проекта есть year и semester
         if not hasattr(project, "year") or not hasattr(project, "semester"):
@@ -113,7 +107,8 @@ class ProjectTeamService(BaseService[ProjectTeamModel, ProjectTeamResponse]):
         }
 
         orm_obj = ProjectTeamModel(**project_team_data)
-        created_obj = await self._repo.create(orm_obj)
+        async with self._uow:
+            created_obj = await self._repo.create(orm_obj)
         return self._to_schema(created_obj)
 
     async def get_project_teams(
@@ -128,10 +123,10 @@ class ProjectTeamService(BaseService[ProjectTeamModel, ProjectTeamResponse]):
                 detail=f"Проект с ID {project_id} не найден",
             )
 
-        project_teams = await self._project_team_repo.get_by_project_id(
-            project_id, project_team_status
+        project_teams = await self._project_team_repo.get_rows_by_project_id(
+            project_id, self._schema_fields(), project_team_status
         )
-        return [self._to_schema(team) for team in project_teams]
+        return self._rows_to_schemas(project_teams)
 
     async def get_team_projects(
         self, team_id: UUID, project_team_status: Optional[ProjectTeamStatus] = None
@@ -145,10 +140,10 @@ class ProjectTeamService(BaseService[ProjectTeamModel, ProjectTeamResponse]):
                 detail=f"Команда с ID {team_id} не найдена",
             )
 
-        team_projects = await self._project_team_repo.get_by_team_id(
-            team_id, project_team_status
+        team_projects = await self._project_team_repo.get_rows_by_team_id(
+            team_id, self._schema_fields(), project_team_status
         )
-        return [self._to_schema(project_team) for project_team in team_projects]
+        return self._rows_to_schemas(team_projects)
 
     async def get_current_team_project(
         self, team_id: UUID
@@ -226,9 +221,8 @@ class ProjectTeamService(BaseService[ProjectTeamModel, ProjectTeamResponse]):
             )
 
         # Вместо удаления меняем статус на WITHDRAWN для истории
-        project_team.status = ProjectTeamStatus.WITHDRAWN
-        await self._repo.session.commit()
-        await self._repo.session.refresh(project_team)
+        async with self._uow:
+            project_team.status = ProjectTeamStatus.WITHDRAWN
 
         return True
 
@@ -30,18 +30,19 @@ class ProjectService(BaseService[ProjectModel, Project]):
 
     async def create(self, new_obj: ProjectCreate) -> Project:
         orm_model = self._to_orm(new_obj)
-        created_model = await self._repo.create(orm_model)
+        async with self._uow:
+            created_model = await self._repo.create(orm_model)
         return self._to_schema(created_model)
 
     async def update(
         self, new_data: ProjectUpdate, project_id: UUID
     ) -> Project | None:
-        old_obj = await self._repo.get_by_id(project_id)
-        if not old_obj:
+        async with self._uow:
+            updated_obj = await self._repo.update_by_id(
+                project_id, new_data.model_dump(exclude_unset=True)
+            )
+        if not updated_obj:
             return None
-        updated_obj = await self._repo.update(
-            old_obj, new_data.model_dump(exclude_unset=True)
-        )
         return self._to_schema(updated_obj)
 
 
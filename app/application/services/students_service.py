@@ -2,7 +2,9 @@ from uuid import UUID
 import logging
 from fastapi import Depends
 from app.application.services.base_service import BaseService
+from app.application.dto.batch import BatchItemResult, BatchResult
 from app.application.dto.student import StudentCreate, StudentUpdate
+from app.domain.enums.batch_item_status import BatchItemStatus
 from app.domain.entities.persons.student import Student
 from app.infrastructure.database.models import StudentModel
 from app.infrastructure.database.repositories.student_repository import (
@@ -24,7 +26,8 @@ class StudentService(BaseService[StudentModel, Student]):
         logger.info(f'{log_prefix} Creating student: {student.last_name}')
         try:
             orm_obj = self._to_orm(student)
-            created_obj = await self._repo.create(orm_obj)
+            async with self._uow:
+                created_obj = await self._repo.create(orm_obj)
             student_schema = self._to_schema(created_obj)
             logger.info(f'{log_prefix} Successfully created student with id: {student_schema.id}')
             return student_schema
@@ -32,20 +35,40 @@ class StudentService(BaseService[StudentModel, Student]):
             logger.exception(f'{log_prefix} Failed to create student: {e}')
             raise
 
+    async def create_batch(
+        self, students: list[StudentCreate], request_id: str | None = None
+    ) -> BatchResult[Student]:
+        log_prefix = f"[{request_id}]" if request_id else ""
+        logger.info(f'{log_prefix} Creating batch of {len(students)} students')
+        async with self._uow:
+            created = await self._repo.bulk_create(
+                [student.model_dump() for student in students]
+            )
+        return BatchResult[Student](
+            created=len(created),
+            items=[
+                BatchItemResult[Student](
+                    index=index,
+                    status=BatchItemStatus.CREATED,
+                    item=self._to_schema(obj),
+                )
+                for index, obj in enumerate(created)
+            ],
+        )
+
     async def update(
         self, new_data: StudentUpdate, student_id: UUID, request_id: str | None = None
     ) -> Student | None:
         log_prefix = f"[{request_id}]" if request_id else ""
         logger.info(f'{log_prefix} Updating student with id: {student_id}')
-        old_obj = await self._repo.get_by_id(student_id)
-        if not old_obj:
-            logger.warning(f'{log_prefix} Student with id {student_id} not found for update')
-            return None
-
         try:
-            updated_orm = await self._repo.update(
-                old_obj, new_data.model_dump(exclude_unset=True)
-            )
+            async with self._uow:
+                updated_orm = await self._repo.update_by_id(
+                    student_id, new_data.model_dump(exclude_unset=True)
+                )
+            if not updated_orm:
+                logger.warning(f'{log_prefix} Student with id {student_id} not found for update')
+                return None
             student_schema = self._to_schema(updated_orm)
             logger.info(f'{log_prefix} Successfully updated student with id: {student_schema.id}')
             return student_schema
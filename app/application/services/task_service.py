@@ -3,8 +3,11 @@ from fastapi import Depends, HTTPException, status
 from typing import List
 
 from app.application.services.base_service import BaseService
+from app.application.dto.batch import BatchItemResult, BatchResult
 from app.application.dto.task import TaskCreate, TaskUpdate, TaskResponse
+from app.domain.enums.batch_item_status import BatchItemStatus
 from app.domain.entities.meetings.task import Task
+from app.domain.events import TaskAddedToMeeting, TaskCompleted, TaskRemovedFromMeeting
 from app.infrastructure.database.models.meetings.task import TaskModel
 from app.infrastructure.database.repositories.task_repository import (
     TaskRepository,
@@ -38,7 +41,8 @@ class TaskService(BaseService[TaskModel, TaskResponse]):
     async def create(self, data: TaskCreate) -> TaskResponse:
         """Создать новую задачу"""
         orm_obj = TaskModel(**data.model_dump(exclude_unset=True))
-        created_obj = await self._repo.create(orm_obj)
+        async with self._uow:
+            created_obj = await self._repo.create(orm_obj)
         return self._to_schema(created_obj)
 
     async def create_for_meeting(
@@ -53,33 +57,75 @@ class TaskService(BaseService[TaskModel, TaskResponse]):
                 detail=f"Встреча с ID {meeting_id} не найдена"
             )
 
-        # Создаем задачу
-        task = await self.create(data)
-        
-        # Привязываем задачу к встрече
         from app.infrastructure.database.models.meetings.meeting_task import MeetingTaskModel
-        
-        meeting_task = MeetingTaskModel(
-            meeting_id=meeting_id,
-            task_id=task.id
-        )
-        await self._meeting_task_repo.create(meeting_task)
+
+        # Задача и ее связь со встречей создаются в одной транзакции
+        async with self._uow:
+            task = await self.create(data)
+            meeting_task = MeetingTaskModel(
+                meeting_id=meeting_id,
+                task_id=task.id
+            )
+            await self._meeting_task_repo.create(meeting_task)
+            self._outbox.add_events(TaskAddedToMeeting(task_id=task.id, meeting_id=meeting_id))
 
         return task
 
+    async def create_batch_for_meeting(
+        self, meeting_id: UUID, items: List[TaskCreate]
+    ) -> BatchResult[TaskResponse]:
+        """Создать пачку задач и привязать их к встрече"""
+        meeting = await self._meeting_repo.get_by_id(meeting_id)
+        if not meeting:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Встреча с ID {meeting_id} не найдена"
+            )
+
+        async with self._uow:
+            tasks = await self._task_repo.bulk_create(
+                [item.model_dump() for item in items]
+            )
+            await self._meeting_task_repo.bulk_create(
+                [{"meeting_id": meeting_id, "task_id": task.id} for task in tasks]
+            )
+            self._outbox.add_events(*(
+                TaskAddedToMeeting(task_id=task.id, meeting_id=meeting_id)
+                for task in tasks
+            ))
+
+        return BatchResult[TaskResponse](
+            created=len(tasks),
+            items=[
+                BatchItemResult[TaskResponse](
+                    index=index,
+                    status=BatchItemStatus.CREATED,
+                    item=self._to_schema(task),
+                )
+                for index, task in enumerate(tasks)
+            ],
+        )
+
     async def update(
         self, new_data: TaskUpdate, task_id: UUID
     ) -> TaskResponse | None:
         """Обновить задачу"""
-        old_obj = await self._repo.get_by_id(task_id)
-        if not old_obj:
+        update_data = new_data.model_dump(exclude_unset=True)
+        completing = update_data.get("is_completed") is True
+        async with self._uow:
+            was_completed = False
+            if completing:
+                # Прежнее значение под блокировкой: TaskCompleted публикуется один раз
+                task = await self._repo.get_for_update(task_id)
+                was_completed = task is not None and task.is_completed
+            updated_obj = await self._repo.update_by_id(task_id, update_data)
+            if updated_obj and completing and not was_completed:
+                self._outbox.add_events(TaskCompleted(task_id=updated_obj.id))
+        if not updated_obj:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Задача с ID {task_id} не найдена"
             )
-
-        update_data = new_data.model_dump(exclude_unset=True)
-        updated_obj = await self._repo.update(old_obj, update_data)
         return self._to_schema(updated_obj)
 
     async def complete_task(self, task_id: UUID) -> TaskResponse:
@@ -97,16 +143,16 @@ class TaskService(BaseService[TaskModel, TaskResponse]):
                 detail="Задача уже выполнена"
             )
 
-        task.is_completed = True
-        await self._repo.session.commit()
-        await self._repo.session.refresh(task)
+        async with self._uow:
+            await self._repo.update(task, {"is_completed": True})
+            self._outbox.add_events(TaskCompleted(task_id=task.id))
 
         return self._to_schema(task)
 
     async def get_team_incomplete_tasks(self, team_id: UUID) -> List[TaskResponse]:
         """Получить незавершенные задачи команды"""
         tasks = await self._task_repo.get_incomplete_tasks_by_team(team_id)
-        return [self._to_schema(task) for task in tasks]
+        return self._to_schemas(tasks)
 
     async def add_task_to_meeting(
         self, meeting_id: UUID, task_id: UUID
@@ -143,7 +189,9 @@ class TaskService(BaseService[TaskModel, TaskResponse]):
             meeting_id=meeting_id,
             task_id=task_id
         )
-        await self._meeting_task_repo.create(meeting_task)
+        async with self._uow:
+            await self._meeting_task_repo.create(meeting_task)
+            self._outbox.add_events(TaskAddedToMeeting(task_id=task_id, meeting_id=meeting_id))
 
         return True
 
@@ -151,7 +199,12 @@ class TaskService(BaseService[TaskModel, TaskResponse]):
         self, meeting_id: UUID, task_id: UUID
     ) -> bool:
         """Удалить задачу из встречи"""
-        deleted = await self._meeting_task_repo.delete_by_meeting_and_task(meeting_id, task_id)
+        async with self._uow:
+            deleted = await self._meeting_task_repo.delete_by_meeting_and_task(meeting_id, task_id)
+            if deleted:
+                self._outbox.add_events(
+                    TaskRemovedFromMeeting(task_id=task_id, meeting_id=meeting_id)
+                )
         if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
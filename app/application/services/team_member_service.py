@@ -7,7 +7,10 @@ from app.application.dto.team_member import (
     TeamMemberCreate,
     TeamMemberUpdate
 )
+from app.application.dto.batch import BatchItemResult, BatchResult
 from app.domain.entities.teams.team_member import TeamMember
+from app.domain.enums.batch_item_status import BatchItemStatus
+from app.domain.events import MemberAdded, MemberRemoved
 from app.infrastructure.database.models.teams.team_member import TeamMemberModel
 from app.infrastructure.database.repositories.team_member_repository import (
     TeamMemberRepository,
@@ -80,9 +83,69 @@ class TeamMemberService(BaseService[TeamMemberModel, TeamMember]):
         }
         
         orm_obj = TeamMemberModel(**team_member_data)
-        created_obj = await self._repo.create(orm_obj)
+        async with self._uow:
+            created_obj = await self._repo.create(orm_obj)
+            self._outbox.add_events(MemberAdded(team_id=team_id, student_id=data.student_id))
         return self._to_schema(created_obj)
 
+    async def add_students_to_team_batch(
+        self, team_id: UUID, items: List[TeamMemberCreate]
+    ) -> BatchResult[TeamMember]:
+        """Добавить пачку студентов в команду, результат по каждому элементу"""
+        team = await self._team_repo.get_by_id(team_id)
+        if not team:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Команда с ID {team_id} не найдена"
+            )
+
+        existing_students = await self._student_repo.get_existing_ids(
+            [item.student_id for item in items]
+        )
+        # Уже существующие связи пропускаются через ON CONFLICT DO NOTHING
+        async with self._uow:
+            created = await self._team_member_repo.bulk_upsert(
+                [
+                    {
+                        "team_id": team_id,
+                        "student_id": item.student_id,
+                        "role": item.role,
+                        "study_group": item.study_group,
+                    }
+                    for item in items
+                    if item.student_id in existing_students
+                ],
+                index_elements=["team_id", "student_id"],
+            )
+            self._outbox.add_events(*(
+                MemberAdded(team_id=team_id, student_id=member.student_id)
+                for member in created
+            ))
+        created_by_student = {member.student_id: member for member in created}
+
+        results = []
+        for index, item in enumerate(items):
+            if item.student_id not in existing_students:
+                results.append(BatchItemResult[TeamMember](
+                    index=index,
+                    status=BatchItemStatus.NOT_FOUND,
+                    detail=f"Студент с ID {item.student_id} не найден",
+                ))
+            elif item.student_id in created_by_student:
+                member = created_by_student.pop(item.student_id)
+                results.append(BatchItemResult[TeamMember](
+                    index=index,
+                    status=BatchItemStatus.CREATED,
+                    item=self._to_schema(member),
+                ))
+            else:
+                results.append(BatchItemResult[TeamMember](
+                    index=index,
+                    status=BatchItemStatus.ALREADY_EXISTS,
+                    detail="Студент уже состоит в этой команде",
+                ))
+        return BatchResult[TeamMember](created=len(created), items=results)
+
     async def get_team_members(self, team_id: UUID) -> List[TeamMember]:
         """Получить всех студентов команды"""
         team = await self._team_repo.get_by_id(team_id)
@@ -92,8 +155,10 @@ class TeamMemberService(BaseService[TeamMemberModel, TeamMember]):
                 detail=f"Команда с ID {team_id} не найдена"
             )
 
-        team_members = await self._team_member_repo.get_by_team_id(team_id)
-        return [self._to_schema(member) for member in team_members]
+        team_members = await self._team_member_repo.get_rows_by_team_id(
+            team_id, self._schema_fields()
+        )
+        return self._rows_to_schemas(team_members)
 
     async def get_student_teams(self, student_id: UUID) -> List[TeamMember]:
         """Получить все команды студента"""
@@ -104,8 +169,10 @@ class TeamMemberService(BaseService[TeamMemberModel, TeamMember]):
                 detail=f"Студент с ID {student_id} не найден"
             )
 
-        student_teams = await self._team_member_repo.get_by_student_id(student_id)
-        return [self._to_schema(team_member) for team_member in student_teams]
+        student_teams = await self._team_member_repo.get_rows_by_student_id(
+            student_id, self._schema_fields()
+        )
+        return self._rows_to_schemas(student_teams)
 
     async def update_team_member(
         self, team_id: UUID, student_id: UUID, data: TeamMemberUpdate
@@ -119,7 +186,8 @@ class TeamMemberService(BaseService[TeamMemberModel, TeamMember]):
             )
 
         update_data = data.model_dump(exclude_unset=True)
-        updated_obj = await self._repo.update(team_member, update_data)
+        async with self._uow:
+            updated_obj = await self._repo.update(team_member, update_data)
         return self._to_schema(updated_obj)
 
     async def remove_student_from_team(
@@ -133,7 +201,10 @@ class TeamMemberService(BaseService[TeamMemberModel, TeamMember]):
                 detail="Связь между командой и студентом не найдена"
             )
 
-        deleted = await self._team_member_repo.delete_by_team_and_student(team_id, student_id)
+        async with self._uow:
+            deleted = await self._team_member_repo.delete_by_team_and_student(team_id, student_id)
+            if deleted:
+                self._outbox.add_events(MemberRemoved(team_id=team_id, student_id=student_id))
         return deleted
     
 
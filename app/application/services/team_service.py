@@ -3,6 +3,7 @@ from fastapi import Depends
 from app.application.services.base_service import BaseService
 from app.application.dto.team import TeamCreate, TeamUpdate
 from app.domain.entities.teams.team import Team
+from app.domain.events import TeamCreated
 from app.infrastructure.database.models import TeamModel
 from app.infrastructure.database.repositories.team_repository import (
     TeamRepository,
@@ -22,16 +23,18 @@ class TeamService(BaseService[TeamModel, Team]):
 
     async def create(self, team: TeamCreate) -> Team:
         orm_obj = self._to_orm(team)
-        created_obj = await self._repo.create(orm_obj)
+        async with self._uow:
+            created_obj = await self._repo.create(orm_obj)
+            self._outbox.add_events(TeamCreated(team_id=created_obj.id))
         return self._to_schema(created_obj)
 
     async def update(self, new_data: TeamUpdate, team_id: UUID) -> Team | None:
-        old_obj = await self._repo.get_by_id(team_id)
-        if not old_obj:
+        async with self._uow:
+            updated_orm = await self._repo.update_by_id(
+                team_id, new_data.model_dump(exclude_unset=True)
+            )
+        if not updated_orm:
             return None
-        updated_orm = await self._repo.update(
-            old_obj, new_data.model_dump(exclude_unset=True)
-        )
         return self._to_schema(updated_orm)
 
 
@@ -1,3 +1,4 @@
+from typing import Literal
 from pydantic import BaseModel, PostgresDsn
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pathlib import Path
@@ -9,6 +10,14 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 class RunConfig(BaseModel):
     host: str = "0.0.0.0"
     port: int = 8000
+    # Отладочные проверки, например поиск N+1 запросов
+    debug: bool = False
+    # Процессов uvicorn, между ними делится бюджет соединений с БД
+    workers: int = 1
+    # Соединений с БД, открываемых каждым воркером при старте
+    warmup_connections: int = 2
+    # Сколько ждать завершения запросов и фоновых задач при остановке, секунды
+    shutdown_timeout: int = 20
 
 
 class ApiV1Prefix(BaseModel):
@@ -28,6 +37,14 @@ class HashConfig(BaseModel):
     refresh_expire_days: int = 30
 
 
+class PasswordHashConfig(BaseModel):
+    # Потоки помогают только если бэкенд bcrypt отпускает GIL (пакет bcrypt),
+    # os_crypt из passlib держит GIL - для него нужен пул процессов
+    executor: Literal["thread", "process"] = "process"
+    # Сколько хешей считается одновременно, остальные ждут в очереди
+    max_concurrency: int = 2
+
+
 class CuratorBucketConfig(BaseModel):
     name: str = "curators"
 
@@ -45,6 +62,85 @@ class CuratorBucketConfig(BaseModel):
         }
 
 
+class ArtifactBucketConfig(BaseModel):
+    # Приватный бакет: без публичной политики, доступ только по подписанным ссылкам
+    name: str = "artifacts"
+    policy: dict | None = None
+
+
+class MultipartUploadConfig(BaseModel):
+    # Размер части, S3 требует не меньше 5 МБ для всех частей кроме последней
+    part_size: int = 16 * 1024 * 1024
+    # Предел составной загрузки S3 (5 ТБ)
+    max_size: int = 5 * 1024 * 1024 * 1024 * 1024
+    # Сколько байт части держать в памяти, остальное пишется во временный файл
+    spool_max_memory: int = 1024 * 1024
+    # Загрузка без новых частей дольше stale_after секунд прерывается фоновой задачей
+    stale_after: int = 24 * 60 * 60
+    cleanup_interval: int = 15 * 60
+    cleanup_batch_size: int = 100
+
+
+class PaginationConfig(BaseModel):
+    default_limit: int = 50
+    max_limit: int = 200
+    # Строк в одной пачке потоковой выгрузки (серверный курсор, chunk ответа)
+    stream_batch_size: int = 500
+
+
+class BatchConfig(BaseModel):
+    max_size: int = 5000
+
+
+class CacheConfig(BaseModel):
+    enabled: bool = True
+    # Пустой url - кеш в памяти процесса (для разработки и тестов).
+    # Инвалидация после коммита и отзыв токенов видны только своему процессу,
+    # поэтому при RUN__WORKERS > 1 url обязателен: без него приложение не стартует
+    url: str = ""
+    timeout: float = 0.5
+    prefix: str = "alpha:"
+    # Время жизни записи в секундах по таблицам, остальные таблицы не кешируются
+    ttl: dict[str, int] = {
+        "teams": 300,
+        "projects": 600,
+        "students": 300,
+        "meetings": 120,
+    }
+    # Время жизни проверенного access-токена куратора
+    principal_ttl: int = 60
+    memory_max_entries: int = 10_000
+
+
+class OutboxConfig(BaseModel):
+    # Событий в одной транзакции relay
+    batch_size: int = 100
+    # Опрос таблицы, если коммиты этого процесса не будили relay, секунды
+    poll_interval: float = 5.0
+    # После стольких неудачных доставок событие остается в таблице для разбора
+    max_attempts: int = 10
+
+
+class BrokerConfig(BaseModel):
+    # Пустой url - очередь в памяти процесса (для разработки и тестов): задачи
+    # по событиям outbox тогда выполняет сам relay, событие удаляется после задачи
+    url: str = ""
+    # Попыток на задачу, после последней задача уходит в очередь {queue}.dead
+    max_attempts: int = 5
+    # Пауза перед повтором: retry_base_delay * 2^(попытка - 1), не больше retry_max_delay
+    retry_base_delay: float = 1.0
+    retry_max_delay: float = 300.0
+    # Одновременно выполняемых задач на процесс по очередям
+    concurrency: dict[str, int] = {
+        "default": 4,
+        # Хеширование загруженных файлов: долгие задачи, отдельно от остальных
+        "artifacts": 2,
+    }
+    # Запускать обработчики в процессе API, иначе отдельно: python -m app.worker
+    embedded_workers: bool = True
+    outbox: OutboxConfig = OutboxConfig()
+
+
 class FrontendConfig(BaseModel):
     host: str = "http://localhost:3000"
 
@@ -55,7 +151,23 @@ class S3Config(BaseModel):
     access_key: str = ""
     secret_key: str = ""
     region: str = ""
+    # Соединений boto3 на процесс, вызовы идут из пула потоков
+    max_pool_connections: int = 20
+    # Время жизни подписанной ссылки на загрузку, секунды
+    presign_expires: int = 900
+    avatar_max_size: int = 50 * 1024 * 1024
+    # Размер чанка при отдаче объекта клиентом, столько памяти занимает одно скачивание
+    download_chunk_size: int = 256 * 1024
+    # Предел одиночной загрузки в S3 (5 ГБ)
+    artifact_max_size: int = 5 * 1024 * 1024 * 1024
+    # Артефакт в PROCESSING без изменений дольше artifact_processing_timeout секунд:
+    # задача обработки считается потерянной и ставится заново фоновой очисткой,
+    # а сам артефакт можно удалить
+    artifact_processing_timeout: int = 60 * 60
+    artifact_requeue_batch_size: int = 100
     curator_bucket: CuratorBucketConfig = CuratorBucketConfig()
+    artifact_bucket: ArtifactBucketConfig = ArtifactBucketConfig()
+    multipart: MultipartUploadConfig = MultipartUploadConfig()
 
 
 class DatabaseConfig(BaseModel):
@@ -70,6 +182,12 @@ class DatabaseConfig(BaseModel):
     echo_pool: bool = False
     pool_size: int = 50
     max_overflow: int = 10
+    # Общий бюджет соединений на все воркеры, 0 - pool_size и max_overflow на каждый
+    max_connections: int = 0
+    # Сколько ждать свободное соединение, после - ошибка (db_pool_checkout_timeouts_total)
+    pool_timeout: float = 30
+    # В debug: предупреждение, если один запрос повторился за HTTP-запрос больше раз
+    repeated_query_threshold: int = 5
     naming_convention: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
         "uq": "uq_%(table_name)s_%(column_0_N_name)s",
@@ -78,6 +196,15 @@ class DatabaseConfig(BaseModel):
         "pk": "pk_%(table_name)s",
     }
 
+    def pool_limits(self, workers: int) -> tuple[int, int]:
+        """pool_size и max_overflow одного воркера"""
+        if not self.max_connections:
+            return self.pool_size, self.max_overflow
+        per_worker = max(1, self.max_connections // workers)
+        # Доля overflow та же, что в pool_size/max_overflow
+        overflow = per_worker * self.max_overflow // (self.pool_size + self.max_overflow)
+        return per_worker - overflow, overflow
+
     @property
     def url(self) -> PostgresDsn:
         return PostgresDsn.build(
@@ -101,8 +228,13 @@ class Settings(BaseSettings):
     api: ApiPrefix = ApiPrefix()
     db: DatabaseConfig = DatabaseConfig()
     hash: HashConfig = HashConfig()
+    password_hash: PasswordHashConfig = PasswordHashConfig()
     s3: S3Config = S3Config()
     frontend: FrontendConfig = FrontendConfig()
+    pagination: PaginationConfig = PaginationConfig()
+    batch: BatchConfig = BatchConfig()
+    cache: CacheConfig = CacheConfig()
+    broker: BrokerConfig = BrokerConfig()
 
 
 settings = Settings()  # type: ignore
@@ -1,5 +1,10 @@
+from contextlib import AsyncExitStack
+from typing import Sequence
+
+from sqlalchemy import Executable
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from app.core.config import settings
+from app.core.db_pool import InstrumentedQueuePool
 
 
 class DatabaseHelper:
@@ -10,13 +15,16 @@ class DatabaseHelper:
         echo_pool: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        pool_timeout: float = 30,
     ):
         self.engine = create_async_engine(
             url=url,
             echo=echo,
             echo_pool=echo_pool,
+            poolclass=InstrumentedQueuePool,
             pool_size=pool_size,
             max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
         )
 
         self.async_session_factory = async_sessionmaker(
@@ -26,6 +34,18 @@ class DatabaseHelper:
             expire_on_commit=False,
         )
 
+    async def warm_up(self, connections: int, statements: Sequence[Executable] = ()) -> None:
+        """
+        Заранее открыть до connections соединений пула и выполнить на каждом
+        statements: asyncpg подготовит их, а SQLAlchemy закеширует компиляцию
+        """
+        async with AsyncExitStack() as stack:
+            # Соединения держатся одновременно, иначе пул выдаст одно и то же
+            for _ in range(min(connections, self.engine.pool.size())):
+                connection = await stack.enter_async_context(self.engine.connect())
+                for statement in statements:
+                    await connection.execute(statement)
+
     async def dispose(self):
         await self.engine.dispose()
 
@@ -34,10 +54,14 @@ class DatabaseHelper:
             yield session
 
 
+# Каждый воркер uvicorn получает свою долю общего бюджета соединений
+pool_size, max_overflow = settings.db.pool_limits(settings.run.workers)
+
 db_helper = DatabaseHelper(
     url=str(settings.db.url),
     echo=settings.db.echo,
     echo_pool=settings.db.echo_pool,
-    pool_size=settings.db.pool_size,
-    max_overflow=settings.db.max_overflow,
+    pool_size=pool_size,
+    max_overflow=max_overflow,
+    pool_timeout=settings.db.pool_timeout,
 )
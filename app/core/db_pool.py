@@ -0,0 +1,72 @@
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time to get a connection from the pool, including opening a new one",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Pool checkouts that failed after pool_timeout",
+)
+
+# livesum: при нескольких воркерах на /metrics сумма по живым процессам
+POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured number of persistent pool connections",
+    multiprocess_mode="livesum",
+)
+POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections in use",
+    multiprocess_mode="livesum",
+)
+POOL_IDLE = Gauge(
+    "db_pool_idle",
+    "Open connections waiting in the pool",
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Connections open above pool_size",
+    multiprocess_mode="livesum",
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул asyncpg с метриками. Gauge обновляются при выдаче и возврате
+    соединения, а не при сборе метрик: в multiprocess-режиме /metrics
+    отдает другой процесс и прочитать пул не может.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        POOL_SIZE.set(self.size())
+        POOL_CHECKED_OUT.set(self.checkedout())
+        POOL_IDLE.set(self.checkedin())
+        # overflow() отрицательный, пока открыто меньше pool_size соединений
+        POOL_OVERFLOW.set(max(self.overflow(), 0))
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+            self._update_gauges()
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._update_gauges()
@@ -1,42 +1,180 @@
-# middleware.py
-import time
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, Counter, Histogram
-from fastapi.responses import Response
-
-REQUEST_COUNT = Counter(
-    "http_requests_total",
-    "Total HTTP requests",
-    ["method", "path", "status"]
-)
-
-REQUEST_LATENCY = Histogram(
-    "http_request_duration_seconds",
-    "HTTP request latency",
-    ["path"]
-)
-
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path == "/metrics":
-            return Response(
-                generate_latest(),
-                media_type=CONTENT_TYPE_LATEST,
-            )
-
-        start = time.time()
-        response = await call_next(request)
-        duration = time.time() - start
-
-        REQUEST_COUNT.labels(
-            method=request.method,
-            path=request.url.path,
-            status=response.status_code,
-        ).inc()
-
-        REQUEST_LATENCY.labels(
-            path=request.url.path
-        ).observe(duration)
-
-        return response
+# middleware.py
+import logging
+import os
+import time
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.query_stats import track_queries
+
+logger = logging.getLogger("query_stats")
+
+REQUEST_COUNT = Counter(
+    "http_requests_total",
+    "Total HTTP requests",
+    ["method", "path", "status"]
+)
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "path"]
+)
+
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being processed",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "HTTP response body size",
+    ["method", "path"],
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000, 1_000_000_000),
+)
+
+DB_QUERIES = Histogram(
+    "http_request_db_queries",
+    "Database queries per HTTP request",
+    ["method", "path"],
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 100),
+)
+
+DB_DURATION = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent in database queries per HTTP request",
+    ["method", "path"],
+)
+
+# Остальные методы пишутся как OTHER, чтобы мусорные запросы не создавали серии
+_METHODS = frozenset({"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"})
+# Запросы, не попавшие ни в один маршрут (404), идут в одну серию
+UNMATCHED_PATH = "<unmatched>"
+
+
+def metrics_registry() -> CollectorRegistry:
+    """
+    С PROMETHEUS_MULTIPROC_DIR (несколько воркеров) метрики собираются из файлов
+    всех процессов, иначе отдается реестр текущего процесса
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def _method(scope: Scope) -> str:
+    return scope["method"] if scope["method"] in _METHODS else "OTHER"
+
+
+def route_path(scope: Scope) -> str:
+    """Шаблон маршрута запроса (/api/v1/teams/{team_id}), роутер кладет маршрут в scope"""
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or UNMATCHED_PATH
+
+
+class PrometheusMiddleware:
+    """
+    ASGI-middleware метрик HTTP. В метке path шаблон маршрута, а не URL,
+    поэтому число серий ограничено числом маршрутов. Ответ не буферизуется:
+    потоковые ответы проходят как есть, время считается до последнего чанка.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if scope["path"] == "/metrics":
+            body = generate_latest(metrics_registry())
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", CONTENT_TYPE_LATEST.encode()),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        method = _method(scope)
+        # Если приложение упало до ответа, ServerErrorMiddleware отдаст 500
+        status = 500
+        size = 0
+
+        async def send_with_metrics(message: Message) -> None:
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        in_progress = REQUESTS_IN_PROGRESS.labels(method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_metrics)
+        finally:
+            duration = time.perf_counter() - start
+            in_progress.dec()
+            path = route_path(scope)
+            REQUEST_COUNT.labels(method=method, path=path, status=status).inc()
+            REQUEST_LATENCY.labels(method=method, path=path).observe(duration)
+            RESPONSE_SIZE.labels(method=method, path=path).observe(size)
+
+
+class QueryStatsMiddleware:
+    """
+    Число запросов к БД и время в них на HTTP-запрос: метрики по шаблону
+    маршрута и заголовок Server-Timing. В debug предупреждает о запросах,
+    повторенных больше repeated_query_threshold раз (признак N+1).
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries(track_shapes=settings.run.debug) as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # Запросы во время отдачи потокового тела сюда не попадут
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"',
+                    )
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_with_timing)
+            finally:
+                method, path = _method(scope), route_path(scope)
+                DB_QUERIES.labels(method=method, path=path).observe(stats.count)
+                DB_DURATION.labels(method=method, path=path).observe(stats.duration)
+                threshold = settings.db.repeated_query_threshold
+                for shape, repeats in stats.repeated(threshold):
+                    logger.warning(
+                        f"{scope['method']} {path}: query repeated {repeats} times: {shape}"
+                    )
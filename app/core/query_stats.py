@@ -0,0 +1,71 @@
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger("query_stats")
+
+# Списки параметров IN ($1, $2, ...) разной длины считаются одним запросом
+_PARAM_LIST = re.compile(r"\((?:\s*\$\d+\s*,)*\s*\$\d+\s*\)")
+_PARAM = re.compile(r"\$\d+")
+
+
+def statement_shape(statement: str) -> str:
+    """Текст запроса без номеров параметров и длины списков IN"""
+    return _PARAM.sub("?", _PARAM_LIST.sub("(?)", statement))
+
+
+@dataclass
+class QueryStats:
+    """Запросы к БД в рамках одного HTTP-запроса"""
+
+    count: int = 0
+    # Суммарное время выполнения запросов, секунды
+    duration: float = 0.0
+    # Повторы одинаковых запросов, собираются только если track_shapes
+    shapes: Counter[str] = field(default_factory=Counter)
+    track_shapes: bool = False
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Запросы, выполненные больше threshold раз"""
+        return [(shape, n) for shape, n in self.shapes.most_common() if n > threshold]
+
+
+_current: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries(track_shapes: bool = False) -> Iterator[QueryStats]:
+    """Считать запросы к БД, выполненные в текущем контексте"""
+    stats = QueryStats(track_shapes=track_shapes)
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+
+
+# Слушатели на классе Engine: считаются запросы всех движков процесса
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        context._query_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    started = getattr(context, "_query_started", None)
+    if stats is None or started is None:
+        return
+    stats.count += 1
+    stats.duration += time.perf_counter() - started
+    if stats.track_shapes:
+        stats.shapes[statement_shape(statement)] += 1
@@ -2,7 +2,7 @@ from pydantic import Field, HttpUrl
 from typing import Optional
 from app.domain.entities.base_entity import BaseEntity
 from app.domain.entities.custom_types import MediumText, NameField
-from app.domain.enums import ArtifactType
+from app.domain.enums import ArtifactStatus, ArtifactType
 
 
 class Artifact(BaseEntity):
@@ -11,4 +11,10 @@ class Artifact(BaseEntity):
     name: NameField = Field(..., examples=["Название артефакта"])
     description: MediumText = Field(None, examples=["Описание артефакта"])
     type: ArtifactType
-    url: str = Field(..., min_length=1, max_length=2000)
\ No newline at end of file
+    url: str = Field(..., min_length=1, max_length=2000)
+    size: Optional[int] = Field(None, description="Размер файла в байтах")
+    content_type: Optional[str] = Field(None, examples=["video/mp4"])
+    sha256: Optional[str] = Field(None, description="SHA-256 содержимого файла")
+    status: ArtifactStatus = Field(
+        ArtifactStatus.READY, description="PROCESSING, пока файл переносится в хранилище"
+    )
\ No newline at end of file
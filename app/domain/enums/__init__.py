@@ -6,4 +6,7 @@ from .semester import Semester
 from .str_auto_enum import StrAutoEnum
 from .attendance_entity_type import AttendanceEntityType
 from .evaluation_type import EvaluationType
-from .milestone_type import MilestoneType
\ No newline at end of file
+from .milestone_type import MilestoneType
+from .batch_item_status import BatchItemStatus
+from .upload_status import UploadStatus
+from .artifact_status import ArtifactStatus
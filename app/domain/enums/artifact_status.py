@@ -0,0 +1,7 @@
+from enum import auto
+from .str_auto_enum import StrAutoEnum
+
+class ArtifactStatus(StrAutoEnum):
+    PROCESSING = auto()
+    READY = auto()
+    FAILED = auto()
@@ -0,0 +1,7 @@
+from enum import auto
+from .str_auto_enum import StrAutoEnum
+
+class BatchItemStatus(StrAutoEnum):
+    CREATED = auto()
+    ALREADY_EXISTS = auto()
+    NOT_FOUND = auto()
@@ -0,0 +1,9 @@
+from enum import auto
+from .str_auto_enum import StrAutoEnum
+
+class UploadStatus(StrAutoEnum):
+    IN_PROGRESS = auto()
+    ASSEMBLING = auto()
+    ABORTING = auto()
+    COMPLETED = auto()
+    ABORTED = auto()
@@ -0,0 +1,11 @@
+from .base import DomainEvent
+from .artifacts import ArtifactUploaded
+from .meetings import (
+    MeetingCanceled,
+    MeetingCompleted,
+    TaskAddedToMeeting,
+    TaskCarriedOver,
+    TaskCompleted,
+    TaskRemovedFromMeeting,
+)
+from .teams import MemberAdded, MemberRemoved, TeamCreated
@@ -0,0 +1,7 @@
+from uuid import UUID
+
+from app.domain.events.base import DomainEvent
+
+
+class ArtifactUploaded(DomainEvent):
+    artifact_id: UUID
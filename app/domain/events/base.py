@@ -0,0 +1,15 @@
+from typing import ClassVar
+from pydantic import BaseModel, ConfigDict
+
+
+class DomainEvent(BaseModel):
+    """Событие предметной области, публикуется через outbox после коммита"""
+
+    model_config = ConfigDict(frozen=True)
+
+    # Имя события в outbox, по умолчанию имя класса
+    name: ClassVar[str]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.name = cls.__name__
@@ -0,0 +1,33 @@
+from uuid import UUID
+
+from app.domain.events.base import DomainEvent
+
+
+class MeetingCompleted(DomainEvent):
+    meeting_id: UUID
+    team_id: UUID
+
+
+class MeetingCanceled(DomainEvent):
+    meeting_id: UUID
+    team_id: UUID
+
+
+class TaskCompleted(DomainEvent):
+    task_id: UUID
+
+
+class TaskAddedToMeeting(DomainEvent):
+    task_id: UUID
+    meeting_id: UUID
+
+
+class TaskRemovedFromMeeting(DomainEvent):
+    task_id: UUID
+    meeting_id: UUID
+
+
+class TaskCarriedOver(DomainEvent):
+    task_id: UUID
+    from_meeting_id: UUID
+    to_meeting_id: UUID
@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from app.domain.events.base import DomainEvent
+
+
+class TeamCreated(DomainEvent):
+    team_id: UUID
+
+
+class MemberAdded(DomainEvent):
+    team_id: UUID
+    student_id: UUID
+
+
+class MemberRemoved(DomainEvent):
+    team_id: UUID
+    student_id: UUID
@@ -13,6 +13,25 @@ class RepositoryInterface(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def bulk_create(self, values: Sequence[dict]) -> Sequence[T]:
+        """
+        Сохранить пачку объектов несколькими многострочными запросами
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_upsert(
+        self,
+        values: Sequence[dict],
+        index_elements: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+    ) -> Sequence[T]:
+        """
+        Вставить пачку объектов, при конфликте обновить update_fields или пропустить строку
+        """
+        pass
+
     @abstractmethod
     async def get_by_id(self, obj_id: UUID) -> T | None:
         """
@@ -20,6 +39,13 @@ class RepositoryInterface(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def get_for_update(self, obj_id: UUID) -> T | None:
+        """
+        Получить объект по ID под блокировкой строки до конца транзакции
+        """
+        pass
+
     @abstractmethod
     async def update(self, obj: T, new_data: dict) -> T:
         """
@@ -27,6 +53,13 @@ class RepositoryInterface(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def update_by_id(self, obj_id: UUID, values: dict) -> T | None:
+        """
+        Обновить объект по ID одним запросом, None если объекта нет
+        """
+        pass
+
     @abstractmethod
     async def delete(self, obj: T) -> None:
         """
@@ -34,9 +67,46 @@ class RepositoryInterface(ABC, Generic[T]):
         """
         pass
 
+    @abstractmethod
+    async def delete_by_id(self, obj_id: UUID) -> bool:
+        """
+        Удалить объект по ID одним запросом, False если объекта нет
+        """
+        pass
+
+    @abstractmethod
+    async def bulk_delete(self, ids: Sequence[UUID]) -> Sequence[UUID]:
+        """
+        Удалить объекты по списку ID, вернуть ID удаленных
+        """
+        pass
+
+    @abstractmethod
+    async def exists(self, obj_id: UUID) -> bool:
+        """
+        Проверить наличие объекта по ID без загрузки строки
+        """
+        pass
+
+    @abstractmethod
+    async def get_existing_ids(self, ids: Sequence[UUID]) -> set[UUID]:
+        """
+        Вернуть те ID из списка, для которых есть объекты в бд
+        """
+        pass
+
     @abstractmethod
     async def get_list(self, **filter_attrs) -> Sequence[T] | list[T]:
         """
         Вернуть все объекты
         """
         pass
+
+    @abstractmethod
+    async def get_page(
+        self, limit: int, cursor: str | None = None, **filter_attrs
+    ) -> tuple[Sequence[T], str | None]:
+        """
+        Вернуть страницу объектов после курсора и курсор следующей страницы
+        """
+        pass
@@ -0,0 +1,14 @@
+from app.core.config import settings
+from app.infrastructure.cache.base import CacheBackend
+from app.infrastructure.cache.memory import InMemoryCache
+from app.infrastructure.cache.redis import RedisCache
+
+
+def build_cache_backend() -> CacheBackend:
+    if settings.cache.url:
+        return RedisCache(settings.cache.url, settings.cache.timeout)
+    return InMemoryCache(settings.cache.memory_max_entries)
+
+
+# Общее подключение для всех кешей приложения
+cache_backend = build_cache_backend()
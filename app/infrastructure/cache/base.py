@@ -0,0 +1,51 @@
+from abc import ABC, abstractmethod
+
+
+class CacheBackend(ABC):
+    """Хранилище байтовых значений по строковому ключу с временем жизни"""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """
+        Получить значение по ключу, None если ключа нет или он истек
+        """
+        pass
+
+    async def get_many(self, *keys: str) -> list[bytes | None]:
+        """
+        Получить значения нескольких ключей в порядке keys
+        """
+        return [await self.get(key) for key in keys]
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        """
+        Сохранить значение на ttl секунд
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Удалить ключи
+        """
+        pass
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> None:
+        """
+        Удалить все ключи, начинающиеся с prefix
+        """
+        pass
+
+    async def setup(self) -> None:
+        """
+        Открыть соединение заранее, до первого запроса
+        """
+        pass
+
+    async def close(self) -> None:
+        """
+        Освободить соединения
+        """
+        pass
@@ -0,0 +1,177 @@
+import enum
+import hashlib
+import json
+from datetime import date, datetime
+from itertools import chain
+from typing import Any, Callable, Iterable, Type, TypeVar
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.infrastructure.cache.backend import cache_backend
+from app.infrastructure.cache.base import CacheBackend
+from app.infrastructure.database.entity_base import BaseEntity
+
+T = TypeVar("T", bound=BaseEntity)
+
+# Ключи, измененные в текущей транзакции сессии: удаляются из кеша после коммита
+_PENDING_KEY = "cache_invalidate"
+
+
+def _decoder(column) -> Callable[[Any], Any]:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return lambda value: value
+    if python_type is datetime:
+        return datetime.fromisoformat
+    if python_type is date:
+        return date.fromisoformat
+    if python_type is UUID or issubclass(python_type, enum.Enum):
+        return python_type
+    return lambda value: value
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Unsupported cache value: {type(value)}")
+
+
+class _Layout:
+    """Порядок и типы колонок модели для компактной сериализации"""
+
+    def __init__(self, model: Type[BaseEntity]):
+        self.keys: list[str] = []
+        self.decoders: list[Callable[[Any], Any]] = []
+        signature = []
+        for prop in inspect(model).column_attrs:
+            column = prop.columns[0]
+            self.keys.append(prop.key)
+            self.decoders.append(_decoder(column))
+            signature.append(f"{prop.key}:{column.type}")
+        # При изменении схемы меняется ключ, старые записи просто истекают
+        self.version = hashlib.sha1(",".join(signature).encode()).hexdigest()[:8]
+
+    def dump(self, obj: BaseEntity) -> bytes:
+        values = [getattr(obj, key) for key in self.keys]
+        return json.dumps(values, separators=(",", ":"), default=_encode_value).encode()
+
+    def load(self, raw: bytes) -> dict[str, Any]:
+        values = json.loads(raw)
+        if len(values) != len(self.keys):
+            raise ValueError("Cached row does not match model layout")
+        return {
+            key: None if value is None else decode(value)
+            for key, decode, value in zip(self.keys, self.decoders, values)
+        }
+
+
+class EntityCache:
+    """
+    Read-through кеш сущностей по id поверх CacheBackend.
+    Кешируются только таблицы, для которых задан ttl. Строка хранится
+    JSON-массивом значений колонок, из кеша восстанавливается
+    ORM-объект, привязанный к сессии как загруженный из БД.
+    """
+
+    def __init__(self, backend: CacheBackend, prefix: str, ttl: dict[str, int]):
+        self.backend = backend
+        self._prefix = prefix
+        self._ttl = ttl
+        self._layouts: dict[type, _Layout] = {}
+
+    def is_cached(self, model: Type[BaseEntity]) -> bool:
+        return model.__tablename__ in self._ttl
+
+    def _layout(self, model: Type[BaseEntity]) -> _Layout:
+        layout = self._layouts.get(model)
+        if layout is None:
+            layout = self._layouts[model] = _Layout(model)
+        return layout
+
+    def key(self, model: Type[BaseEntity], obj_id: UUID) -> str:
+        version = self._layout(model).version
+        return f"{self._prefix}{model.__tablename__}:{version}:{obj_id}"
+
+    def _is_pending(self, session: AsyncSession, key: str) -> bool:
+        return key in session.info.get(_PENDING_KEY, ())
+
+    async def get(self, session: AsyncSession, model: Type[T], obj_id: UUID) -> T | None:
+        """Объект из identity map или кеша, None - идти в БД"""
+        identity = inspect(model).identity_key_from_primary_key((obj_id,))
+        obj = session.identity_map.get(identity)
+        if obj is not None:
+            return None if inspect(obj).expired_attributes else obj
+
+        key = self.key(model, obj_id)
+        # Внутри транзакции, изменившей объект, читаем только из БД
+        if self._is_pending(session, key):
+            return None
+        raw = await self.backend.get(key)
+        if raw is None:
+            return None
+        try:
+            values = self._layout(model).load(raw)
+        except (ValueError, TypeError, KeyError):
+            await self.backend.delete(key)
+            return None
+
+        obj = model(**values)
+        make_transient_to_detached(obj)
+        session.add(obj)
+        return obj
+
+    async def set(self, session: AsyncSession, obj: BaseEntity) -> None:
+        model = type(obj)
+        key = self.key(model, obj.id)
+        # Незакоммиченные изменения не должны попасть в общий кеш
+        if self._is_pending(session, key):
+            return
+        ttl = self._ttl[model.__tablename__]
+        await self.backend.set(key, self._layout(model).dump(obj), ttl)
+
+    def invalidate(
+        self, session: AsyncSession | Session, model: Type[BaseEntity], ids: Iterable[UUID]
+    ) -> None:
+        """Пометить объекты измененными, из кеша они удалятся после коммита"""
+        if not self.is_cached(model):
+            return
+        keys = [self.key(model, obj_id) for obj_id in ids]
+        if keys:
+            session.info.setdefault(_PENDING_KEY, set()).update(keys)
+
+    async def flush(self, session: AsyncSession) -> None:
+        """Удалить из кеша ключи, измененные закоммиченной транзакцией"""
+        keys = session.info.pop(_PENDING_KEY, None)
+        if keys:
+            await self.backend.delete(*keys)
+
+
+entity_cache = EntityCache(
+    backend=cache_backend,
+    prefix=settings.cache.prefix,
+    ttl=settings.cache.ttl if settings.cache.enabled else {},
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed(session: Session, flush_context) -> None:
+    # Изменения через объекты ORM (create/update/delete репозитория, setattr в
+    # сервисах). Новые строки тоже помечаются, чтобы незакоммиченная вставка
+    # не попала в кеш при чтении в той же транзакции
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, BaseEntity):
+            entity_cache.invalidate(session, type(obj), [obj.id])
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    # Откат всей транзакции сессии: изменений в БД не было, чистить кеш нечего
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
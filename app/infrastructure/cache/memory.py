@@ -0,0 +1,44 @@
+import time
+from collections import OrderedDict
+
+from app.infrastructure.cache.base import CacheBackend
+
+
+class InMemoryCache(CacheBackend):
+    """
+    Кеш в памяти процесса (LRU с истечением по времени).
+    Подходит для тестов и запуска в один процесс: инвалидация не видна
+    другим воркерам, для нескольких процессов нужен Redis.
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self._max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._data if key.startswith(prefix)]:
+            del self._data[key]
+
+    async def close(self) -> None:
+        self._data.clear()
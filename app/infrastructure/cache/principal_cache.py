@@ -0,0 +1,88 @@
+import time
+from itertools import chain
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.infrastructure.cache.backend import cache_backend
+from app.infrastructure.cache.base import CacheBackend
+from app.infrastructure.database.models import CuratorModel
+
+# Кураторы, измененные в текущей транзакции сессии
+_PENDING_KEY = "principal_invalidate"
+
+
+class PrincipalCache:
+    """
+    Кеш проверенных access-токенов: запись principal:{curator_id}:{jti}
+    значит, что куратор существует и токен не отозван. Отозванные при
+    logout токены хранятся отдельно до истечения срока токена, чтобы
+    сброс записей куратора не возвращал им силу.
+    """
+
+    def __init__(self, backend: CacheBackend, prefix: str, ttl: int):
+        self.backend = backend
+        self._prefix = prefix
+        self._ttl = ttl
+
+    def _curator_prefix(self, curator_id: UUID) -> str:
+        return f"{self._prefix}principal:{curator_id}:"
+
+    def _key(self, curator_id: UUID, jti: str) -> str:
+        return f"{self._curator_prefix(curator_id)}{jti}"
+
+    def _revoked_key(self, jti: str) -> str:
+        return f"{self._prefix}principal_revoked:{jti}"
+
+    async def check(self, curator_id: UUID, jti: str) -> tuple[bool, bool]:
+        """
+        Проверенный ли токен и отозван ли он, одним запросом к кешу.
+        Отзыв важнее: запрос, проверивший токен параллельно с logout,
+        мог записать principal уже после отзыва.
+        """
+        valid, revoked = await self.backend.get_many(
+            self._key(curator_id, jti), self._revoked_key(jti)
+        )
+        return valid is not None, revoked is not None
+
+    async def set_valid(self, curator_id: UUID, jti: str) -> None:
+        await self.backend.set(self._key(curator_id, jti), b"1", self._ttl)
+
+    async def revoke(self, curator_id: UUID, jti: str, expires_at: int) -> None:
+        """Отозвать access-токен до момента его истечения (unix time)"""
+        ttl = expires_at - int(time.time())
+        if ttl > 0:
+            await self.backend.set(self._revoked_key(jti), b"1", ttl)
+        await self.backend.delete(self._key(curator_id, jti))
+
+    def invalidate(self, session: AsyncSession | Session, curator_ids: Iterable[UUID]) -> None:
+        """Пометить кураторов измененными, их записи удалятся после коммита"""
+        session.info.setdefault(_PENDING_KEY, set()).update(curator_ids)
+
+    async def flush(self, session: AsyncSession) -> None:
+        for curator_id in session.info.pop(_PENDING_KEY, ()):
+            await self.backend.delete_prefix(self._curator_prefix(curator_id))
+
+
+principal_cache = PrincipalCache(
+    backend=cache_backend,
+    prefix=settings.cache.prefix,
+    ttl=settings.cache.principal_ttl,
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_flushed(session: Session, flush_context) -> None:
+    for obj in chain(session.dirty, session.deleted):
+        if isinstance(obj, CuratorModel):
+            principal_cache.invalidate(session, [obj.id])
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
@@ -1 +1,73 @@
-# Здесь может быть реализация для redis, кеширование данных
\ No newline at end of file
+import logging
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.infrastructure.cache.base import CacheBackend
+
+logger = logging.getLogger("redis_cache")
+
+
+class RedisCache(CacheBackend):
+    """
+    Кеш в Redis. Ошибки Redis не пробрасываются: при недоступности
+    кеша запросы идут напрямую в БД.
+    """
+
+    def __init__(self, url: str, timeout: float = 0.5):
+        # Короткий таймаут: медленный Redis не должен тормозить ответы
+        self._client = Redis.from_url(
+            url, socket_timeout=timeout, socket_connect_timeout=timeout
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            return await self._client.get(key)
+        except RedisError as e:
+            logger.warning(f"Redis GET {key} failed: {e}")
+            return None
+
+    async def get_many(self, *keys: str) -> list[bytes | None]:
+        # Один MGET вместо запроса на каждый ключ
+        try:
+            return await self._client.mget(keys)
+        except RedisError as e:
+            logger.warning(f"Redis MGET {keys} failed: {e}")
+            return [None] * len(keys)
+
+    async def set(self, key: str, value: bytes, ttl: int) -> None:
+        try:
+            await self._client.set(key, value, ex=ttl)
+        except RedisError as e:
+            logger.warning(f"Redis SET {key} failed: {e}")
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self._client.delete(*keys)
+        except RedisError as e:
+            logger.warning(f"Redis DEL {keys} failed: {e}")
+
+    async def delete_prefix(self, prefix: str) -> None:
+        # SCAN вместо KEYS, чтобы не блокировать Redis на большой базе
+        try:
+            batch = []
+            async for key in self._client.scan_iter(match=f"{prefix}*", count=500):
+                batch.append(key)
+                if len(batch) >= 500:
+                    await self._client.delete(*batch)
+                    batch.clear()
+            if batch:
+                await self._client.delete(*batch)
+        except RedisError as e:
+            logger.warning(f"Redis delete by prefix {prefix} failed: {e}")
+
+    async def setup(self) -> None:
+        try:
+            await self._client.ping()
+        except RedisError as e:
+            logger.warning(f"Redis is unavailable on startup: {e}")
+
+    async def close(self) -> None:
+        await self._client.aclose()
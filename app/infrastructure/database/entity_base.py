@@ -10,6 +10,9 @@ class BaseEntity(Base):
     """Базовый класс для основных сущностей (с id, датами, аудит)"""
 
     __abstract__ = True
+    # Серверные значения (created_at, updated_at) возвращаются через RETURNING
+    # в самом INSERT/UPDATE, без отдельного SELECT после записи
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
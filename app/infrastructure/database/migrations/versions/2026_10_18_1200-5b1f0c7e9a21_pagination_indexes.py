@@ -0,0 +1,36 @@
+"""pagination indexes
+
+Revision ID: 5b1f0c7e9a21
+Revises: 74459f8b88a7
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b1f0c7e9a21'
+down_revision: Union[str, Sequence[str], None] = '74459f8b88a7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_teams_created_at_id', 'teams', ['created_at', 'id'], unique=False)
+    op.create_index('ix_students_created_at_id', 'students', ['created_at', 'id'], unique=False)
+    op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'], unique=False)
+    op.create_index('ix_curators_created_at_id', 'curators', ['created_at', 'id'], unique=False)
+    op.create_index('ix_meetings_date_id', 'meetings', ['date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_meetings_date_id', table_name='meetings')
+    op.drop_index('ix_curators_created_at_id', table_name='curators')
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
+    op.drop_index('ix_students_created_at_id', table_name='students')
+    op.drop_index('ix_teams_created_at_id', table_name='teams')
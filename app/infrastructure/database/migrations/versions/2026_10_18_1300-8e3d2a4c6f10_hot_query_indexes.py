@@ -0,0 +1,36 @@
+"""hot query indexes
+
+Revision ID: 8e3d2a4c6f10
+Revises: 5b1f0c7e9a21
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3d2a4c6f10'
+down_revision: Union[str, Sequence[str], None] = '5b1f0c7e9a21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_meetings_team_id_status_date', 'meetings', ['team_id', 'status', 'date'], unique=False)
+    op.create_index('ix_meetings_team_id_date', 'meetings', ['team_id', 'date'], unique=False)
+    op.create_index('ix_project_teams_team_id_status', 'project_teams', ['team_id', 'status'], unique=False)
+    op.create_index(op.f('ix_meeting_tasks_task_id'), 'meeting_tasks', ['task_id'], unique=False)
+    op.create_index(op.f('ix_team_members_student_id'), 'team_members', ['student_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_team_members_student_id'), table_name='team_members')
+    op.drop_index(op.f('ix_meeting_tasks_task_id'), table_name='meeting_tasks')
+    op.drop_index('ix_project_teams_team_id_status', table_name='project_teams')
+    op.drop_index('ix_meetings_team_id_date', table_name='meetings')
+    op.drop_index('ix_meetings_team_id_status_date', table_name='meetings')
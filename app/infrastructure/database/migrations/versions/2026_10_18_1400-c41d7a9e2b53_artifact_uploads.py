@@ -0,0 +1,47 @@
+"""artifact uploads
+
+Revision ID: c41d7a9e2b53
+Revises: 8e3d2a4c6f10
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7a9e2b53'
+down_revision: Union[str, Sequence[str], None] = '8e3d2a4c6f10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('artifacts', sa.Column('storage_key', sa.String(length=1024), nullable=True))
+    op.add_column('artifacts', sa.Column('size', sa.BigInteger(), nullable=True))
+    op.add_column('artifacts', sa.Column('content_type', sa.String(length=255), nullable=True))
+
+    # Составной PK (artifact_id, project_id) не давал привязать артефакт к встрече
+    op.drop_constraint('pk_artifact_links', 'artifact_links', type_='primary')
+    op.add_column(
+        'artifact_links',
+        sa.Column('id', sa.UUID(), server_default=sa.text('gen_random_uuid()'), nullable=False),
+    )
+    op.create_primary_key('pk_artifact_links', 'artifact_links', ['id'])
+    op.alter_column('artifact_links', 'id', server_default=None)
+    op.alter_column('artifact_links', 'project_id', existing_type=sa.UUID(), nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM artifact_links WHERE project_id IS NULL")
+    op.alter_column('artifact_links', 'project_id', existing_type=sa.UUID(), nullable=False)
+    op.drop_constraint('pk_artifact_links', 'artifact_links', type_='primary')
+    op.drop_column('artifact_links', 'id')
+    op.create_primary_key('pk_artifact_links', 'artifact_links', ['artifact_id', 'project_id'])
+    op.drop_column('artifacts', 'content_type')
+    op.drop_column('artifacts', 'size')
+    op.drop_column('artifacts', 'storage_key')
@@ -23,8 +23,12 @@ from app.infrastructure.database.models.meetings import (
 )
 from app.infrastructure.database.models.artifacts import (
     ArtifactModel,
+    ArtifactBlobModel,
     ArtifactLinkModel,
+    MultipartUploadModel,
+    MultipartUploadPartModel,
 )
+from app.infrastructure.database.models.outbox import OutboxEventModel
 from app.infrastructure.database.models.auth_tokens import (
     OAuthTokenModel,
     RefreshTokenModel
@@ -51,7 +55,12 @@ __all__ = [
     "MeetingTaskModel",
     # Artifacts
     "ArtifactModel",
+    "ArtifactBlobModel",
     "ArtifactLinkModel",
+    "MultipartUploadModel",
+    "MultipartUploadPartModel",
+    # Outbox
+    "OutboxEventModel",
     # Auth_Tokens
     "OAuthTokenModel",
     "RefreshTokenModel",
@@ -1,5 +1,16 @@
 from app.infrastructure.database.models.artifacts.artifact import ArtifactModel
+from app.infrastructure.database.models.artifacts.artifact_blob import ArtifactBlobModel
 from app.infrastructure.database.models.artifacts.artifact_link import ArtifactLinkModel
+from app.infrastructure.database.models.artifacts.multipart_upload import MultipartUploadModel
+from app.infrastructure.database.models.artifacts.multipart_upload_part import (
+    MultipartUploadPartModel,
+)
 
-__all__ = ["ArtifactModel", "ArtifactLinkModel"]
+__all__ = [
+    "ArtifactModel",
+    "ArtifactBlobModel",
+    "ArtifactLinkModel",
+    "MultipartUploadModel",
+    "MultipartUploadPartModel",
+]
 
@@ -1,8 +1,10 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Enum as SQLEnum
+from sqlalchemy import BigInteger, ForeignKey, Index, String, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import UUID
 
 from app.infrastructure.database.entity_base import BaseEntity
+from app.domain.enums.artifact_status import ArtifactStatus
 from app.domain.enums.artifact_type import ArtifactType
 
 if TYPE_CHECKING:
@@ -25,6 +27,29 @@ class ArtifactModel(BaseEntity):
     )
     # URL артефакта
     url: Mapped[str] = mapped_column(String(512), nullable=False)
+    # Статус файла: пока PROCESSING, storage_key указывает на загруженную копию
+    status: Mapped[ArtifactStatus] = mapped_column(
+        SQLEnum(ArtifactStatus, native_enum=False,
+        values_callable=lambda x: [e.value for e in ArtifactStatus]),
+        nullable=False,
+        default=ArtifactStatus.READY,
+        server_default=ArtifactStatus.READY.value,
+    )
+    # Содержимое файла; одно содержимое разделяют артефакты разных загрузок
+    blob_id: Mapped[UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("artifact_blobs.id", ondelete="RESTRICT"),
+        nullable=True,
+        index=True,
+    )
+    # Ключ объекта в бакете артефактов (для FILE и VIDEO)
+    storage_key: Mapped[str | None] = mapped_column(String(1024), nullable=True)
+    # Размер файла в байтах
+    size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    # MIME-тип файла
+    content_type: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # SHA-256 содержимого (hex), копия из artifact_blobs для ответов API
+    sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
     # Связь с ссылкой на артефакт
     artifact_links: Mapped[list["ArtifactLinkModel"]] = relationship(
         "ArtifactLinkModel",
@@ -32,3 +57,7 @@ class ArtifactModel(BaseEntity):
         cascade="all, delete-orphan",
     )
 
+    __table_args__ = (
+        # Поиск артефактов, зависших в обработке, фоновой очисткой
+        Index("ix_artifacts_status_updated_at", "status", "updated_at"),
+    )
@@ -0,0 +1,22 @@
+from sqlalchemy import BigInteger, Boolean, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.infrastructure.database.entity_base import BaseEntity
+
+
+class ArtifactBlobModel(BaseEntity):
+    """Модель содержимого файла: один объект в S3 на одинаковые файлы"""
+    __tablename__ = "artifact_blobs"
+
+    # SHA-256 содержимого (hex)
+    sha256: Mapped[str] = mapped_column(String(64), nullable=False, unique=True)
+    # Ключ объекта в бакете артефактов, по хешу
+    storage_key: Mapped[str] = mapped_column(String(1024), nullable=False)
+    # Размер файла в байтах
+    size: Mapped[int | None] = mapped_column(BigInteger, nullable=True)
+    # MIME-тип первой загрузки
+    content_type: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    # Число артефактов с этим содержимым; на нуле объект удаляется
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Объект уже скопирован под storage_key
+    stored: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
@@ -1,3 +1,4 @@
+import uuid
 from typing import TYPE_CHECKING
 from sqlalchemy import ForeignKey, PrimaryKeyConstraint, UniqueConstraint, CheckConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -15,21 +16,25 @@ class ArtifactLinkModel(Base):
     """Модель связи артефакта с проектом или встречей"""
     __tablename__ = "artifact_links" 
     
+    # Суррогатный ключ: в связи заполнен либо проект, либо встреча
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        primary_key=True,
+        default=uuid.uuid4,
+    )
     # FK на артефакт
     artifact_id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("artifacts.id", ondelete="CASCADE"),
         nullable=False,
         index=True,
-        primary_key=True,
     )
     # FK на проект (nullable)
     project_id: Mapped[UUID | None] = mapped_column(
         UUID(as_uuid=True),
         ForeignKey("projects.id", ondelete="CASCADE"),
-        nullable=False,
+        nullable=True,
         index=True,
-        primary_key=True,
     )
     # FK на встречу (nullable)
     meeting_id: Mapped[UUID | None] = mapped_column(
@@ -46,9 +51,9 @@ class ArtifactLinkModel(Base):
             "(project_id IS NULL AND meeting_id IS NOT NULL)",
             name="ck_artifact_links_one_fk"
         ),
-        # Составной PK для связи с проектом
+        # Артефакт привязан к проекту не больше одного раза
         UniqueConstraint("artifact_id", "project_id", name="uq_artifact_links_artifact_project"),
-        # Составной PK для связи со встречей
+        # Артефакт привязан к встрече не больше одного раза
         UniqueConstraint("artifact_id", "meeting_id", name="uq_artifact_links_artifact_meeting"),
     )
     
@@ -0,0 +1,72 @@
+from typing import TYPE_CHECKING
+from sqlalchemy import BigInteger, ForeignKey, Index, String, Enum as SQLEnum
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.infrastructure.database.entity_base import BaseEntity
+from app.domain.enums.upload_status import UploadStatus
+
+if TYPE_CHECKING:
+    from app.infrastructure.database.models.artifacts.multipart_upload_part import (
+        MultipartUploadPartModel,
+    )
+
+
+class MultipartUploadModel(BaseEntity):
+    """Модель составной (multipart) загрузки файла встречи в S3"""
+    __tablename__ = "multipart_uploads"
+
+    # FK на встречу, к которой относится файл
+    meeting_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("meetings.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    # Ключ объекта в бакете артефактов
+    storage_key: Mapped[str] = mapped_column(String(1024), nullable=False)
+    # Идентификатор загрузки, выданный S3
+    s3_upload_id: Mapped[str] = mapped_column(String(1024), nullable=False)
+    # Исходное имя файла
+    filename: Mapped[str] = mapped_column(String(255), nullable=False)
+    # MIME-тип файла
+    content_type: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Полный размер файла в байтах
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Размер части (последняя часть может быть меньше)
+    part_size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Статус загрузки
+    status: Mapped[UploadStatus] = mapped_column(
+        SQLEnum(UploadStatus, native_enum=False,
+        values_callable=lambda x: [e.value for e in UploadStatus]),
+        nullable=False,
+        default=UploadStatus.IN_PROGRESS,
+    )
+    # Созданный после завершения артефакт
+    artifact_id: Mapped[UUID | None] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("artifacts.id", ondelete="SET NULL"),
+        nullable=True,
+    )
+    # Загруженные части
+    parts: Mapped[list["MultipartUploadPartModel"]] = relationship(
+        "MultipartUploadPartModel",
+        back_populates="upload",
+        cascade="all, delete-orphan",
+        order_by="MultipartUploadPartModel.part_number",
+    )
+
+    __table_args__ = (
+        # Поиск зависших загрузок фоновой очисткой
+        Index("ix_multipart_uploads_status_updated_at", "status", "updated_at"),
+    )
+
+    @property
+    def part_count(self) -> int:
+        return -(-self.size // self.part_size)
+
+    def expected_part_size(self, part_number: int) -> int:
+        """Размер части с номером part_number (нумерация с 1)"""
+        if part_number < self.part_count:
+            return self.part_size
+        return self.size - (self.part_count - 1) * self.part_size
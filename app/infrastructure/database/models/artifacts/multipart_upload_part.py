@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import TYPE_CHECKING
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.dialects.postgresql import UUID
+
+from app.infrastructure.database.base import Base
+
+if TYPE_CHECKING:
+    from app.infrastructure.database.models.artifacts.multipart_upload import MultipartUploadModel
+
+
+class MultipartUploadPartModel(Base):
+    """Модель загруженной части составной загрузки"""
+    __tablename__ = "multipart_upload_parts"
+
+    # FK на загрузку
+    upload_id: Mapped[UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("multipart_uploads.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    # Номер части, начиная с 1
+    part_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # ETag части из ответа S3, нужен для завершения загрузки
+    etag: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Размер части в байтах
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    # Время последней загрузки части (по нему определяются зависшие загрузки)
+    uploaded_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+
+    upload: Mapped["MultipartUploadModel"] = relationship(
+        "MultipartUploadModel",
+        back_populates="parts",
+    )
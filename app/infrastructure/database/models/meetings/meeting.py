@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import String, DateTime, ForeignKey, Enum as SQLEnum
+from sqlalchemy import String, DateTime, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -48,6 +48,15 @@ class MeetingModel(BaseEntity):
         ForeignKey("teams.id", ondelete="CASCADE"),
         nullable=False,
     )
+
+    __table_args__ = (
+        # Ключ курсорной пагинации списка встреч (сортировка по дате)
+        Index("ix_meetings_date_id", "date", "id"),
+        # Встречи команды по статусу и дате (ближайшая/последняя встреча)
+        Index("ix_meetings_team_id_status_date", "team_id", "status", "date"),
+        # Все встречи команды в порядке даты
+        Index("ix_meetings_team_id_date", "team_id", "date"),
+    )
     # Связь с командой на встрече
     team: Mapped["TeamModel"] = relationship(
         "TeamModel",
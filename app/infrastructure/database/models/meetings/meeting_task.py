@@ -26,6 +26,8 @@ class MeetingTaskModel(BaseEntity):
         UUID(as_uuid=True),
         ForeignKey("tasks.id", ondelete="CASCADE"),
         primary_key=True,
+        # Первичный ключ начинается с meeting_id, для поиска по задаче нужен свой индекс
+        index=True,
     )
 
     # Связь с встречей
@@ -0,0 +1,5 @@
+from app.infrastructure.database.models.outbox.outbox_event import OutboxEventModel
+
+__all__ = [
+    "OutboxEventModel",
+]
@@ -0,0 +1,35 @@
+from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, Identity, Index, Integer, String, Text, func
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.dialects.postgresql import JSONB
+
+from app.infrastructure.database.base import Base
+
+
+class OutboxEventModel(Base):
+    """
+    Доменное событие, записанное в той же транзакции, что и изменение данных.
+    Строка удаляется после доставки, в таблице остаются только ожидающие
+    и не доставленные за max_attempts попыток события.
+    """
+    __tablename__ = "outbox_events"
+
+    # Порядок записи, события доставляются по возрастанию
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    # Имя класса события, например MeetingCompleted
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    )
+    # Неудачные попытки доставки и последняя ошибка
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    __table_args__ = (
+        # Выборка ожидающих событий relay: недоставленные за max_attempts
+        # попыток копятся в начале таблицы и не просматриваются при опросе
+        Index("ix_outbox_events_attempts_id", "attempts", "id"),
+    )
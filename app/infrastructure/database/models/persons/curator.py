@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import String
+from sqlalchemy import String, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.infrastructure.database.models.persons.person import PersonModel
 
@@ -21,6 +21,11 @@ class CuratorModel(PersonModel):
 
     avatar_s3_path: Mapped[str] = mapped_column(String(255), nullable=True)
 
+    __table_args__ = (
+        # Ключ курсорной пагинации списка кураторов
+        Index("ix_curators_created_at_id", "created_at", "id"),
+    )
+
     # Команды, для которых является куратором (M2M)
     teams: Mapped[list["TeamModel"]] = relationship(
         "TeamModel",
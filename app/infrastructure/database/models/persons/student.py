@@ -1,4 +1,5 @@
 from typing import TYPE_CHECKING
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, relationship
 from app.infrastructure.database.models.persons.person import PersonModel
 
@@ -11,6 +12,11 @@ class StudentModel(PersonModel):
     """Модель студента"""
     __tablename__ = "students"
 
+    __table_args__ = (
+        # Ключ курсорной пагинации списка студентов
+        Index("ix_students_created_at_id", "created_at", "id"),
+    )
+
     # Связь с командой
     team_links: Mapped[list["TeamMemberModel"]] = relationship(
         "TeamMemberModel",
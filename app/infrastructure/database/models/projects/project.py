@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import String, Integer, Enum as SQLEnum
+from sqlalchemy import String, Integer, Index, Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.infrastructure.database.entity_base import BaseEntity
@@ -40,6 +40,11 @@ class ProjectModel(BaseEntity):
         SQLEnum(ProjectStatus, native_enum=False, values_callable=lambda x: [e.value for e in ProjectStatus]),
         nullable=False,
     )
+
+    __table_args__ = (
+        # Ключ курсорной пагинации списка проектов
+        Index("ix_projects_created_at_id", "created_at", "id"),
+    )
     
     # Вехи проекта
     milestones: Mapped[list["MilestoneModel"]] = relationship(
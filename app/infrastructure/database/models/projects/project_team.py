@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
-from sqlalchemy import DateTime, ForeignKey, UniqueConstraint, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, UniqueConstraint, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy import Enum as SQLEnum
@@ -49,6 +49,8 @@ class ProjectTeamModel(BaseEntity):
     __table_args__ = (
         UniqueConstraint("project_id", "team_id", name="uq_project_teams_project_team"),
         # Обеспечиваем уникальность пары project_id + team_id
+        # Проекты команды с фильтром по статусу
+        Index("ix_project_teams_team_id_status", "team_id", "status"),
     )
     
     # Связь с проектом
@@ -1,5 +1,5 @@
 from typing import TYPE_CHECKING
-from sqlalchemy import String, ForeignKey
+from sqlalchemy import String, ForeignKey, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -23,6 +23,11 @@ class TeamModel(BaseEntity):
     
     # Ссылка на группу (например, чат команды)
     group_link: Mapped[str | None] = mapped_column(String(512), nullable=True)
+
+    __table_args__ = (
+        # Ключ курсорной пагинации списка команд
+        Index("ix_teams_created_at_id", "created_at", "id"),
+    )
     
     # Участники команды (связующая таблица team_members)
     members: Mapped[list["TeamMemberModel"]] = relationship(
@@ -25,6 +25,8 @@ class TeamMemberModel(BaseEntity):
         UUID(as_uuid=True),
         ForeignKey("students.id", ondelete="CASCADE"),
         primary_key=True,
+        # Первичный ключ начинается с team_id, для поиска команд студента нужен свой индекс
+        index=True,
     )
     # Роль студента в команде
     role: Mapped[str | None] = mapped_column(String(100), nullable=True)
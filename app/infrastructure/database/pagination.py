@@ -0,0 +1,20 @@
+import base64
+import json
+from datetime import datetime
+from uuid import UUID
+
+
+def encode_cursor(value: datetime, obj_id: UUID) -> str:
+    """Собрать непрозрачный курсор из ключа сортировки и id последней записи"""
+    raw = json.dumps([value.isoformat(), str(obj_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Разобрать курсор обратно в пару (ключ сортировки, id)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, obj_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(value), UUID(obj_id)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
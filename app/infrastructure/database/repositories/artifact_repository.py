@@ -0,0 +1,160 @@
+from datetime import datetime
+from typing import Sequence
+from uuid import UUID
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import Depends
+
+from app.domain.enums.artifact_status import ArtifactStatus
+from app.infrastructure.database.repositories.base_repository import BaseRepository
+from app.infrastructure.database.models.artifacts.artifact import ArtifactModel
+from app.infrastructure.database.models.artifacts.artifact_blob import ArtifactBlobModel
+from app.infrastructure.database.models.artifacts.artifact_link import ArtifactLinkModel
+from app.core.database import db_helper
+
+
+class ArtifactRepository(BaseRepository[ArtifactModel]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(ArtifactModel, session)
+
+    async def get_by_meeting_id(self, meeting_id: UUID) -> Sequence[ArtifactModel]:
+        """Получить все артефакты встречи"""
+        query = (
+            select(ArtifactModel)
+            .join(ArtifactLinkModel, ArtifactModel.id == ArtifactLinkModel.artifact_id)
+            .where(ArtifactLinkModel.meeting_id == meeting_id)
+            .order_by(ArtifactModel.created_at.asc())
+        )
+        result = await self.session.scalars(query)
+        return result.all()
+
+    async def get_stale_processing_locked(
+        self, cutoff: datetime, limit: int
+    ) -> Sequence[ArtifactModel]:
+        """
+        Артефакты в PROCESSING без изменений после cutoff: задача обработки
+        потеряна или еще не дошла. SKIP LOCKED, как у очистки составных загрузок
+        """
+        query = (
+            select(ArtifactModel)
+            .where(
+                ArtifactModel.status == ArtifactStatus.PROCESSING,
+                ArtifactModel.updated_at < cutoff,
+            )
+            .order_by(ArtifactModel.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.scalars(query)
+        return result.all()
+
+    async def touch(self, ids: Sequence[UUID]) -> None:
+        """Обновить updated_at, не меняя строк"""
+        if not ids:
+            return
+        await self.session.execute(
+            update(ArtifactModel).where(ArtifactModel.id.in_(ids)).values(updated_at=func.now())
+        )
+        self._invalidate(ids)
+
+    async def fail_processing(self, artifact_id: UUID) -> bool:
+        """
+        Перевести артефакт из PROCESSING в FAILED. False: артефакт уже
+        обработан другим запуском задачи, удален или уже FAILED
+        """
+        result = await self.session.execute(
+            update(ArtifactModel)
+            .where(
+                ArtifactModel.id == artifact_id,
+                ArtifactModel.status == ArtifactStatus.PROCESSING,
+            )
+            .values(status=ArtifactStatus.FAILED)
+        )
+        self._invalidate([artifact_id])
+        return result.rowcount == 1
+
+    async def lock_content(self, sha256: str) -> None:
+        """
+        Транзакционная advisory-блокировка содержимого: привязка файла и
+        удаление последней ссылки на него не выполняются одновременно
+        """
+        await self.session.execute(select(func.pg_advisory_xact_lock(int(sha256[:15], 16))))
+
+    async def get_blob(self, sha256: str) -> ArtifactBlobModel | None:
+        result = await self.session.scalars(
+            select(ArtifactBlobModel).where(ArtifactBlobModel.sha256 == sha256)
+        )
+        return result.one_or_none()
+
+    async def get_blob_by_id(self, blob_id: UUID) -> ArtifactBlobModel | None:
+        return await self.session.get(ArtifactBlobModel, blob_id)
+
+    async def create_blob(self, blob: ArtifactBlobModel) -> ArtifactBlobModel:
+        self.session.add(blob)
+        await self.session.flush()
+        return blob
+
+    async def attach_blob(self, artifact_id: UUID, blob: ArtifactBlobModel) -> bool:
+        """
+        Привязать артефакт к содержимому, если он еще не привязан.
+        False: привязку уже сделала повторная доставка той же задачи
+        """
+        result = await self.session.execute(
+            update(ArtifactModel)
+            .where(ArtifactModel.id == artifact_id, ArtifactModel.blob_id.is_(None))
+            .values(blob_id=blob.id, sha256=blob.sha256)
+        )
+        return result.rowcount == 1
+
+    async def add_blob_refs(self, blob_id: UUID, delta: int) -> int:
+        """Изменить счетчик ссылок на содержимое, вернуть новое значение"""
+        return await self.session.scalar(
+            update(ArtifactBlobModel)
+            .where(ArtifactBlobModel.id == blob_id)
+            .values(ref_count=ArtifactBlobModel.ref_count + delta)
+            .returning(ArtifactBlobModel.ref_count)
+        )
+
+    async def mark_blob_stored(self, blob_id: UUID) -> None:
+        await self.session.execute(
+            update(ArtifactBlobModel)
+            .where(ArtifactBlobModel.id == blob_id)
+            .values(stored=True)
+        )
+
+    async def delete_blob(self, blob_id: UUID) -> None:
+        await self.session.execute(delete(ArtifactBlobModel).where(ArtifactBlobModel.id == blob_id))
+
+    async def get_meeting_link(
+        self, artifact_id: UUID, meeting_id: UUID
+    ) -> ArtifactLinkModel | None:
+        result = await self.session.scalars(
+            select(ArtifactLinkModel).where(
+                ArtifactLinkModel.artifact_id == artifact_id,
+                ArtifactLinkModel.meeting_id == meeting_id,
+            )
+        )
+        return result.one_or_none()
+
+    async def add_meeting_link(self, artifact_id: UUID, meeting_id: UUID) -> ArtifactLinkModel:
+        link = ArtifactLinkModel(artifact_id=artifact_id, meeting_id=meeting_id)
+        self.session.add(link)
+        await self.session.flush()
+        return link
+
+    async def delete_link(self, link_id: UUID) -> None:
+        await self.session.execute(delete(ArtifactLinkModel).where(ArtifactLinkModel.id == link_id))
+
+    async def count_links(self, artifact_id: UUID) -> int:
+        """Число ссылок на артефакт из встреч и проектов"""
+        result = await self.session.scalar(
+            select(func.count()).where(ArtifactLinkModel.artifact_id == artifact_id)
+        )
+        return result or 0
+
+
+def artifact_repository_getter(
+    session: AsyncSession = Depends(db_helper.session_getter),
+) -> ArtifactRepository:
+    repository = ArtifactRepository(session)
+    return repository
@@ -1,16 +1,22 @@
-from typing import Generic, Type, TypeVar, Sequence
+from typing import Any, Callable, Generic, Iterable, Type, TypeVar, Sequence
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import Column, RowMapping, Select, delete, exists, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.domain.interfaces.repositories.repository_interface import (
     RepositoryInterface,
 )
+from app.infrastructure.cache.entity_cache import entity_cache
 from app.infrastructure.database.entity_base import BaseEntity
+from app.infrastructure.database.pagination import decode_cursor, encode_cursor
 
 T = TypeVar("T", bound=BaseEntity)
 
 
 class BaseRepository(RepositoryInterface[T], Generic[T]):
+    # Колонка ключа сортировки для курсорной пагинации (вторая часть ключа - id)
+    cursor_column: str = "created_at"
+
     def __init__(
         self,
         model: Type[T],
@@ -18,32 +24,194 @@ class BaseRepository(RepositoryInterface[T], Generic[T]):
     ):
         self.model = model
         self.session = session
+        # Кеш get_by_id, только для таблиц с ttl в настройках кеша
+        self._cache = entity_cache if entity_cache.is_cached(model) else None
+
+    def _select(self) -> Select:
+        """Базовый запрос списка, наследники добавляют сюда опции загрузки"""
+        return select(self.model)
+
+    def _columns(self, fields: Iterable[str]) -> list[Column]:
+        """Колонки таблицы по именам атрибутов модели"""
+        columns = self.model.__mapper__.columns
+        return [columns[field] for field in fields]
+
+    async def _fetch_rows(self, query: Select) -> Sequence[RowMapping]:
+        """
+        Строки запроса колонок как словари: без ORM-объектов,
+        identity map и отслеживания изменений. Только для чтения
+        """
+        result = await self.session.execute(query)
+        return result.mappings().all()
 
     async def create(self, obj: T) -> T:
         self.session.add(obj)
-        await self.session.commit()
-        await self.session.refresh(obj)
+        await self.session.flush()
         return obj
 
+    async def bulk_create(self, values: Sequence[dict]) -> Sequence[T]:
+        if not values:
+            return []
+        # Многострочный INSERT ... RETURNING, строки возвращаются в порядке values
+        query = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await self.session.scalars(query, list(values))
+        objs = result.all()
+        self._invalidate([obj.id for obj in objs])
+        return objs
+
+    async def bulk_upsert(
+        self,
+        values: Sequence[dict],
+        index_elements: Sequence[str],
+        update_fields: Sequence[str] | None = None,
+    ) -> Sequence[T]:
+        if not values:
+            return []
+        query = pg_insert(self.model)
+        if update_fields:
+            query = query.on_conflict_do_update(
+                index_elements=index_elements,
+                set_={field: query.excluded[field] for field in update_fields},
+            )
+        else:
+            # Без полей для обновления возвращаются только вставленные строки
+            query = query.on_conflict_do_nothing(index_elements=index_elements)
+        query = query.returning(self.model).execution_options(populate_existing=True)
+        result = await self.session.scalars(query, list(values))
+        objs = result.all()
+        self._invalidate([obj.id for obj in objs])
+        return objs
+
     async def get_by_id(self, obj_id: UUID) -> T | None:
+        if self._cache is not None:
+            obj = await self._cache.get(self.session, self.model, obj_id)
+            if obj is not None:
+                return obj
         result = await self.session.execute(
             select(self.model).where(self.model.id == obj_id)
         )
         obj = result.scalar_one_or_none()
+        if obj is not None and self._cache is not None:
+            await self._cache.set(self.session, obj)
         return obj
 
+    async def get_for_update(self, obj_id: UUID) -> T | None:
+        # Мимо кеша: нужна актуальная строка, заблокированная до конца транзакции
+        query = (
+            select(self.model)
+            .where(self.model.id == obj_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.scalars(query)
+        return result.one_or_none()
+
+    def _invalidate(self, ids: Sequence[UUID]) -> None:
+        """Запись запросом мимо unit of work ORM: сбросить кеш после коммита"""
+        if self._cache is not None:
+            self._cache.invalidate(self.session, self.model, ids)
+
     async def update(self, obj: T, new_data: dict) -> T:
         for key, value in new_data.items():
             setattr(obj, key, value)
-        await self.session.commit()
-        await self.session.refresh(obj)
+        await self.session.flush()
         return obj
 
+    async def update_by_id(self, obj_id: UUID, values: dict) -> T | None:
+        if not values:
+            return await self.get_by_id(obj_id)
+        query = (
+            update(self.model)
+            .where(self.model.id == obj_id)
+            .values(**values)
+            .returning(self.model)
+            # Объект из identity map перезаписывается значениями из RETURNING
+            .execution_options(populate_existing=True)
+        )
+        self._invalidate([obj_id])
+        result = await self.session.scalars(query)
+        return result.one_or_none()
+
+    async def exists(self, obj_id: UUID) -> bool:
+        result = await self.session.scalar(
+            select(exists().where(self.model.id == obj_id))
+        )
+        return bool(result)
+
+    async def get_existing_ids(self, ids: Sequence[UUID]) -> set[UUID]:
+        if not ids:
+            return set()
+        result = await self.session.scalars(
+            select(self.model.id).where(self.model.id.in_(ids))
+        )
+        return set(result.all())
+
     async def get_list(self, **filter_attrs) -> Sequence[T] | list[T]:
         query = select(self.model).filter_by(**filter_attrs)
         result = await self.session.scalars(query)
         return result.all()
 
+    def _paginate(self, query: Select, limit: int, cursor: str | None) -> Select:
+        sort_column = getattr(self.model, self.cursor_column)
+        if cursor is not None:
+            value, obj_id = decode_cursor(cursor)
+            query = query.where(
+                tuple_(sort_column, self.model.id) > tuple_(value, obj_id)
+            )
+        # Берем на одну запись больше, чтобы понять, есть ли следующая страница
+        return query.order_by(sort_column.asc(), self.model.id.asc()).limit(limit + 1)
+
+    @staticmethod
+    def _split_page(
+        items: Sequence, limit: int, cursor_key: Callable[[Any], tuple]
+    ) -> tuple[Sequence, str | None]:
+        if len(items) <= limit:
+            return items, None
+        items = items[:limit]
+        return items, encode_cursor(*cursor_key(items[-1]))
+
+    async def get_page(
+        self, limit: int, cursor: str | None = None, **filter_attrs
+    ) -> tuple[Sequence[T], str | None]:
+        query = self._paginate(self._select().filter_by(**filter_attrs), limit, cursor)
+        result = await self.session.scalars(query)
+        return self._split_page(
+            result.all(), limit, lambda obj: (getattr(obj, self.cursor_column), obj.id)
+        )
+
+    async def get_rows_page(
+        self, fields: Iterable[str], limit: int, cursor: str | None = None, **filter_attrs
+    ) -> tuple[Sequence[RowMapping], str | None]:
+        """Страница как в get_page, но строками колонок fields"""
+        # Ключ курсора нужен в строке, даже если его нет среди fields
+        fields = dict.fromkeys([*fields, self.cursor_column, "id"])
+        query = select(*self._columns(fields)).filter_by(**filter_attrs)
+        rows = await self._fetch_rows(self._paginate(query, limit, cursor))
+        return self._split_page(rows, limit, lambda row: (row[self.cursor_column], row["id"]))
+
     async def delete(self, obj: T) -> None:
         await self.session.delete(obj)
-        await self.session.commit()
+        await self.session.flush()
+
+    async def delete_by_id(self, obj_id: UUID) -> bool:
+        # Связанные строки удаляет сама БД (ondelete у внешних ключей)
+        query = (
+            delete(self.model)
+            .where(self.model.id == obj_id)
+            .returning(self.model.id)
+        )
+        self._invalidate([obj_id])
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def bulk_delete(self, ids: Sequence[UUID]) -> Sequence[UUID]:
+        if not ids:
+            return []
+        query = (
+            delete(self.model)
+            .where(self.model.id.in_(ids))
+            .returning(self.model.id)
+        )
+        self._invalidate(ids)
+        result = await self.session.scalars(query)
+        return result.all()
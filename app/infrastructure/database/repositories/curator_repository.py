@@ -1,10 +1,11 @@
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from typing import Sequence
 from sqlalchemy.orm import selectinload
 from app.infrastructure.database.repositories.base_repository import (
     BaseRepository,
 )
+from app.infrastructure.cache.principal_cache import principal_cache
 from app.infrastructure.database.models import CuratorModel
 from app.core.database import db_helper
 from fastapi import Depends
@@ -15,6 +16,9 @@ class CuratorRepository(BaseRepository[CuratorModel]):
     def __init__(self, session: AsyncSession):
         super().__init__(CuratorModel, session)
 
+    def _select(self) -> Select:
+        return select(self.model).options(selectinload(CuratorModel.teams))
+
     async def get_by_id(self, obj_id: UUID) -> CuratorModel | None:
         result = await self.session.execute(
             select(self.model)
@@ -24,6 +28,17 @@ class CuratorRepository(BaseRepository[CuratorModel]):
         obj = result.scalar_one_or_none()
         return obj
 
+    def _invalidate(self, ids: Sequence[UUID]) -> None:
+        super()._invalidate(ids)
+        principal_cache.invalidate(self.session, ids)
+
+    async def update_by_id(self, obj_id: UUID, values: dict) -> CuratorModel | None:
+        obj = await super().update_by_id(obj_id, values)
+        if obj is not None and values:
+            # Команды куратора не входят в RETURNING, догружаем их отдельно
+            await self.session.refresh(obj, attribute_names=["teams"])
+        return obj
+
     async def get_list(
         self, **filter_attrs
     ) -> Sequence[CuratorModel] | list[CuratorModel]:
@@ -1,7 +1,7 @@
-from typing import Sequence, Optional
+from typing import AsyncIterator, Iterable, Sequence, Optional
 from uuid import UUID
 from datetime import datetime
-from sqlalchemy import select, and_, or_, func
+from sqlalchemy import RowMapping, select, and_, or_, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 from sqlalchemy.orm import selectinload
@@ -13,6 +13,8 @@ from app.core.database import db_helper
 
 
 class MeetingRepository(BaseRepository[MeetingModel]):
+    cursor_column = "date"
+
     def __init__(self, session: AsyncSession):
         super().__init__(MeetingModel, session)
 
@@ -38,15 +40,37 @@ class MeetingRepository(BaseRepository[MeetingModel]):
         result = await self.session.scalars(query)
         return result.all()
     
-    async def get_all_ordered_by_date(self) -> Sequence[MeetingModel]:
-        """Получить все встречи всех команд, отсортированные по времени"""
+    async def get_all_ordered_by_date(
+        self, limit: int, cursor: Optional[str] = None
+    ) -> tuple[Sequence[MeetingModel], Optional[str]]:
+        """Получить страницу встреч всех команд, отсортированных по времени"""
+        return await self.get_page(limit, cursor)
+
+    async def get_all_rows_ordered_by_date(
+        self, fields: Iterable[str], limit: int, cursor: Optional[str] = None
+    ) -> tuple[Sequence[RowMapping], Optional[str]]:
+        """То же, что get_all_ordered_by_date, строками колонок fields"""
+        return await self.get_rows_page(fields, limit, cursor)
+
+    async def stream_all_rows_ordered_by_date(
+        self, fields: Iterable[str], batch_size: int
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """
+        Все встречи по времени пачками по batch_size через серверный курсор:
+        в памяти одна пачка, а не вся таблица
+        """
         query = (
-            select(self.model)
-            .order_by(self.model.date.asc())
+            select(*self._columns(fields))
+            .order_by(self.model.date.asc(), self.model.id.asc())
+            .execution_options(yield_per=batch_size)
         )
-
-        result = await self.session.scalars(query)
-        return result.all()
+        result = await self.session.stream(query)
+        try:
+            async for rows in result.mappings().partitions():
+                yield rows
+        finally:
+            # Клиент мог отключиться посреди выгрузки: курсор закрывается сразу
+            await result.close()
 
     async def get_upcoming_meeting(self, team_id: UUID) -> Optional[MeetingModel]:
         """Получить ближайшую запланированную встречу команды"""
@@ -81,13 +105,13 @@ class MeetingRepository(BaseRepository[MeetingModel]):
 
     async def get_meeting_with_tasks(self, meeting_id: UUID) -> Optional[MeetingModel]:
         """Получить встречу с задачами"""
-        from sqlalchemy.orm import selectinload
-        
+        from app.infrastructure.database.models.meetings.meeting_task import MeetingTaskModel
+
         query = (
             select(self.model)
             .where(self.model.id == meeting_id)
             .options(
-                selectinload(self.model.meeting_tasks).selectinload(self.model.meeting_tasks.task)
+                selectinload(self.model.meeting_tasks).selectinload(MeetingTaskModel.task)
             )
         )
         
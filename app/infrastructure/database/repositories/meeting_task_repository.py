@@ -45,7 +45,7 @@ class MeetingTaskRepository(BaseRepository[MeetingTaskModel]):
             return False
         
         await self.session.delete(meeting_task)
-        await self.session.commit()
+        await self.session.flush()
         return True
 
 
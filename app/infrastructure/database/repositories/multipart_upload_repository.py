@@ -0,0 +1,131 @@
+from datetime import datetime
+from typing import Sequence
+from uuid import UUID
+from sqlalchemy import delete, exists, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from fastapi import Depends
+
+from app.domain.enums.upload_status import UploadStatus
+from app.infrastructure.database.repositories.base_repository import BaseRepository
+from app.infrastructure.database.models.artifacts.multipart_upload import MultipartUploadModel
+from app.infrastructure.database.models.artifacts.multipart_upload_part import (
+    MultipartUploadPartModel,
+)
+from app.core.database import db_helper
+
+
+class MultipartUploadRepository(BaseRepository[MultipartUploadModel]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(MultipartUploadModel, session)
+
+    async def get_with_parts(self, upload_id: UUID) -> MultipartUploadModel | None:
+        query = (
+            select(MultipartUploadModel)
+            .where(MultipartUploadModel.id == upload_id)
+            .options(selectinload(MultipartUploadModel.parts))
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.scalars(query)
+        return result.one_or_none()
+
+    async def get_locked(
+        self, upload_id: UUID, shared: bool = False
+    ) -> MultipartUploadModel | None:
+        """
+        Получить загрузку с блокировкой строки до конца транзакции.
+        Части загружаются параллельно под FOR SHARE, а завершение и отмена
+        берут FOR UPDATE и ждут, пока записываемые части закоммитятся.
+        """
+        query = (
+            select(MultipartUploadModel)
+            .where(MultipartUploadModel.id == upload_id)
+            .with_for_update(read=shared)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.scalars(query)
+        return result.one_or_none()
+
+    async def get_parts(self, upload_id: UUID) -> Sequence[MultipartUploadPartModel]:
+        query = (
+            select(MultipartUploadPartModel)
+            .where(MultipartUploadPartModel.upload_id == upload_id)
+            .order_by(MultipartUploadPartModel.part_number)
+        )
+        result = await self.session.scalars(query)
+        return result.all()
+
+    async def upsert_part(
+        self, upload_id: UUID, part_number: int, etag: str, size: int
+    ) -> MultipartUploadPartModel:
+        """Записать часть; повторная загрузка той же части заменяет ETag, как и в S3"""
+        query = pg_insert(MultipartUploadPartModel).values(
+            upload_id=upload_id, part_number=part_number, etag=etag, size=size
+        )
+        query = (
+            query.on_conflict_do_update(
+                index_elements=["upload_id", "part_number"],
+                set_={"etag": etag, "size": size, "uploaded_at": func.now()},
+            )
+            .returning(MultipartUploadPartModel)
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.scalars(query)
+        return result.one()
+
+    async def delete_parts(self, upload_id: UUID) -> None:
+        await self.session.execute(
+            delete(MultipartUploadPartModel).where(MultipartUploadPartModel.upload_id == upload_id)
+        )
+
+    async def get_stale_locked(
+        self, cutoff: datetime, limit: int
+    ) -> Sequence[MultipartUploadModel]:
+        """
+        Незавершенные загрузки без активности после cutoff, в том числе
+        со сборкой, прерванной падением процесса, и прерывание которых
+        в S3 не удалось в прошлый раз.
+        SKIP LOCKED: несколько воркеров очищают разные загрузки и не ждут
+        загрузок, которые сейчас завершаются.
+        """
+        recent_part = exists().where(
+            MultipartUploadPartModel.upload_id == MultipartUploadModel.id,
+            MultipartUploadPartModel.uploaded_at >= cutoff,
+        )
+        query = (
+            select(MultipartUploadModel)
+            .where(
+                MultipartUploadModel.status.in_(
+                    (UploadStatus.IN_PROGRESS, UploadStatus.ASSEMBLING, UploadStatus.ABORTING)
+                ),
+                MultipartUploadModel.updated_at < cutoff,
+                ~recent_part,
+            )
+            .order_by(MultipartUploadModel.updated_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.scalars(query)
+        return result.all()
+
+    async def mark_aborting(self, upload_ids: Sequence[UUID]) -> None:
+        """
+        Забрать загрузки на прерывание: новые части и завершение больше не
+        принимаются, а updated_at отсчитывает паузу до повтора при ошибке S3
+        """
+        if not upload_ids:
+            return
+        await self.session.execute(
+            update(MultipartUploadModel)
+            .where(MultipartUploadModel.id.in_(upload_ids))
+            .values(status=UploadStatus.ABORTING, updated_at=func.now())
+        )
+        self._invalidate(upload_ids)
+
+
+def multipart_upload_repository_getter(
+    session: AsyncSession = Depends(db_helper.session_getter),
+) -> MultipartUploadRepository:
+    repository = MultipartUploadRepository(session)
+    return repository
@@ -0,0 +1,54 @@
+from typing import Sequence
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.events.base import DomainEvent
+from app.infrastructure.database.repositories.base_repository import BaseRepository
+from app.infrastructure.database.models.outbox.outbox_event import OutboxEventModel
+
+# В транзакции сессии записаны события, после коммита relay будится сразу
+OUTBOX_PENDING_KEY = "outbox_pending"
+
+
+class OutboxRepository(BaseRepository[OutboxEventModel]):
+    def __init__(self, session: AsyncSession):
+        super().__init__(OutboxEventModel, session)
+
+    def add_events(self, *events: DomainEvent) -> None:
+        """Записать события в текущую транзакцию, в БД они уйдут вместе с изменениями"""
+        self.session.add_all(
+            OutboxEventModel(name=event.name, payload=event.model_dump(mode="json"))
+            for event in events
+        )
+        if events:
+            self.session.info[OUTBOX_PENDING_KEY] = True
+
+    async def get_pending_locked(
+        self, limit: int, max_attempts: int
+    ) -> Sequence[OutboxEventModel]:
+        """
+        Ожидающие события в порядке записи. SKIP LOCKED: несколько relay
+        доставляют разные пачки и не ждут друг друга.
+        """
+        query = (
+            select(OutboxEventModel)
+            .where(OutboxEventModel.attempts < max_attempts)
+            .order_by(OutboxEventModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.scalars(query)
+        return result.all()
+
+    async def delete_delivered(self, ids: Sequence[int]) -> None:
+        if ids:
+            await self.session.execute(
+                delete(OutboxEventModel).where(OutboxEventModel.id.in_(ids))
+            )
+
+    async def record_failure(self, event_id: int, error: str) -> None:
+        await self.session.execute(
+            update(OutboxEventModel)
+            .where(OutboxEventModel.id == event_id)
+            .values(attempts=OutboxEventModel.attempts + 1, last_error=error)
+        )
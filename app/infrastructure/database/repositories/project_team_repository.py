@@ -1,6 +1,6 @@
-from typing import Sequence, Optional
+from typing import Iterable, Sequence, Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import RowMapping, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 
@@ -51,6 +51,26 @@ class ProjectTeamRepository(BaseRepository[ProjectTeamModel]):
         result = await self.session.scalars(query)
         return result.all()
 
+    async def get_rows_by_project_id(
+        self, project_id: UUID, fields: Iterable[str],
+        status: Optional[ProjectTeamStatus] = None
+    ) -> Sequence[RowMapping]:
+        """Связи проекта строками колонок fields"""
+        query = select(*self._columns(fields)).where(self.model.project_id == project_id)
+        if status:
+            query = query.where(self.model.status == status)
+        return await self._fetch_rows(query)
+
+    async def get_rows_by_team_id(
+        self, team_id: UUID, fields: Iterable[str],
+        status: Optional[ProjectTeamStatus] = None
+    ) -> Sequence[RowMapping]:
+        """Связи команды строками колонок fields"""
+        query = select(*self._columns(fields)).where(self.model.team_id == team_id)
+        if status:
+            query = query.where(self.model.status == status)
+        return await self._fetch_rows(query)
+
     async def get_active_project_for_team_in_semester(
     self, team_id: UUID, year: int, semester: str
     ) -> Optional[ProjectTeamModel]:
@@ -80,7 +100,7 @@ class ProjectTeamRepository(BaseRepository[ProjectTeamModel]):
             return False
         
         await self.session.delete(project_team)
-        await self.session.commit()
+        await self.session.flush()
         return True
 
 
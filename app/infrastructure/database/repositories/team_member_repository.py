@@ -1,6 +1,6 @@
-from typing import Sequence, Optional
+from typing import Iterable, Sequence, Optional
 from uuid import UUID
-from sqlalchemy import select
+from sqlalchemy import RowMapping, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends
 
@@ -36,6 +36,20 @@ class TeamMemberRepository(BaseRepository[TeamMemberModel]):
         result = await self.session.scalars(query)
         return result.all()
 
+    async def get_rows_by_team_id(
+        self, team_id: UUID, fields: Iterable[str]
+    ) -> Sequence[RowMapping]:
+        """Связи команды строками колонок fields"""
+        query = select(*self._columns(fields)).where(self.model.team_id == team_id)
+        return await self._fetch_rows(query)
+
+    async def get_rows_by_student_id(
+        self, student_id: UUID, fields: Iterable[str]
+    ) -> Sequence[RowMapping]:
+        """Связи студента строками колонок fields"""
+        query = select(*self._columns(fields)).where(self.model.student_id == student_id)
+        return await self._fetch_rows(query)
+
     async def delete_by_team_and_student(self, team_id: UUID, student_id: UUID) -> bool:
         """Удалить связь по команде и студенту"""
         team_member = await self.get_by_team_and_student(team_id, student_id)
@@ -43,7 +57,7 @@ class TeamMemberRepository(BaseRepository[TeamMemberModel]):
             return False
         
         await self.session.delete(team_member)
-        await self.session.commit()
+        await self.session.flush()
         return True
 
 
@@ -0,0 +1,45 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infrastructure.cache.entity_cache import entity_cache
+from app.infrastructure.cache.principal_cache import principal_cache
+
+_DEPTH_KEY = "uow_depth"
+
+
+class UnitOfWork:
+    """
+    Единица работы поверх сессии запроса.
+    Репозитории только делают flush, а коммит происходит один раз при выходе
+    из самого внешнего блока `async with`. Вложенные блоки (сервис вызывает
+    другой сервис на той же сессии) не коммитят, решение принимает внешний.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @property
+    def depth(self) -> int:
+        return self.session.info.get(_DEPTH_KEY, 0)
+
+    async def commit(self) -> None:
+        await self.session.commit()
+        # Кеш сбрасывается только после коммита, иначе его заполнят старой строкой
+        await entity_cache.flush(self.session)
+        await principal_cache.flush(self.session)
+
+    async def rollback(self) -> None:
+        await self.session.rollback()
+
+    async def __aenter__(self) -> "UnitOfWork":
+        self.session.info[_DEPTH_KEY] = self.depth + 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        depth = self.depth - 1
+        self.session.info[_DEPTH_KEY] = depth
+        if depth > 0:
+            return
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
@@ -0,0 +1,29 @@
+from uuid import UUID
+
+from sqlalchemy import Executable, select
+
+from app.infrastructure.database.models.meetings.meeting import MeetingModel
+from app.infrastructure.database.models.meetings.task import TaskModel
+from app.infrastructure.database.models.persons.curator import CuratorModel
+from app.infrastructure.database.models.persons.student import StudentModel
+from app.infrastructure.database.models.projects.project import ProjectModel
+from app.infrastructure.database.models.teams.team import TeamModel
+
+# Несуществующий id: запросы ничего не находят, но готовятся так же,
+# как BaseRepository.get_by_id
+_NO_ID = UUID(int=0)
+
+
+def hot_statements() -> list[Executable]:
+    """Самые частые запросы API, подготавливаемые при старте"""
+    return [
+        select(model).where(model.id == _NO_ID)
+        for model in (
+            CuratorModel,
+            StudentModel,
+            TeamModel,
+            ProjectModel,
+            MeetingModel,
+            TaskModel,
+        )
+    ]
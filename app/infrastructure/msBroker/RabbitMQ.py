@@ -1 +0,0 @@
-# Здесь может быть реализация брокера
\ No newline at end of file
@@ -0,0 +1,242 @@
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Iterable
+from uuid import UUID, uuid4
+
+from prometheus_client import Counter, Histogram
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger("broker")
+
+JobHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+JOBS_PROCESSED = Counter(
+    "background_jobs_total",
+    "Background jobs processed by outcome",
+    ["queue", "job", "outcome"],
+)
+
+JOB_DURATION = Histogram(
+    "background_job_duration_seconds",
+    "Background job handler duration",
+    ["queue", "job"],
+)
+
+
+class Job(BaseModel):
+    """Задача в очереди: имя обработчика и JSON-совместимые аргументы"""
+
+    id: UUID = Field(default_factory=uuid4)
+    name: str
+    queue: str
+    payload: dict[str, Any] = {}
+    # Сколько раз обработчик уже вызывался
+    attempt: int = 0
+    created_at: datetime = Field(default_factory=lambda: datetime.now(tz=timezone.utc))
+    last_error: str | None = None
+
+
+class Broker(ABC):
+    """
+    Очередь фоновых задач. Обработчики регистрируются декоратором handler,
+    задача, упавшая с ошибкой, повторяется с экспоненциальной паузой,
+    после max_attempts попыток уходит в очередь {queue}.dead.
+    Доставка не меньше одного раза: обработчик должен быть идемпотентным.
+    """
+
+    # Поставленная задача переживает перезапуск процесса
+    durable: bool = True
+
+    def __init__(
+        self,
+        max_attempts: int,
+        retry_base_delay: float,
+        retry_max_delay: float,
+        concurrency: dict[str, int],
+    ):
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.concurrency = concurrency
+        self._handlers: dict[str, tuple[str, JobHandler]] = {}
+        self._dead_handlers: dict[str, JobHandler] = {}
+        self._workers: list[asyncio.Task] = []
+        # Обработчики, выполняющие задачу прямо сейчас
+        self._busy: set[asyncio.Task] = set()
+        self._stopping = False
+
+    def handler(self, name: str, queue: str = "default") -> Callable[[JobHandler], JobHandler]:
+        """Зарегистрировать обработчик задачи name в очереди queue"""
+        def decorator(func: JobHandler) -> JobHandler:
+            self._handlers[name] = (queue, func)
+            return func
+        return decorator
+
+    def on_dead_letter(self, name: str) -> Callable[[JobHandler], JobHandler]:
+        """
+        Зарегистрировать обработчик задачи name, исчерпавшей попытки:
+        вызывается с тем же payload после отправки задачи в {queue}.dead
+        """
+        def decorator(func: JobHandler) -> JobHandler:
+            self._dead_handlers[name] = func
+            return func
+        return decorator
+
+    def retry_delay(self, attempt: int) -> float:
+        """Пауза перед повтором после attempt неудачных попыток"""
+        return min(self.retry_max_delay, self.retry_base_delay * 2 ** (attempt - 1))
+
+    async def enqueue(
+        self, name: str, payload: dict[str, Any] | None = None, delay: float = 0
+    ) -> Job:
+        """Поставить задачу в очередь ее обработчика"""
+        if name not in self._handlers:
+            raise ValueError(f"Unknown job {name}")
+        queue, _ = self._handlers[name]
+        job = Job(name=name, queue=queue, payload=payload or {})
+        await self._publish(job, delay)
+        return job
+
+    async def run_now(self, name: str, payload: dict[str, Any]) -> None:
+        """
+        Выполнить задачу в текущей корутине, без очереди и повторов:
+        ошибка обработчика пробрасывается вызывающему
+        """
+        if name not in self._handlers:
+            raise ValueError(f"Unknown job {name}")
+        queue, func = self._handlers[name]
+        started = time.perf_counter()
+        try:
+            await func(payload)
+        except Exception:
+            JOBS_PROCESSED.labels(queue, name, "failed").inc()
+            raise
+        finally:
+            JOB_DURATION.labels(queue, name).observe(time.perf_counter() - started)
+        JOBS_PROCESSED.labels(queue, name, "done").inc()
+
+    async def run_workers(self, queues: Iterable[str] | None = None) -> None:
+        """Начать обработку очередей (по умолчанию всех, где есть обработчики)"""
+        names = {queue for queue, _ in self._handlers.values()}
+        if queues is not None:
+            names &= set(queues)
+        for queue in sorted(names):
+            await self._consume(queue, self.concurrency.get(queue, 1))
+
+    async def _process(self, job: Job) -> None:
+        """
+        Выполнить задачу. Ошибка обработчика не пробрасывается: задача
+        повторяется или уходит в dead letter. Ошибка самой очереди пробрасывается,
+        чтобы реализация вернула сообщение в очередь.
+        """
+        entry = self._handlers.get(job.name)
+        if entry is None:
+            job.last_error = f"Unknown job {job.name}"
+            logger.error(f"Job {job.id}: no handler for {job.name}")
+            await self._dead_letter(job)
+            JOBS_PROCESSED.labels(job.queue, job.name, "dead").inc()
+            return
+        _, func = entry
+        job.attempt += 1
+        started = time.perf_counter()
+        try:
+            await func(job.payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            job.last_error = f"{type(e).__name__}: {e}"
+            if job.attempt >= self.max_attempts:
+                logger.exception(f"Job {job.name} {job.id} failed {job.attempt} times, dead-lettered")
+                await self._dead_letter(job)
+                await self._on_dead(job)
+                outcome = "dead"
+            else:
+                delay = self.retry_delay(job.attempt)
+                logger.warning(
+                    f"Job {job.name} {job.id} attempt {job.attempt} failed, retry in {delay}s: {e}"
+                )
+                await self._publish(job, delay)
+                outcome = "retry"
+        else:
+            outcome = "done"
+        finally:
+            JOB_DURATION.labels(job.queue, job.name).observe(time.perf_counter() - started)
+        JOBS_PROCESSED.labels(job.queue, job.name, outcome).inc()
+
+    async def _on_dead(self, job: Job) -> None:
+        func = self._dead_handlers.get(job.name)
+        if func is None:
+            return
+        try:
+            await func(job.payload)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Задача уже в dead letter, повторять обработчик некому
+            logger.exception(f"Dead letter handler of {job.name} {job.id} failed")
+
+    async def _handle(self, job: Job) -> None:
+        """_process, отмеченный как занятость обработчика для остановки"""
+        task = asyncio.current_task()
+        self._busy.add(task)
+        try:
+            await self._process(job)
+        finally:
+            self._busy.discard(task)
+
+    async def _stop_workers(self, timeout: float) -> None:
+        """
+        Остановить обработчики: свободные сразу, занятые - после текущей
+        задачи, но не дольше timeout секунд
+        """
+        self._stopping = True
+        busy = [worker for worker in self._workers if worker in self._busy]
+        for worker in self._workers:
+            if worker not in self._busy:
+                worker.cancel()
+        if busy:
+            _, pending = await asyncio.wait(busy, timeout=timeout)
+            if pending:
+                logger.warning(f"{len(pending)} jobs interrupted on shutdown")
+            for worker in pending:
+                worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+        self._stopping = False
+
+    async def start(self) -> None:
+        """
+        Подключиться к брокеру
+        """
+        pass
+
+    @abstractmethod
+    async def _publish(self, job: Job, delay: float) -> None:
+        """
+        Отправить задачу в очередь job.queue через delay секунд
+        """
+        pass
+
+    @abstractmethod
+    async def _dead_letter(self, job: Job) -> None:
+        """
+        Отправить задачу в очередь {job.queue}.dead
+        """
+        pass
+
+    @abstractmethod
+    async def _consume(self, queue: str, concurrency: int) -> None:
+        """
+        Запустить concurrency обработчиков очереди queue
+        """
+        pass
+
+    async def close(self, timeout: float = 0) -> None:
+        """
+        Остановить обработчики, дав выполняемым задачам до timeout секунд,
+        и закрыть соединение
+        """
+        pass
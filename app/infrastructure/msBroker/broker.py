@@ -0,0 +1,25 @@
+from app.core.config import settings
+from app.infrastructure.msBroker.base import Broker
+from app.infrastructure.msBroker.memory import InMemoryBroker
+from app.infrastructure.msBroker.rabbitmq import RabbitMQBroker
+
+
+def build_broker() -> Broker:
+    config = settings.broker
+    options = dict(
+        max_attempts=config.max_attempts,
+        retry_base_delay=config.retry_base_delay,
+        retry_max_delay=config.retry_max_delay,
+        concurrency=config.concurrency,
+    )
+    if config.url:
+        return RabbitMQBroker(config.url, **options)
+    return InMemoryBroker(**options)
+
+
+# Общая очередь фоновых задач процесса
+broker = build_broker()
+
+
+def broker_getter() -> Broker:
+    return broker
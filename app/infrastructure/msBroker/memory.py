@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from collections import defaultdict
+
+from app.infrastructure.msBroker.base import Broker, Job
+
+logger = logging.getLogger("broker")
+
+
+class InMemoryBroker(Broker):
+    """
+    Очередь в памяти процесса для разработки и тестов.
+    Задачи не переживают перезапуск, повторы откладываются через call_later.
+    """
+
+    durable = False
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._queues: dict[str, asyncio.Queue[Job]] = defaultdict(asyncio.Queue)
+        self._timers: set[asyncio.TimerHandle] = set()
+        self.dead_letters: dict[str, list[Job]] = defaultdict(list)
+
+    async def _publish(self, job: Job, delay: float) -> None:
+        if delay <= 0:
+            self._queues[job.queue].put_nowait(job)
+            return
+
+        def put() -> None:
+            self._timers.discard(timer)
+            self._queues[job.queue].put_nowait(job)
+
+        timer = asyncio.get_running_loop().call_later(delay, put)
+        self._timers.add(timer)
+
+    async def _dead_letter(self, job: Job) -> None:
+        self.dead_letters[job.queue].append(job)
+
+    async def _consume(self, queue: str, concurrency: int) -> None:
+        for _ in range(concurrency):
+            self._workers.append(asyncio.create_task(self._work(queue)))
+
+    async def _work(self, queue: str) -> None:
+        jobs = self._queues[queue]
+        while not self._stopping:
+            job = await jobs.get()
+            try:
+                await self._handle(job)
+            except Exception:
+                logger.exception(f"Job {job.name} {job.id} lost")
+            finally:
+                jobs.task_done()
+
+    async def join(self) -> None:
+        """Дождаться выполнения всех задач, включая отложенные повторы"""
+        while True:
+            for jobs in list(self._queues.values()):
+                await jobs.join()
+            if not self._timers:
+                return
+            await asyncio.sleep(0.01)
+
+    async def close(self, timeout: float = 0) -> None:
+        for timer in self._timers:
+            timer.cancel()
+        self._timers.clear()
+        await self._stop_workers(timeout)
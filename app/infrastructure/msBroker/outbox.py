@@ -0,0 +1,146 @@
+import asyncio
+import logging
+from collections import defaultdict
+from contextlib import suppress
+from typing import Awaitable, Callable, TypeVar
+
+from prometheus_client import Counter
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.domain.events.base import DomainEvent
+from app.infrastructure.database.models.outbox.outbox_event import OutboxEventModel
+from app.infrastructure.database.repositories.outbox_repository import (
+    OUTBOX_PENDING_KEY,
+    OutboxRepository,
+)
+from app.infrastructure.database.unit_of_work import UnitOfWork
+from app.infrastructure.msBroker.base import Broker
+from app.infrastructure.msBroker.broker import broker
+
+logger = logging.getLogger("outbox")
+
+E = TypeVar("E", bound=DomainEvent)
+EventHandler = Callable[[E], Awaitable[None]]
+
+OUTBOX_DELIVERED = Counter(
+    "outbox_events_delivered_total",
+    "Outbox events delivered to subscribers",
+    ["event"],
+)
+
+OUTBOX_FAILED = Counter(
+    "outbox_event_failures_total",
+    "Failed outbox event deliveries",
+    ["event"],
+)
+
+
+class OutboxRelay:
+    """
+    Доставка событий из таблицы outbox подписчикам в процессе и в очередь задач.
+    Событие удаляется в той же транзакции, в которой доставлено; при падении
+    процесса оно будет доставлено повторно, подписчики должны быть идемпотентными.
+    Очередь в памяти теряет задачи при перезапуске, поэтому с ней forward
+    выполняет задачу сразу и событие удаляется только после ее выполнения.
+    """
+
+    def __init__(
+        self, broker: Broker, batch_size: int, poll_interval: float, max_attempts: int
+    ):
+        self.broker = broker
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self._types: dict[str, type[DomainEvent]] = {}
+        self._handlers: dict[str, list[EventHandler]] = defaultdict(list)
+        self._wakeup = asyncio.Event()
+
+    def subscribe(self, event_type: type[E]) -> Callable[[EventHandler[E]], EventHandler[E]]:
+        """Подписать обработчик в процессе relay на событие"""
+        def decorator(func: EventHandler[E]) -> EventHandler[E]:
+            self._types[event_type.name] = event_type
+            self._handlers[event_type.name].append(func)
+            return func
+        return decorator
+
+    def forward(self, event_type: type[DomainEvent], job_name: str) -> None:
+        """Ставить задачу job_name в очередь на каждое событие, payload задачи - поля события"""
+        async def enqueue(event: DomainEvent) -> None:
+            payload = event.model_dump(mode="json")
+            if self.broker.durable:
+                await self.broker.enqueue(job_name, payload)
+            else:
+                # Ошибка задачи оставляет событие в таблице, как и ошибка доставки
+                await self.broker.run_now(job_name, payload)
+        self.subscribe(event_type)(enqueue)
+
+    def notify(self) -> None:
+        """Разбудить relay, не дожидаясь poll_interval"""
+        self._wakeup.set()
+
+    async def _deliver(self, row: OutboxEventModel) -> None:
+        event_type = self._types.get(row.name)
+        if event_type is None:
+            return
+        event = event_type.model_validate(row.payload)
+        for handler in self._handlers[row.name]:
+            await handler(event)
+
+    async def publish_batch(self, session: AsyncSession) -> int:
+        """Доставить одну пачку событий, возвращает число доставленных"""
+        repo = OutboxRepository(session)
+        delivered = []
+        async with UnitOfWork(session):
+            for row in await repo.get_pending_locked(self.batch_size, self.max_attempts):
+                try:
+                    await self._deliver(row)
+                except Exception as e:
+                    # Событие останется в таблице, следующая пачка повторит его
+                    logger.exception(f"Outbox event {row.name} {row.id} delivery failed")
+                    await repo.record_failure(row.id, f"{type(e).__name__}: {e}")
+                    OUTBOX_FAILED.labels(row.name).inc()
+                    continue
+                delivered.append(row.id)
+                OUTBOX_DELIVERED.labels(row.name).inc()
+            await repo.delete_delivered(delivered)
+        return len(delivered)
+
+    async def run(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        """Цикл доставки, запускается в lifespan приложения"""
+        while True:
+            self._wakeup.clear()
+            try:
+                while True:
+                    async with session_factory() as session:
+                        delivered = await self.publish_batch(session)
+                    if delivered < self.batch_size:
+                        break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Outbox relay failed")
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+
+
+outbox_relay = OutboxRelay(
+    broker=broker,
+    batch_size=settings.broker.outbox.batch_size,
+    poll_interval=settings.broker.outbox.poll_interval,
+    max_attempts=settings.broker.outbox.max_attempts,
+)
+
+
+@event.listens_for(Session, "after_commit")
+def _wake_relay(session: Session) -> None:
+    if session.info.pop(OUTBOX_PENDING_KEY, False):
+        outbox_relay.notify()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session: Session, previous_transaction) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(OUTBOX_PENDING_KEY, None)
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+
+import aio_pika
+from aio_pika.abc import AbstractChannel, AbstractQueue, AbstractRobustConnection
+from pydantic import ValidationError
+
+from app.infrastructure.msBroker.base import Broker, Job
+
+logger = logging.getLogger("broker")
+
+# Очередь задержки удаляется RabbitMQ, если ей не пользовались столько после TTL
+_DELAY_QUEUE_EXPIRES_MS = 60_000
+
+
+class RabbitMQBroker(Broker):
+    """
+    Очередь задач в RabbitMQ. Отложенные повторы идут через очереди
+    {queue}.delay.{ms} с TTL, из которых сообщение по истечении возвращается
+    в основную очередь (dead letter exchange), плагины не нужны.
+    Сообщение подтверждается только после обработки, при падении процесса
+    задача достается другому обработчику.
+    """
+
+    def __init__(self, url: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._url = url
+        self._connection: AbstractRobustConnection | None = None
+        self._channel: AbstractChannel | None = None
+        self._declared: set[str] = set()
+
+    async def start(self) -> None:
+        self._connection = await aio_pika.connect_robust(self._url)
+        # Подтверждения публикации: enqueue возвращается, когда задача записана брокером
+        self._channel = await self._connection.channel(publisher_confirms=True)
+
+    @staticmethod
+    async def _declare(channel: AbstractChannel, queue: str) -> AbstractQueue:
+        await channel.declare_queue(f"{queue}.dead", durable=True)
+        return await channel.declare_queue(
+            queue,
+            durable=True,
+            # Сообщения, которые не удалось разобрать, отклоняются в {queue}.dead
+            arguments={
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": f"{queue}.dead",
+            },
+        )
+
+    async def _send(self, routing_key: str, job: Job) -> None:
+        if self._channel is None:
+            raise RuntimeError("Broker is not started")
+        await self._channel.default_exchange.publish(
+            aio_pika.Message(
+                body=job.model_dump_json().encode(),
+                content_type="application/json",
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                message_id=str(job.id),
+            ),
+            routing_key=routing_key,
+        )
+
+    async def _publish(self, job: Job, delay: float) -> None:
+        if self._channel is None:
+            raise RuntimeError("Broker is not started")
+        if job.queue not in self._declared:
+            await self._declare(self._channel, job.queue)
+            self._declared.add(job.queue)
+        if delay <= 0:
+            await self._send(job.queue, job)
+            return
+        delay_ms = int(delay * 1000)
+        delay_queue = f"{job.queue}.delay.{delay_ms}"
+        # Объявляется при каждой публикации: неиспользуемая очередь задержки
+        # удаляется по x-expires, а сообщение в несуществующую очередь пропадет
+        await self._channel.declare_queue(
+            delay_queue,
+            durable=True,
+            arguments={
+                "x-message-ttl": delay_ms,
+                "x-dead-letter-exchange": "",
+                "x-dead-letter-routing-key": job.queue,
+                "x-expires": delay_ms + _DELAY_QUEUE_EXPIRES_MS,
+            },
+        )
+        await self._send(delay_queue, job)
+
+    async def _dead_letter(self, job: Job) -> None:
+        await self._send(f"{job.queue}.dead", job)
+
+    async def _consume(self, queue: str, concurrency: int) -> None:
+        if self._connection is None:
+            raise RuntimeError("Broker is not started")
+        for _ in range(concurrency):
+            # Свой канал с prefetch 1 на обработчик: сообщение не ждет
+            # за медленной задачей, пока другие обработчики свободны
+            channel = await self._connection.channel()
+            await channel.set_qos(prefetch_count=1)
+            declared = await self._declare(channel, queue)
+            self._workers.append(asyncio.create_task(self._work(declared)))
+
+    async def _work(self, queue: AbstractQueue) -> None:
+        async with queue.iterator() as messages:
+            async for message in messages:
+                try:
+                    job = Job.model_validate_json(message.body)
+                except ValidationError as e:
+                    logger.error(f"Malformed message {message.message_id} in {queue.name}: {e}")
+                    await message.reject(requeue=False)
+                    continue
+                try:
+                    # Повтор публикуется до подтверждения исходного сообщения
+                    await self._handle(job)
+                except Exception:
+                    logger.exception(f"Job {job.name} {job.id} requeued")
+                    await message.nack(requeue=True)
+                else:
+                    await message.ack()
+                if self._stopping:
+                    # Выход из iterator отменяет подписку, неподтвержденные
+                    # сообщения из prefetch вернутся в очередь
+                    break
+
+    async def close(self, timeout: float = 0) -> None:
+        await self._stop_workers(timeout)
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+            self._channel = None
@@ -1,41 +1,306 @@
-from fastapi import UploadFile
-import boto3
+import asyncio
+import hashlib
 import json
+import logging
+import re
+from datetime import datetime
+from functools import partial
+from typing import AsyncIterator, BinaryIO
+from uuid import uuid4
+
+import boto3
 from botocore.client import Config
 from botocore.exceptions import ClientError
 from boto3_type_annotations.s3 import Client
+from fastapi import UploadFile
 from app.core.config import settings
 
+logger = logging.getLogger("s3_client")
+
+
+def build_boto3_client(endpoint_url: str | None = None) -> Client:
+    return boto3.client(
+        "s3",
+        endpoint_url=endpoint_url or settings.s3.private_host,
+        aws_access_key_id=settings.s3.access_key,
+        aws_secret_access_key=settings.s3.secret_key,
+        region_name=settings.s3.region,
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=settings.s3.max_pool_connections,
+        ),
+    )
+
+
+def content_key(sha256: str) -> str:
+    """Ключ объекта по содержимому: одинаковые файлы хранятся один раз"""
+    return f"sha256/{sha256[:2]}/{sha256}"
+
+
+def build_object_key(prefix: str, filename: str) -> str:
+    """Уникальный ключ объекта: имя файла очищается, коллизии исключает uuid"""
+    safe_name = re.sub(r"[^A-Za-z0-9._-]+", "_", filename).strip("._")[-100:] or "file"
+    return f"{prefix}/{uuid4().hex}/{safe_name}"
+
 
 class S3Client:
-    def __init__(self, bucket: str, policy: dict):
-        self.client: Client = boto3.client(
-            "s3",
-            endpoint_url=settings.s3.private_host,
-            aws_access_key_id=settings.s3.access_key,
-            aws_secret_access_key=settings.s3.secret_key,
-            region_name=settings.s3.region,
-            config=Config(signature_version="s3v4")
-        )
+    """
+    Клиент бакета на все время жизни приложения.
+    boto3 синхронный и потокобезопасный, поэтому вызовы выполняются в пуле
+    потоков и не блокируют event loop. Проверка бакета и политики делается
+    один раз (setup при старте приложения или перед первым запросом).
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        policy: dict | None,
+        client: Client | None = None,
+        presign_client: Client | None = None,
+    ):
         self.bucket = bucket
         self.bucket_policy = policy
-        self._check_bucket_existence()
+        self._client = client
+        self._presign_client = presign_client
+        self._ready = False
+        self._setup_lock = asyncio.Lock()
+
+    @property
+    def client(self) -> Client:
+        if self._client is None:
+            self._client = build_boto3_client()
+        return self._client
+
+    @property
+    def presign_client(self) -> Client:
+        # Подпись включает хост, поэтому ссылки для браузера подписываются публичным адресом
+        if self._presign_client is None:
+            self._presign_client = build_boto3_client(settings.s3.public_host)
+        return self._presign_client
+
+    async def _call(self, method: str, **kwargs) -> dict:
+        return await asyncio.to_thread(partial(getattr(self.client, method), **kwargs))
+
+    async def setup(self) -> None:
+        if self._ready:
+            return
+        async with self._setup_lock:
+            if self._ready:
+                return
+            await self._check_bucket_existence()
+            self._ready = True
 
-    def _check_bucket_existence(self) -> None:
+    async def _check_bucket_existence(self) -> None:
         try:
-            self.client.head_bucket(Bucket=self.bucket)
+            await self._call("head_bucket", Bucket=self.bucket)
         except ClientError:
-            self.client.create_bucket(Bucket=self.bucket)
-        self.client.put_bucket_policy(Bucket=self.bucket, Policy=json.dumps(self.bucket_policy))
+            await self._call("create_bucket", Bucket=self.bucket)
+        if self.bucket_policy is not None:
+            await self._call(
+                "put_bucket_policy", Bucket=self.bucket, Policy=json.dumps(self.bucket_policy)
+            )
+
+    async def list_objects(self, prefix: str | None = None) -> dict:
+        await self.setup()
+        params = {"Bucket": self.bucket}
+        if prefix is not None:
+            params["Prefix"] = prefix
+        return await self._call("list_objects_v2", **params)
+
+    async def put_object(self, file_name: str, file: UploadFile) -> dict:
+        await self.setup()
+        return await self._call(
+            "put_object",
+            Bucket=self.bucket,
+            Key=file_name,
+            Body=file.file,
+            ContentType=file.content_type,
+        )
+
+    async def get_object(self, object_name: str) -> dict:
+        await self.setup()
+        return await self._call("get_object", Bucket=self.bucket, Key=object_name)
+
+    async def open_object(
+        self,
+        object_name: str,
+        range_header: str | None = None,
+        if_match: str | None = None,
+        if_none_match: str | None = None,
+        if_modified_since: datetime | None = None,
+        if_unmodified_since: datetime | None = None,
+    ) -> dict:
+        """
+        Открыть объект для потокового чтения: тело в ответе не прочитано,
+        его нужно читать через iter_body. Условия и Range проверяет сам S3,
+        при их срабатывании поднимается ClientError с кодом 304, 412 или 416.
+        """
+        await self.setup()
+        params = {
+            "Range": range_header,
+            "IfMatch": if_match,
+            "IfNoneMatch": if_none_match,
+            "IfModifiedSince": if_modified_since,
+            "IfUnmodifiedSince": if_unmodified_since,
+        }
+        return await self._call(
+            "get_object",
+            Bucket=self.bucket,
+            Key=object_name,
+            **{name: value for name, value in params.items() if value is not None},
+        )
+
+    async def head_object(self, object_name: str) -> dict | None:
+        """Метаданные объекта или None, если объекта нет"""
+        await self.setup()
+        try:
+            return await self._call("head_object", Bucket=self.bucket, Key=object_name)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def _sha256_object(self, object_name: str) -> str:
+        response = self.client.get_object(Bucket=self.bucket, Key=object_name)
+        digest = hashlib.sha256()
+        # Объект читается потоком, в памяти только текущий чанк
+        for chunk in response["Body"].iter_chunks(chunk_size=1024 * 1024):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+    async def sha256_object(self, object_name: str) -> str:
+        """
+        SHA-256 содержимого объекта (hex), объект читается из S3 потоком.
+        Вызывается в фоновой задаче, а не в обработчике запроса API
+        """
+        await self.setup()
+        return await asyncio.to_thread(self._sha256_object, object_name)
+
+    async def copy_object(self, source_name: str, object_name: str) -> None:
+        """
+        Копия внутри S3, без передачи байт через API. Управляемое
+        копирование boto3 само переходит на multipart для объектов больше 5 ГБ.
+        """
+        await self.setup()
+        await asyncio.to_thread(
+            self.client.copy,
+            {"Bucket": self.bucket, "Key": source_name},
+            self.bucket,
+            object_name,
+        )
+
+    async def delete_object(self, object_name: str) -> None:
+        await self.setup()
+        await self._call("delete_object", Bucket=self.bucket, Key=object_name)
+
+    async def create_multipart_upload(self, object_name: str, content_type: str) -> str:
+        """Начать составную загрузку, вернуть UploadId"""
+        await self.setup()
+        response = await self._call(
+            "create_multipart_upload",
+            Bucket=self.bucket,
+            Key=object_name,
+            ContentType=content_type,
+        )
+        return response["UploadId"]
+
+    async def upload_part(
+        self,
+        object_name: str,
+        upload_id: str,
+        part_number: int,
+        body: BinaryIO,
+        content_length: int,
+        content_md5: str,
+    ) -> str:
+        """Загрузить часть, вернуть ее ETag. S3 сверяет MD5 и отклоняет битую часть"""
+        await self.setup()
+        response = await self._call(
+            "upload_part",
+            Bucket=self.bucket,
+            Key=object_name,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
+            ContentLength=content_length,
+            ContentMD5=content_md5,
+        )
+        return response["ETag"]
+
+    async def complete_multipart_upload(
+        self, object_name: str, upload_id: str, parts: list[dict]
+    ) -> dict:
+        await self.setup()
+        return await self._call(
+            "complete_multipart_upload",
+            Bucket=self.bucket,
+            Key=object_name,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    async def abort_multipart_upload(self, object_name: str, upload_id: str) -> None:
+        """Прервать загрузку и удалить ее части. Уже прерванная загрузка не ошибка"""
+        await self.setup()
+        try:
+            await self._call(
+                "abort_multipart_upload",
+                Bucket=self.bucket,
+                Key=object_name,
+                UploadId=upload_id,
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                raise
+
+    def presign_post(
+        self, object_name: str, content_type: str, max_size: int, expires_in: int
+    ) -> dict:
+        """
+        Подписанная форма POST для загрузки напрямую в S3.
+        В отличие от PUT, условия формы ограничивают размер и тип файла.
+        Подпись считается локально, без обращения к S3.
+        """
+        return self.presign_client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=object_name,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_size],
+            ],
+            ExpiresIn=expires_in,
+        )
+
+    def public_url(self, object_name: str) -> str:
+        return f"{settings.s3.public_host}/{self.bucket}/{object_name}"
+
+
+async def iter_body(body, chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Читать тело ответа S3 по чанкам в пуле потоков. Следующий чанк читается,
+    только когда клиент принял предыдущий, поэтому память не растет с размером файла.
+    """
+    try:
+        while chunk := await asyncio.to_thread(body.read, chunk_size):
+            yield chunk
+    finally:
+        body.close()
+
+
+curator_s3_client = S3Client(
+    settings.s3.curator_bucket.name, settings.s3.curator_bucket.policy,
+)
+
+
+artifact_s3_client = S3Client(
+    settings.s3.artifact_bucket.name, settings.s3.artifact_bucket.policy,
+)
 
-    def list_objects(self, prefix: str | None = None) -> dict:
-        return self.client.list_objects_v2(self.bucket, Prefix=prefix)
 
-    def put_object(self, file_name: str, file: UploadFile) -> dict:
-        return self.client.put_object(Bucket=self.bucket, Key=file_name, Body=file.file, ContentType=file.content_type)
+def curator_s3_client_getter() -> S3Client:
+    return curator_s3_client
 
-    def get_object(self, object_name: str) -> dict:
-        return self.client.get_object(Bucket=self.bucket, Key=object_name)
 
-# TODO: переделать под put и get object чтобы сразу с фронта грузить в с3 но мб fput и fget оставить чтобы по яндексу делать по кайфу
-# а ещё сделать для загрузки записей встреч - генерацию presigned юрлов и эндпоинтов для загрузки долгой файлов в минио сразу
+def artifact_s3_client_getter() -> S3Client:
+    return artifact_s3_client
@@ -0,0 +1,113 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+from passlib.context import CryptContext
+from prometheus_client import Gauge, Histogram
+
+from app.core.config import settings
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+PASSWORD_HASH_QUEUE = Gauge(
+    "password_hash_queue_depth",
+    "Password hash operations waiting for a free worker",
+    multiprocess_mode="livesum",
+)
+
+PASSWORD_HASH_IN_PROGRESS = Gauge(
+    "password_hash_in_progress",
+    "Password hash operations running in the pool",
+    multiprocess_mode="livesum",
+)
+
+PASSWORD_HASH_WAIT = Histogram(
+    "password_hash_wait_seconds",
+    "Time spent waiting for a free password hash worker",
+    ["operation"],
+)
+
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "Password hash operation duration in the pool",
+    ["operation"],
+)
+
+
+# Функции уровня модуля, чтобы их можно было передать в пул процессов
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(password, hashed_password)
+
+
+class PasswordHasher:
+    """
+    Хеширование паролей bcrypt вне event loop.
+    Одновременно выполняется не больше max_concurrency операций, остальные
+    ждут на семафоре - размер этой очереди виден в метриках.
+    """
+
+    def __init__(self, max_concurrency: int, executor: str = "thread"):
+        self._max_concurrency = max_concurrency
+        self._executor_kind = executor
+        self._executor: Executor | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self._executor_kind == "process":
+                # spawn: форк процесса с работающим event loop и потоками небезопасен
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_concurrency,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_concurrency,
+                    thread_name_prefix="password-hasher",
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        return self._semaphore
+
+    async def _run(self, operation: str, func, *args):
+        PASSWORD_HASH_QUEUE.inc()
+        queued_at = time.perf_counter()
+        try:
+            await self._get_semaphore().acquire()
+        finally:
+            PASSWORD_HASH_QUEUE.dec()
+        started_at = time.perf_counter()
+        PASSWORD_HASH_WAIT.labels(operation).observe(started_at - queued_at)
+        PASSWORD_HASH_IN_PROGRESS.inc()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            PASSWORD_HASH_IN_PROGRESS.dec()
+            PASSWORD_HASH_DURATION.labels(operation).observe(time.perf_counter() - started_at)
+            self._get_semaphore().release()
+
+    async def hash(self, password: str) -> str:
+        return await self._run("hash", _hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run("verify", _verify, password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher(
+    max_concurrency=settings.password_hash.max_concurrency,
+    executor=settings.password_hash.executor,
+)
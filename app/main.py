@@ -1,14 +1,84 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
 import uvicorn
+from botocore.exceptions import BotoCoreError, ClientError
+from sqlalchemy.exc import SQLAlchemyError
 from app.api.v1.routes import routers as v1_routers
 from app.domain.entities.persons.curator import Curator
 from app.domain.entities.teams.team import Team
 from app.domain.entities.projects.project import Project
 from fastapi.middleware.cors import CORSMiddleware
+import app.application.background.jobs  # noqa: F401 - регистрация обработчиков задач
+from app.application.background.upload_cleanup import run_upload_cleanup
 from app.core.config import settings
-from app.core.middleware import PrometheusMiddleware
+from app.core.database import db_helper
+from app.core.middleware import PrometheusMiddleware, QueryStatsMiddleware
+from app.infrastructure.cache.backend import cache_backend
+from app.infrastructure.database.warmup import hot_statements
+from app.infrastructure.msBroker.broker import broker
+from app.infrastructure.msBroker.outbox import outbox_relay
+from app.infrastructure.s3_storage.s3_client import artifact_s3_client, curator_s3_client
+from app.infrastructure.security.password_hasher import password_hasher
 
-main_app = FastAPI()
+logger = logging.getLogger("main")
+
+
+def check_shared_state() -> None:
+    """Кеш в памяти процесса не разделяется между воркерами uvicorn"""
+    if settings.run.workers > 1 and not settings.cache.url:
+        # Иначе другие воркеры отдают устаревшие строки и принимают отозванные токены
+        raise RuntimeError(
+            f"CACHE__URL is required with RUN__WORKERS={settings.run.workers}: "
+            "in-process cache invalidation and token revocation are per worker"
+        )
+
+
+async def warm_up() -> None:
+    """Подготовка воркера, чтобы первые запросы не платили за инициализацию"""
+    Team.model_rebuild()
+    Project.model_rebuild()
+    Curator.model_rebuild()
+    try:
+        await db_helper.warm_up(settings.run.warmup_connections, hot_statements())
+    except (OSError, SQLAlchemyError) as e:
+        # Пул откроет соединения по запросу, когда БД станет доступна
+        logger.warning(f"Database warm-up failed: {e}")
+    await cache_backend.setup()
+    for s3_client in (curator_s3_client, artifact_s3_client):
+        try:
+            await s3_client.setup()
+        except (BotoCoreError, ClientError) as e:
+            # S3 может подняться позже, клиент повторит проверку перед первым запросом
+            logger.warning(f"S3 bucket {s3_client.bucket} setup failed on startup: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    check_shared_state()
+    await warm_up()
+    await broker.start()
+    if settings.broker.embedded_workers:
+        await broker.run_workers()
+    upload_cleanup = asyncio.create_task(run_upload_cleanup())
+    relay = asyncio.create_task(outbox_relay.run(db_helper.async_session_factory))
+    try:
+        yield
+    finally:
+        # Текущие запросы к этому моменту уже завершены: uvicorn ждет их
+        # до lifespan shutdown (--timeout-graceful-shutdown)
+        for task in (upload_cleanup, relay):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        await broker.close(settings.run.shutdown_timeout)
+        await cache_backend.close()
+        password_hasher.shutdown()
+        await db_helper.dispose()
+
+
+main_app = FastAPI(lifespan=lifespan)
 
 main_app.add_middleware(
     CORSMiddleware,
@@ -21,12 +91,13 @@ main_app.add_middleware(
 )
 
 main_app.include_router(v1_routers, prefix="/api")
+main_app.add_middleware(QueryStatsMiddleware)
 main_app.add_middleware(PrometheusMiddleware)
 
-Team.model_rebuild(force=True)
-Project.model_rebuild(force=True)
-Curator.model_rebuild(force=True)
-
 
 if __name__ == "__main__":
-    uvicorn.run(main_app, host="0.0.0.0")
+    uvicorn.run(
+        main_app,
+        host="0.0.0.0",
+        timeout_graceful_shutdown=settings.run.shutdown_timeout,
+    )
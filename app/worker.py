@@ -0,0 +1,33 @@
+"""
+Отдельный процесс обработчиков фоновых задач, когда в API они выключены
+(BROKER__EMBEDDED_WORKERS=false).
+
+Запуск:
+    python -m app.worker [очередь ...]
+"""
+import asyncio
+import logging
+import signal
+import sys
+
+import app.application.background.jobs  # noqa: F401 - регистрация обработчиков
+from app.core.config import settings
+from app.infrastructure.msBroker.broker import broker
+
+
+async def main(queues: list[str] | None) -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    await broker.start()
+    try:
+        await broker.run_workers(queues)
+        await stop.wait()
+    finally:
+        await broker.close(settings.run.shutdown_timeout)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(main(sys.argv[1:] or None))
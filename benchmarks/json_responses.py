@@ -0,0 +1,119 @@
+"""
+Пропускная способность списочных эндпоинтов: ответ моделью через
+response_model (проверка по response_model, dict и json.dumps)
+против ModelResponse (сериализация pydantic-core сразу в байты).
+Страница строится из ORM-объектов один раз, как в сервисах,
+замеряется путь ответа.
+
+Запуск (БД не нужна, строки создаются в памяти):
+    python -m benchmarks.json_responses
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import httpx
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from app.api.utils.responses import ModelResponse
+from app.application.dto.meeting import MeetingResponse
+from app.application.dto.pagination import Page
+from app.core.config import settings
+from app.domain.entities.persons.student import Student
+from app.domain.enums.meeting_status import MeetingStatus
+from app.domain.entities.teams.team import Team
+from app.infrastructure.database.models.meetings.meeting import MeetingModel
+from app.infrastructure.database.models.persons.student import StudentModel
+from app.infrastructure.database.models.teams.team import TeamModel
+
+REQUESTS = 200
+PAGE_SIZE = settings.pagination.max_limit
+
+
+def _rows() -> dict[str, tuple[type[BaseModel], list]]:
+    now = datetime.now(tz=timezone.utc)
+    team_id = uuid4()
+    return {
+        "/teams/": (
+            Team,
+            [
+                TeamModel(id=uuid4(), name=f"Команда {i}", group_link=f"https://t.me/team{i}")
+                for i in range(PAGE_SIZE)
+            ],
+        ),
+        "/students/": (
+            Student,
+            [
+                StudentModel(
+                    id=uuid4(),
+                    first_name="Иван",
+                    last_name="Иванов",
+                    patronymic="Иванович",
+                    email=f"student{i}@example.com",
+                    tg_link=f"@student{i}",
+                )
+                for i in range(PAGE_SIZE)
+            ],
+        ),
+        "/meetings/all": (
+            MeetingResponse,
+            [
+                MeetingModel(
+                    id=uuid4(),
+                    name=f"Встреча {i}",
+                    resume="Итоги встречи",
+                    date=now + timedelta(days=i),
+                    status=MeetingStatus.SCHEDULED,
+                    team_id=team_id,
+                )
+                for i in range(PAGE_SIZE)
+            ],
+        ),
+    }
+
+
+def build_app(schema: type[BaseModel], rows: list, fast: bool) -> FastAPI:
+    app = FastAPI()
+
+    # Страница валидируется один раз, как в сервисе; замеряется только ответ
+    page = Page[schema](
+        items=[schema.model_validate(row, from_attributes=True) for row in rows],
+        next_cursor="cursor",
+    )
+
+    if fast:
+        @app.get("/", response_model=Page[schema])
+        async def endpoint():
+            return ModelResponse(page)
+    else:
+        @app.get("/", response_model=Page[schema])
+        async def endpoint():
+            return page
+
+    return app
+
+
+async def _throughput(app: FastAPI) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Прогрев: сборка схем FastAPI и сериализаторов pydantic
+        (await client.get("/")).raise_for_status()
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            (await client.get("/")).raise_for_status()
+        return REQUESTS / (time.perf_counter() - started)
+
+
+async def main() -> None:
+    print(f"{PAGE_SIZE} rows per page, {REQUESTS} requests")
+    print(f"{'endpoint':<14}  {'before rps':>10}  {'after rps':>9}  speedup")
+    for path, (schema, rows) in _rows().items():
+        before = await _throughput(build_app(schema, rows, fast=False))
+        after = await _throughput(build_app(schema, rows, fast=True))
+        print(f"{path:<14}  {before:>10.1f}  {after:>9.1f}  {after / before:>6.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
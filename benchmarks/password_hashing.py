@@ -0,0 +1,96 @@
+"""
+Задержка несвязанного эндпоинта (/ping) во время всплеска логинов:
+проверка пароля bcrypt прямо в event loop против PasswordHasher.
+
+Запуск (БД не нужна, логин проверяет только пароль):
+    python -m benchmarks.password_hashing
+"""
+import asyncio
+import statistics
+import time
+
+import httpx
+from fastapi import FastAPI
+
+from app.infrastructure.security.password_hasher import password_hasher, pwd_context
+
+LOGINS = 32
+PING_INTERVAL = 0.005
+PASSWORD = "correct horse battery staple"
+
+
+def build_app(hashed_password: str, offloaded: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    @app.post("/login")
+    async def login():
+        if offloaded:
+            ok = await password_hasher.verify(PASSWORD, hashed_password)
+        else:
+            # Старый путь: синхронный bcrypt внутри async-эндпоинта
+            ok = pwd_context.verify(PASSWORD, hashed_password)
+        return {"ok": ok}
+
+    return app
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    values = sorted(values)
+    index = min(len(values) - 1, round(percent / 100 * (len(values) - 1)))
+    return values[index]
+
+
+async def run(offloaded: bool, hashed_password: str) -> dict:
+    transport = httpx.ASGITransport(app=build_app(hashed_password, offloaded))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.get("/ping")
+        latencies: list[float] = []
+        done = asyncio.Event()
+
+        async def pinger():
+            # Задержка считается от запланированного момента отправки, иначе
+            # заблокированный loop просто отправит меньше пингов и спрячет паузу
+            scheduled = time.perf_counter()
+            while not done.is_set():
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                await client.get("/ping")
+                latencies.append(time.perf_counter() - scheduled)
+                scheduled += PING_INTERVAL
+
+        pinger_task = asyncio.create_task(pinger())
+        started = time.perf_counter()
+        await asyncio.gather(*(client.post("/login") for _ in range(LOGINS)))
+        burst = time.perf_counter() - started
+        done.set()
+        await pinger_task
+
+    return {
+        "burst_s": burst,
+        "pings": len(latencies),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": _percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
+
+
+async def main():
+    hashed_password = pwd_context.hash(PASSWORD)
+    # Пул процессов поднимается до замера
+    await password_hasher.verify(PASSWORD, hashed_password)
+    print(f"{LOGINS} concurrent logins, /ping every {PING_INTERVAL * 1000:.0f} ms")
+    print(f"{'mode':<12}{'burst s':>10}{'pings':>8}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for name, offloaded in (("in loop", False), ("offloaded", True)):
+        result = await run(offloaded, hashed_password)
+        print(
+            f"{name:<12}{result['burst_s']:>10.2f}{result['pings']:>8}"
+            f"{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['max_ms']:>10.1f}"
+        )
+    password_hasher.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+"""
+Стоимость преобразования ORM-строк в DTO на строку для списка из 10k строк:
+_to_schema в цикле (model_validate с обходом атрибутов) против
+_to_schemas (один TypeAdapter(list[...]) по __dict__ строк).
+
+Запуск (БД не нужна, строки создаются в памяти):
+    python -m benchmarks.schema_conversion
+"""
+import time
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from sqlalchemy.orm import configure_mappers
+
+from app.application.services.base_service import BaseService
+from app.application.services.meeting_service import MeetingService
+from app.application.services.students_service import StudentService
+from app.application.services.task_service import TaskService
+from app.application.services.team_service import TeamService
+from app.domain.enums.meeting_status import MeetingStatus
+from app.infrastructure.database.models.meetings.meeting import MeetingModel
+from app.infrastructure.database.models.meetings.task import TaskModel
+from app.infrastructure.database.models.persons.student import StudentModel
+from app.infrastructure.database.models.teams.team import TeamModel
+
+ROWS = 10_000
+REPEATS = 5
+
+
+def _rows() -> dict[type[BaseService], list]:
+    now = datetime.now(tz=timezone.utc)
+    team_id = uuid4()
+    return {
+        TeamService: [
+            TeamModel(id=uuid4(), name=f"Команда {i}", group_link=f"https://t.me/team{i}")
+            for i in range(ROWS)
+        ],
+        StudentService: [
+            StudentModel(
+                id=uuid4(),
+                first_name="Иван",
+                last_name="Иванов",
+                patronymic="Иванович",
+                email=f"student{i}@example.com",
+                tg_link=f"@student{i}",
+            )
+            for i in range(ROWS)
+        ],
+        MeetingService: [
+            MeetingModel(
+                id=uuid4(),
+                name=f"Встреча {i}",
+                resume="Итоги встречи",
+                date=now + timedelta(days=i),
+                status=MeetingStatus.SCHEDULED,
+                team_id=team_id,
+                previous_meeting_id=None,
+                next_meeting_id=None,
+            )
+            for i in range(ROWS)
+        ],
+        TaskService: [
+            TaskModel(id=uuid4(), description=f"Задача {i}", is_completed=False)
+            for i in range(ROWS)
+        ],
+    }
+
+
+def _per_row_us(func) -> float:
+    best = min(_timed(func) for _ in range(REPEATS))
+    return best / ROWS * 1_000_000
+
+
+def _timed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    configure_mappers()
+    print(f"{ROWS} rows, best of {REPEATS}, microseconds per row")
+    print(f"{'service':<15}  {'_to_schema':>10}  {'_to_schemas':>11}  speedup")
+    for service_class, rows in _rows().items():
+        # Преобразование не трогает репозиторий, сервису нужны только схемы
+        service = service_class.__new__(service_class)
+        service._to_schemas(rows[:1])
+        before = _per_row_us(lambda: [service._to_schema(row) for row in rows])
+        after = _per_row_us(lambda: service._to_schemas(rows))
+        print(
+            f"{service_class.__name__:<15}  {before:>10.2f}  {after:>11.2f}  {before / after:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
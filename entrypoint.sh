@@ -4,5 +4,12 @@ echo "Выполняются миграции..."
 cd /backend
 alembic upgrade head
 
-echo "Миграции применены, запускается сервер..."
-poetry run uvicorn app.main:main_app --host 0.0.0.0 --port 8000
+# Воркеры пишут метрики в общий каталог, /metrics суммирует их по процессам
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/prometheus}"
+rm -rf "$PROMETHEUS_MULTIPROC_DIR"
+mkdir -p "$PROMETHEUS_MULTIPROC_DIR"
+
+echo "Миграции применены, запускается сервер (воркеров: ${RUN__WORKERS:-1})..."
+exec poetry run uvicorn app.main:main_app --host 0.0.0.0 --port 8000 \
+    --workers "${RUN__WORKERS:-1}" --loop uvloop --http httptools \
+    --timeout-graceful-shutdown "${RUN__SHUTDOWN_TIMEOUT:-20}"
@@ -0,0 +1,73 @@
+import pytest
+from uuid import uuid4
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+from app.api.utils.auth import validate_curator
+from app.application.services.auth_service import AuthService
+from app.core.config import settings
+from app.infrastructure.cache.principal_cache import principal_cache
+from app.infrastructure.database.models import CuratorModel
+from app.infrastructure.database.repositories.curator_repository import CuratorRepository
+
+
+@pytest.mark.asyncio
+async def test_validate_curator_uses_principal_cache(session: AsyncSession, monkeypatch):
+    monkeypatch.setattr(settings.hash, "access_secret", "test-secret")
+    monkeypatch.setattr(settings.hash, "algorithm", "HS256")
+    repo = CuratorRepository(session)
+    curator = await repo.create(CuratorModel(
+        first_name="Principal",
+        last_name="Cache",
+        email=f"{uuid4()}@example.com",
+        hashed_password="x",
+    ))
+    access = AuthService._create_access_token(curator.id)
+    authorization = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access.token)
+
+    statements = []
+
+    def collect(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    sync_engine = session.bind.engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", collect)
+    try:
+        # Промах: один запрос существования, попадание: ни одного
+        assert (await validate_curator(authorization, repo))[0] == curator.id
+        assert len(statements) == 1
+        assert "JOIN" not in statements[0]
+        await validate_curator(authorization, repo)
+        assert len(statements) == 1
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", collect)
+
+    curator_id, jti, expires_at = AuthService.get_access_claims(access.token)
+    await principal_cache.revoke(curator_id, jti, expires_at)
+    with pytest.raises(HTTPException):
+        await validate_curator(authorization, repo)
+
+
+@pytest.mark.asyncio
+async def test_validate_curator_ignores_principal_written_after_revoke(
+    session: AsyncSession, monkeypatch
+):
+    monkeypatch.setattr(settings.hash, "access_secret", "test-secret")
+    monkeypatch.setattr(settings.hash, "algorithm", "HS256")
+    repo = CuratorRepository(session)
+    curator = await repo.create(CuratorModel(
+        first_name="Racing",
+        last_name="Logout",
+        email=f"{uuid4()}@example.com",
+        hashed_password="x",
+    ))
+    access = AuthService._create_access_token(curator.id)
+    authorization = HTTPAuthorizationCredentials(scheme="Bearer", credentials=access.token)
+    curator_id, jti, expires_at = AuthService.get_access_claims(access.token)
+
+    # Запрос, начавшийся до logout, записал principal уже после отзыва
+    await principal_cache.revoke(curator_id, jti, expires_at)
+    await principal_cache.set_valid(curator_id, jti)
+    with pytest.raises(HTTPException):
+        await validate_curator(authorization, repo)
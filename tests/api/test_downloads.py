@@ -0,0 +1,43 @@
+import pytest
+from datetime import datetime, timezone
+from io import BytesIO
+from botocore.response import StreamingBody
+from starlette.requests import Request
+from app.api.utils.downloads import stream_object
+
+
+def _request(**headers) -> Request:
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+@pytest.mark.asyncio
+async def test_stream_object_range_and_conditional_get(s3_stubber, artifact_s3_client):
+    last_modified = datetime(2026, 10, 1, tzinfo=timezone.utc)
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "artifacts"})
+    s3_stubber.add_response(
+        "get_object",
+        {"Body": StreamingBody(BytesIO(b"2345"), 4), "ContentLength": 4,
+         "ContentRange": "bytes 2-5/10", "ContentType": "video/mp4",
+         "ETag": '"v1"', "LastModified": last_modified},
+        {"Bucket": "artifacts", "Key": "video.mp4", "Range": "bytes=2-5"},
+    )
+    response = await stream_object(_request(range="bytes=2-5"), artifact_s3_client, "video.mp4")
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 2-5/10"
+    assert response.headers["etag"] == '"v1"'
+    assert response.headers["last-modified"] == "Thu, 01 Oct 2026 00:00:00 GMT"
+    assert b"".join([chunk async for chunk in response.body_iterator]) == b"2345"
+
+    # Условие проверяет S3, ответ 304 отдается без тела
+    s3_stubber.add_client_error(
+        "get_object", "304", http_status_code=304,
+        expected_params={"Bucket": "artifacts", "Key": "video.mp4", "IfNoneMatch": '"v1"'},
+        response_meta={"HTTPHeaders": {"etag": '"v1"'}},
+    )
+    response = await stream_object(_request(if_none_match='"v1"'), artifact_s3_client, "video.mp4")
+    assert response.status_code == 304
+    assert response.headers["etag"] == '"v1"'
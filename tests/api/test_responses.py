@@ -0,0 +1,34 @@
+import json
+import pytest
+from fastapi.encoders import jsonable_encoder
+from app.api.utils.responses import ModelResponse, json_array_chunks, ndjson_chunks
+from app.application.dto.pagination import Page
+from app.domain.entities.teams.team import Team
+
+
+def test_model_response_matches_response_model_json():
+    page = Page[Team](
+        items=[Team(name="Команда", group_link="https://t.me/team")], next_cursor="c"
+    )
+    response = ModelResponse(page)
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == jsonable_encoder(page)
+
+
+@pytest.mark.asyncio
+async def test_stream_chunks_ndjson_and_json_array():
+    batches = [
+        [Team(name=f"Team {n}") for n in range(2)],
+        [Team(name="Team 2")],
+    ]
+
+    async def replay(items):
+        for batch in items:
+            yield batch
+
+    ndjson = b"".join([chunk async for chunk in ndjson_chunks(replay(batches))])
+    names = [json.loads(line)["name"] for line in ndjson.splitlines()]
+    assert names == ["Team 0", "Team 1", "Team 2"]
+    array = b"".join([chunk async for chunk in json_array_chunks(replay(batches))])
+    assert [item["name"] for item in json.loads(array)] == names
+    assert b"".join([chunk async for chunk in json_array_chunks(replay([]))]) == b"[]"
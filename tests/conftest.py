@@ -1,8 +1,11 @@
+import boto3
 import pytest
 import pytest_asyncio
+from botocore.stub import Stubber
 from testcontainers.postgres import PostgresContainer
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from app.infrastructure.database.entity_base import BaseEntity
+from app.infrastructure.s3_storage.s3_client import S3Client
 
 
 @pytest.fixture(scope="session")
@@ -36,9 +39,39 @@ async def async_engine(postgres_url):
 async def session(async_engine):
     async with async_engine.connect() as conn:
         trans = await conn.begin()
-        async_session = AsyncSession(bind=conn, expire_on_commit=False)
+        async_session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
         try:
             yield async_session
         finally:
             await async_session.close()
             await trans.rollback()
+
+
+@pytest.fixture
+def boto_client():
+    """boto3-клиент S3 без сети, ответы задаются через Stubber"""
+    return boto3.client(
+        "s3",
+        endpoint_url="http://minio.test:9000",
+        aws_access_key_id="test",
+        aws_secret_access_key="test",
+        region_name="us-east-1",
+    )
+
+
+@pytest.fixture
+def s3_stubber(boto_client):
+    """Активный Stubber; в конце теста все заданные ответы должны быть использованы"""
+    with Stubber(boto_client) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+@pytest.fixture
+def artifact_s3_client(boto_client) -> S3Client:
+    """Клиент бакета артефактов без политики, формы подписываются тем же клиентом"""
+    return S3Client("artifacts", None, client=boto_client, presign_client=boto_client)
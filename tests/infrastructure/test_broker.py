@@ -0,0 +1,67 @@
+import asyncio
+import pytest
+from app.infrastructure.msBroker.memory import InMemoryBroker
+
+
+@pytest.mark.asyncio
+async def test_in_memory_broker_retries_and_dead_letters():
+    broker = InMemoryBroker(
+        max_attempts=3, retry_base_delay=0, retry_max_delay=0, concurrency={"default": 2}
+    )
+    calls = {"flaky": 0, "broken": 0}
+    dead_payloads = []
+
+    @broker.handler("flaky")
+    async def flaky(payload):
+        calls["flaky"] += 1
+        if calls["flaky"] < 3:
+            raise RuntimeError("temporary")
+
+    @broker.handler("broken")
+    async def broken(payload):
+        calls["broken"] += 1
+        raise RuntimeError("permanent")
+
+    @broker.on_dead_letter("broken")
+    async def on_broken_dead(payload):
+        dead_payloads.append(payload)
+
+    await broker.run_workers()
+    try:
+        await broker.enqueue("flaky", {"n": 1})
+        await broker.enqueue("broken", {"n": 2})
+        await broker.join()
+    finally:
+        await broker.close()
+
+    assert calls == {"flaky": 3, "broken": 3}
+    [dead] = broker.dead_letters["default"]
+    assert dead.name == "broken"
+    assert dead.attempt == 3
+    assert dead.last_error == "RuntimeError: permanent"
+    assert dead_payloads == [{"n": 2}]
+    with pytest.raises(ValueError):
+        await broker.enqueue("unknown")
+
+
+@pytest.mark.asyncio
+async def test_broker_close_waits_for_running_jobs():
+    broker = InMemoryBroker(
+        max_attempts=1, retry_base_delay=0, retry_max_delay=0, concurrency={"default": 2}
+    )
+    started = asyncio.Event()
+    finished = []
+
+    @broker.handler("slow")
+    async def slow(payload):
+        started.set()
+        await asyncio.sleep(0.05)
+        finished.append(payload["n"])
+
+    await broker.run_workers()
+    await broker.enqueue("slow", {"n": 1})
+    await started.wait()
+    await broker.close(timeout=5)
+
+    assert finished == [1]
+    assert not broker._workers
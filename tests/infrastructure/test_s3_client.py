@@ -0,0 +1,30 @@
+import pytest
+from botocore.stub import ANY
+from app.infrastructure.s3_storage.s3_client import S3Client
+
+
+@pytest.mark.asyncio
+async def test_bucket_is_checked_once_per_client(s3_stubber, boto_client):
+    s3_client = S3Client("curators", {"Version": "2012-10-17"}, client=boto_client)
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "curators"})
+    s3_stubber.add_response("put_bucket_policy", {}, {"Bucket": "curators", "Policy": ANY})
+    for _ in range(2):
+        s3_stubber.add_response("delete_object", {}, {"Bucket": "curators", "Key": "a"})
+
+    await s3_client.delete_object("a")
+    await s3_client.delete_object("a")
+
+
+@pytest.mark.asyncio
+async def test_head_object_returns_none_for_missing_object(s3_stubber, artifact_s3_client):
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "artifacts"})
+    s3_stubber.add_client_error(
+        "head_object", "404", http_status_code=404,
+        expected_params={"Bucket": "artifacts", "Key": "missing"},
+    )
+    s3_stubber.add_response(
+        "head_object", {"ContentLength": 3}, {"Bucket": "artifacts", "Key": "present"}
+    )
+
+    assert await artifact_s3_client.head_object("missing") is None
+    assert (await artifact_s3_client.head_object("present"))["ContentLength"] == 3
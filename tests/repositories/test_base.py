@@ -1,8 +1,18 @@
 import pytest
-from uuid import UUID
+from uuid import UUID, uuid4
+from prometheus_client import REGISTRY
+from sqlalchemy import event, exc, insert
+from sqlalchemy.ext.asyncio import create_async_engine
 
+from app.core.config import DatabaseConfig
+from app.core.database import DatabaseHelper
+from app.core.db_pool import InstrumentedQueuePool
+from app.core.query_stats import track_queries
+from app.infrastructure.cache.entity_cache import EntityCache
+from app.infrastructure.cache.memory import InMemoryCache
 from app.infrastructure.database.repositories.base_repository import BaseRepository
 from app.infrastructure.database.models.teams.team import TeamModel
+from app.infrastructure.database.warmup import hot_statements
 
 
 @pytest.mark.asyncio
@@ -34,6 +44,23 @@ async def test_get_list_with_filter(session):
     assert teams[0].name == "Team 1"
 
 
+@pytest.mark.asyncio
+async def test_get_rows_page_matches_get_page_without_orm_objects(session):
+    repo = BaseRepository(TeamModel, session)
+    for n in range(3):
+        await repo.create(TeamModel(name=f"Row team {n}"))
+    session.expunge_all()
+
+    objs, cursor = await repo.get_page(2)
+    session.expunge_all()
+    rows, rows_cursor = await repo.get_rows_page(["name"], 2)
+
+    assert [row["name"] for row in rows] == [obj.name for obj in objs]
+    assert rows_cursor == cursor
+    # Строки не попадают в identity map сессии
+    assert len(session.identity_map) == 0
+
+
 @pytest.mark.asyncio
 async def test_update(session):
     repo = BaseRepository(TeamModel, session)
@@ -49,3 +76,184 @@ async def test_delete(session):
     await repo.delete(team)
     deleted = await repo.get_by_id(team.id)
     assert deleted is None
+
+
+@pytest.mark.asyncio
+async def test_get_page(session):
+    repo = BaseRepository(TeamModel, session)
+    for i in range(5):
+        await repo.create(TeamModel(name=f"Page Team {i}"))
+    first, cursor = await repo.get_page(limit=3)
+    assert len(first) == 3
+    assert cursor is not None
+    second, next_cursor = await repo.get_page(limit=3, cursor=cursor)
+    assert len(second) == 2
+    assert next_cursor is None
+    assert {t.id for t in first}.isdisjoint({t.id for t in second})
+
+
+@pytest.mark.asyncio
+async def test_write_is_single_statement(session):
+    repo = BaseRepository(TeamModel, session)
+    statements = []
+
+    def collect(conn, cursor, statement, *args):
+        if not statement.startswith(("SAVEPOINT", "RELEASE")):
+            statements.append(statement)
+
+    sync_engine = session.bind.engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", collect)
+    try:
+        team = await repo.create(TeamModel(name="Returning Team"))
+        await repo.update(team, {"name": "Returning Team 2"})
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", collect)
+
+    assert len(statements) == 2
+    assert all("RETURNING" in statement for statement in statements)
+    assert team.created_at is not None
+    assert team.updated_at is not None
+
+
+@pytest.mark.asyncio
+async def test_update_and_delete_by_id(session):
+    repo = BaseRepository(TeamModel, session)
+    team = await repo.create(TeamModel(name="By Id"))
+
+    updated = await repo.update_by_id(team.id, {"name": "By Id Updated"})
+    assert updated is not None
+    assert updated.name == "By Id Updated"
+    assert await repo.update_by_id(uuid4(), {"name": "Missing"}) is None
+
+    assert await repo.delete_by_id(team.id) is True
+    assert await repo.delete_by_id(team.id) is False
+    assert await repo.get_by_id(team.id) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_upsert_delete(session):
+    repo = BaseRepository(TeamModel, session)
+    created = await repo.bulk_create([{"name": f"Bulk {i}"} for i in range(3)])
+    assert [team.name for team in created] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    assert all(team.created_at is not None for team in created)
+
+    upserted = await repo.bulk_upsert(
+        [{"id": created[0].id, "name": "Bulk 0 Updated"}, {"name": "Bulk 3"}],
+        index_elements=["id"],
+        update_fields=["name"],
+    )
+    assert {team.name for team in upserted} == {"Bulk 0 Updated", "Bulk 3"}
+
+    skipped = await repo.bulk_upsert(
+        [{"id": created[1].id, "name": "Ignored"}], index_elements=["id"]
+    )
+    assert skipped == []
+
+    ids = [team.id for team in created]
+    deleted = await repo.bulk_delete(ids + [uuid4()])
+    assert set(deleted) == set(ids)
+    assert await repo.get_existing_ids(ids) == set()
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_uses_entity_cache(session):
+    cache = EntityCache(InMemoryCache(), prefix="test:", ttl={"teams": 60})
+    repo = BaseRepository(TeamModel, session)
+    repo._cache = cache
+    team_id = uuid4()
+    # Строка вставлена мимо ORM: ее нет ни в identity map, ни среди измененных
+    await session.execute(insert(TeamModel).values(id=team_id, name="Cached"))
+
+    selects = []
+
+    def collect(conn, cursor, statement, *args):
+        if statement.startswith("SELECT"):
+            selects.append(statement)
+
+    sync_engine = session.bind.engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", collect)
+    try:
+        loaded = await repo.get_by_id(team_id)
+        session.expunge_all()
+        cached = await repo.get_by_id(team_id)
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", collect)
+
+    assert len(selects) == 1
+    assert cached is not loaded
+    assert cached.id == team_id
+    assert cached.name == "Cached"
+    assert cached.created_at == loaded.created_at
+    assert cached in session
+
+    # Изменение видно в своей транзакции, а из кеша ключ уходит после коммита
+    await repo.update_by_id(team_id, {"name": "Renamed"})
+    session.expunge_all()
+    assert (await repo.get_by_id(team_id)).name == "Renamed"
+    key = cache.key(TeamModel, team_id)
+    assert await cache.backend.get(key) is not None
+    await cache.flush(session)
+    assert await cache.backend.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_track_queries_counts_repeated_statements(session):
+    repo = BaseRepository(TeamModel, session)
+    teams = [await repo.create(TeamModel(name=f"Team {i}")) for i in range(3)]
+    session.expunge_all()
+
+    with track_queries(track_shapes=True) as stats:
+        # N+1: один и тот же запрос на каждую команду
+        for team in teams:
+            await repo.get_by_id(team.id)
+        await repo.get_existing_ids([team.id for team in teams])
+
+    assert stats.count == 4
+    assert stats.duration > 0
+    [(shape, repeats)] = stats.repeated(threshold=2)
+    assert repeats == 3
+    assert "FROM teams" in shape
+
+
+@pytest.mark.asyncio
+async def test_instrumented_pool_counts_checkout_timeouts(postgres_url):
+    engine = create_async_engine(
+        postgres_url,
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    timeouts = REGISTRY.get_sample_value("db_pool_checkout_timeouts_total")
+    try:
+        async with engine.connect():
+            assert REGISTRY.get_sample_value("db_pool_checked_out") == 1
+            # Единственное соединение занято, второе не дождется таймаута
+            with pytest.raises(exc.TimeoutError):
+                async with engine.connect():
+                    pass
+        assert REGISTRY.get_sample_value("db_pool_checked_out") == 0
+    finally:
+        await engine.dispose()
+    assert REGISTRY.get_sample_value("db_pool_checkout_timeouts_total") == timeouts + 1
+
+
+@pytest.mark.asyncio
+async def test_warm_up_opens_pool_connections(postgres_url):
+    helper = DatabaseHelper(postgres_url, pool_size=2, max_overflow=0)
+    statements = hot_statements()
+    try:
+        with track_queries() as stats:
+            await helper.warm_up(connections=5, statements=statements)
+        # Не больше pool_size соединений, и все остаются открытыми в пуле
+        assert helper.engine.pool.checkedin() == 2
+        assert stats.count == 2 * len(statements)
+    finally:
+        await helper.dispose()
+
+
+def test_pool_limits_split_connection_budget_across_workers():
+    config = DatabaseConfig(pool_size=50, max_overflow=10, max_connections=80)
+    assert config.pool_limits(workers=4) == (17, 3)
+    assert config.pool_limits(workers=100) == (1, 0)
+    assert DatabaseConfig(pool_size=50, max_overflow=10).pool_limits(workers=4) == (50, 10)
@@ -0,0 +1,398 @@
+import json
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event, insert, text
+
+from app.domain.enums.artifact_status import ArtifactStatus
+from app.domain.enums.artifact_type import ArtifactType
+from app.domain.enums.meeting_status import MeetingStatus
+from app.domain.enums.project_status import ProjectStatus
+from app.domain.enums.project_team_status import ProjectTeamStatus
+from app.domain.enums.semester import Semester
+from app.domain.enums.upload_status import UploadStatus
+from app.infrastructure.database.models import (
+    ArtifactBlobModel,
+    ArtifactLinkModel,
+    ArtifactModel,
+    CuratorModel,
+    MeetingModel,
+    MeetingTaskModel,
+    MultipartUploadModel,
+    MultipartUploadPartModel,
+    OutboxEventModel,
+    ProjectModel,
+    ProjectTeamModel,
+    RefreshTokenModel,
+    StudentModel,
+    TaskModel,
+    TeamMemberModel,
+    TeamModel,
+)
+from app.infrastructure.database.pagination import encode_cursor
+from app.infrastructure.database.repositories.artifact_repository import ArtifactRepository
+from app.infrastructure.database.repositories.curator_repository import CuratorRepository
+from app.infrastructure.database.repositories.meeting_repository import MeetingRepository
+from app.infrastructure.database.repositories.meeting_task_repository import (
+    MeetingTaskRepository,
+)
+from app.infrastructure.database.repositories.multipart_upload_repository import (
+    MultipartUploadRepository,
+)
+from app.infrastructure.database.repositories.outbox_repository import OutboxRepository
+from app.infrastructure.database.repositories.project_team_repository import (
+    ProjectTeamRepository,
+)
+from app.infrastructure.database.repositories.student_repository import StudentRepository
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+from app.infrastructure.database.repositories.team_member_repository import (
+    TeamMemberRepository,
+)
+from app.infrastructure.database.repositories.team_repository import TeamRepository
+from app.infrastructure.database.repositories.token_repository import TokenRepository
+
+# Таблицы, которые растут вместе с данными; полный проход по ним - регрессия
+LARGE_TABLES = {
+    "teams",
+    "students",
+    "curators",
+    "projects",
+    "meetings",
+    "tasks",
+    "meeting_tasks",
+    "team_members",
+    "project_teams",
+    "auth_sessions",
+    "artifacts",
+    "artifact_blobs",
+    "artifact_links",
+    "multipart_uploads",
+    "multipart_upload_parts",
+    "outbox_events",
+}
+
+TEAMS = 100
+MEETINGS_PER_TEAM = 10
+MEMBERS_PER_TEAM = 5
+# Фоновые опросы: большая часть строк уже обработана или ждет повтора
+OUTBOX_EVENTS = 1000
+OUTBOX_DEAD_EVENTS = 950
+OUTBOX_MAX_ATTEMPTS = 10
+
+
+async def _seed(session) -> dict:
+    now = datetime.now(tz=timezone.utc)
+    team_ids = [uuid4() for _ in range(TEAMS)]
+    await session.execute(
+        insert(TeamModel), [{"id": i, "name": f"Team {n}"} for n, i in enumerate(team_ids)]
+    )
+
+    student_ids = [uuid4() for _ in range(TEAMS * MEMBERS_PER_TEAM)]
+    await session.execute(
+        insert(StudentModel),
+        [{"id": i, "first_name": "S", "last_name": f"{n}"} for n, i in enumerate(student_ids)],
+    )
+    await session.execute(
+        insert(TeamMemberModel),
+        [
+            {"team_id": team_ids[n // MEMBERS_PER_TEAM], "student_id": student_id}
+            for n, student_id in enumerate(student_ids)
+        ],
+    )
+
+    meetings = []
+    for team_id in team_ids:
+        for n in range(MEETINGS_PER_TEAM):
+            meetings.append({
+                "id": uuid4(),
+                "name": f"Meeting {n}",
+                "date": now + timedelta(days=n - MEETINGS_PER_TEAM // 2),
+                "team_id": team_id,
+                "status": (
+                    MeetingStatus.COMPLETED if n < MEETINGS_PER_TEAM // 2
+                    else MeetingStatus.SCHEDULED
+                ),
+            })
+    await session.execute(insert(MeetingModel), meetings)
+
+    task_ids = [uuid4() for _ in meetings]
+    await session.execute(
+        insert(TaskModel),
+        [{"id": i, "description": "Task", "is_completed": n % 2 == 0} for n, i in enumerate(task_ids)],
+    )
+    await session.execute(
+        insert(MeetingTaskModel),
+        [{"meeting_id": m["id"], "task_id": t} for m, t in zip(meetings, task_ids)],
+    )
+
+    project_ids = [uuid4() for _ in range(TEAMS // 2)]
+    await session.execute(
+        insert(ProjectModel),
+        [
+            {
+                "id": i,
+                "name": f"Project {n}",
+                "year": 2026,
+                "semester": Semester.AUTUMN,
+                "status": ProjectStatus.IN_PROGRESS,
+            }
+            for n, i in enumerate(project_ids)
+        ],
+    )
+    await session.execute(
+        insert(ProjectTeamModel),
+        [
+            {
+                "project_id": project_ids[n % len(project_ids)],
+                "team_id": team_id,
+                "status": ProjectTeamStatus.ACTIVE,
+            }
+            for n, team_id in enumerate(team_ids)
+        ],
+    )
+
+    curator_id = uuid4()
+    await session.execute(
+        insert(CuratorModel),
+        [{
+            "id": curator_id,
+            "first_name": "C",
+            "last_name": "C",
+            "email": "curator@example.com",
+            "hashed_password": "x",
+        }],
+    )
+    await session.execute(
+        insert(RefreshTokenModel),
+        [
+            {
+                "curator_id": curator_id,
+                "token_hash": f"hash-{n}",
+                "expires_at": now + timedelta(days=30),
+                "is_revoked": n % 2 == 1,
+            }
+            for n in range(200)
+        ],
+    )
+
+    # Артефакт на встречу; файлы готовы, кроме нескольких в обработке
+    blob_ids = [uuid4() for _ in meetings]
+    await session.execute(
+        insert(ArtifactBlobModel),
+        [
+            {"id": i, "sha256": f"{n:064x}", "storage_key": f"content/{n}", "ref_count": 1,
+             "stored": True}
+            for n, i in enumerate(blob_ids)
+        ],
+    )
+    artifact_ids = [uuid4() for _ in meetings]
+    await session.execute(
+        insert(ArtifactModel),
+        [
+            {
+                "id": i,
+                "name": "Запись",
+                "type": ArtifactType.VIDEO,
+                "url": f"s3://artifacts/content/{n}",
+                "status": ArtifactStatus.PROCESSING if n % 50 == 0 else ArtifactStatus.READY,
+                "blob_id": blob_id,
+                "sha256": f"{n:064x}",
+            }
+            for n, (i, blob_id) in enumerate(zip(artifact_ids, blob_ids))
+        ],
+    )
+    await session.execute(
+        insert(ArtifactLinkModel),
+        [{"artifact_id": a, "meeting_id": m["id"]} for a, m in zip(artifact_ids, meetings)],
+    )
+
+    # Загрузки по встречам, почти все завершены
+    upload_ids = [uuid4() for _ in meetings]
+    await session.execute(
+        insert(MultipartUploadModel),
+        [
+            {
+                "id": i,
+                "meeting_id": m["id"],
+                "storage_key": f"meetings/{m['id']}/rec.mp4",
+                "s3_upload_id": f"s3-{n}",
+                "filename": "rec.mp4",
+                "content_type": "video/mp4",
+                "size": 2,
+                "part_size": 1,
+                "status": UploadStatus.IN_PROGRESS if n % 50 == 0 else UploadStatus.COMPLETED,
+            }
+            for n, (i, m) in enumerate(zip(upload_ids, meetings))
+        ],
+    )
+    await session.execute(
+        insert(MultipartUploadPartModel),
+        [
+            {"upload_id": i, "part_number": part, "etag": f'"e{part}"', "size": 1}
+            for i in upload_ids
+            for part in (1, 2)
+        ],
+    )
+
+    # Недоставленные за max_attempts события остаются в начале таблицы
+    await session.execute(
+        insert(OutboxEventModel),
+        [
+            {
+                "name": "MeetingCompleted",
+                "payload": {},
+                "attempts": OUTBOX_MAX_ATTEMPTS if n < OUTBOX_DEAD_EVENTS else 0,
+            }
+            for n in range(OUTBOX_EVENTS)
+        ],
+    )
+
+    for table in LARGE_TABLES:
+        await session.execute(text(f"ANALYZE {table}"))
+
+    return {
+        "now": now,
+        "team_id": team_ids[0],
+        "student_id": student_ids[0],
+        "meeting": meetings[0],
+        "task_id": task_ids[0],
+        "project_id": project_ids[0],
+        "curator_id": curator_id,
+        "artifact_id": artifact_ids[0],
+    }
+
+
+def _cases(session, seed: dict):
+    meeting = seed["meeting"]
+    team_id = seed["team_id"]
+    cursor = encode_cursor(meeting["date"], meeting["id"])
+    meeting_repo = MeetingRepository(session)
+    meeting_task_repo = MeetingTaskRepository(session)
+    project_team_repo = ProjectTeamRepository(session)
+    task_repo = TaskRepository(session)
+    team_member_repo = TeamMemberRepository(session)
+    team_repo = TeamRepository(session)
+    curator_repo = CuratorRepository(session)
+    artifact_repo = ArtifactRepository(session)
+    stale_cutoff = seed["now"] + timedelta(minutes=1)
+    return [
+        ("teams.get_by_id", lambda: team_repo.get_by_id(team_id)),
+        ("teams.get_page", lambda: team_repo.get_page(
+            10, encode_cursor(seed["now"], team_id))),
+        ("students.get_existing_ids", lambda: StudentRepository(session).get_existing_ids(
+            [seed["student_id"]])),
+        ("curators.get_by_id", lambda: curator_repo.get_by_id(seed["curator_id"])),
+        ("curators.get_list(email)", lambda: curator_repo.get_list(
+            email="curator@example.com")),
+        ("meetings.get_by_team_id", lambda: meeting_repo.get_by_team_id(team_id)),
+        ("meetings.get_by_team_id(status, dates)", lambda: meeting_repo.get_by_team_id(
+            team_id, MeetingStatus.SCHEDULED, seed["now"], seed["now"] + timedelta(days=30))),
+        ("meetings.get_upcoming_meeting", lambda: meeting_repo.get_upcoming_meeting(team_id)),
+        ("meetings.get_last_completed_meeting", lambda: meeting_repo.get_last_completed_meeting(
+            team_id)),
+        ("meetings.get_meeting_with_tasks", lambda: meeting_repo.get_meeting_with_tasks(
+            meeting["id"])),
+        ("meetings.get_all_ordered_by_date", lambda: meeting_repo.get_all_ordered_by_date(
+            10, cursor)),
+        ("meetings.get_all_rows_ordered_by_date",
+         lambda: meeting_repo.get_all_rows_ordered_by_date(("name",), 10, cursor)),
+        ("meeting_tasks.get_by_meeting_and_task", lambda: meeting_task_repo.get_by_meeting_and_task(
+            meeting["id"], seed["task_id"])),
+        ("meeting_tasks.get_by_meeting_id", lambda: meeting_task_repo.get_by_meeting_id(
+            meeting["id"])),
+        ("meeting_tasks.get_by_task_id", lambda: meeting_task_repo.get_by_task_id(
+            seed["task_id"])),
+        ("project_teams.get_by_project_and_team", lambda: project_team_repo.get_by_project_and_team(
+            seed["project_id"], team_id)),
+        ("project_teams.get_by_project_id", lambda: project_team_repo.get_by_project_id(
+            seed["project_id"], ProjectTeamStatus.ACTIVE)),
+        ("project_teams.get_by_team_id", lambda: project_team_repo.get_by_team_id(
+            team_id, ProjectTeamStatus.ACTIVE)),
+        ("project_teams.get_rows_by_project_id", lambda: project_team_repo.get_rows_by_project_id(
+            seed["project_id"], ("team_id", "status"), ProjectTeamStatus.ACTIVE)),
+        ("project_teams.get_rows_by_team_id", lambda: project_team_repo.get_rows_by_team_id(
+            team_id, ("project_id", "status"), ProjectTeamStatus.ACTIVE)),
+        ("project_teams.get_active_project_for_team_in_semester",
+         lambda: project_team_repo.get_active_project_for_team_in_semester(
+             team_id, 2026, Semester.AUTUMN)),
+        ("tasks.get_by_meeting_id", lambda: task_repo.get_by_meeting_id(meeting["id"])),
+        ("tasks.get_incomplete_tasks_by_team", lambda: task_repo.get_incomplete_tasks_by_team(
+            team_id)),
+        ("team_members.get_by_team_and_student", lambda: team_member_repo.get_by_team_and_student(
+            team_id, seed["student_id"])),
+        ("team_members.get_by_team_id", lambda: team_member_repo.get_by_team_id(team_id)),
+        ("team_members.get_by_student_id", lambda: team_member_repo.get_by_student_id(
+            seed["student_id"])),
+        ("team_members.get_rows_by_team_id", lambda: team_member_repo.get_rows_by_team_id(
+            team_id, ("student_id", "role"))),
+        ("team_members.get_rows_by_student_id", lambda: team_member_repo.get_rows_by_student_id(
+            seed["student_id"], ("team_id", "role"))),
+        ("auth_sessions.get_by_token_hash", lambda: TokenRepository(session).get_by_token_hash(
+            "hash-0")),
+        ("artifacts.get_by_meeting_id", lambda: artifact_repo.get_by_meeting_id(meeting["id"])),
+        ("artifacts.get_meeting_link", lambda: artifact_repo.get_meeting_link(
+            seed["artifact_id"], meeting["id"])),
+        ("artifacts.count_links", lambda: artifact_repo.count_links(seed["artifact_id"])),
+        ("artifacts.get_blob", lambda: artifact_repo.get_blob(f"{0:064x}")),
+        ("artifacts.get_stale_processing_locked",
+         lambda: artifact_repo.get_stale_processing_locked(stale_cutoff, 100)),
+        ("multipart_uploads.get_stale_locked",
+         lambda: MultipartUploadRepository(session).get_stale_locked(stale_cutoff, 100)),
+        ("outbox_events.get_pending_locked", lambda: OutboxRepository(session).get_pending_locked(
+            100, OUTBOX_MAX_ATTEMPTS)),
+    ]
+
+
+FULL_INDEX_SCANS = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+
+def _full_scans(plan: dict) -> set[str]:
+    """Таблицы, которые план читает полным проходом (по куче или по всему индексу)"""
+    found = set()
+    node_type = plan.get("Node Type")
+    if node_type == "Seq Scan":
+        found.add(plan["Relation Name"])
+    elif node_type in FULL_INDEX_SCANS and "Index Cond" not in plan:
+        # Индекс используется только ради порядка, условие проверяется фильтром
+        found.add(plan.get("Relation Name", plan.get("Index Name")))
+    for child in plan.get("Plans", []):
+        found |= _full_scans(child)
+    return found
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_use_indexes(session):
+    seed = await _seed(session)
+    conn = await session.connection()
+    # Планировщик выберет Seq Scan только там, где подходящего индекса нет вообще
+    await conn.exec_driver_sql("SET LOCAL enable_seqscan = off")
+
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    sync_engine = session.bind.engine.sync_engine
+    failures = []
+    for name, call in _cases(session, seed):
+        captured.clear()
+        event.listen(sync_engine, "before_cursor_execute", capture)
+        try:
+            await call()
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", capture)
+        assert captured, f"{name}: запрос не был выполнен"
+
+        for statement, parameters in captured:
+            result = await conn.exec_driver_sql(
+                f"EXPLAIN (FORMAT JSON) {statement}", parameters
+            )
+            raw_plan = result.scalar_one()
+            plan = (json.loads(raw_plan) if isinstance(raw_plan, str) else raw_plan)[0]["Plan"]
+            scanned = _full_scans(plan) & LARGE_TABLES
+            if scanned:
+                failures.append(f"{name}: полный проход по {sorted(scanned)}\n{statement}")
+
+    assert not failures, "\n\n".join(failures)
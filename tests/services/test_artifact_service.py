@@ -0,0 +1,395 @@
+import hashlib
+import pytest
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from uuid import uuid4
+from botocore.response import StreamingBody
+from botocore.exceptions import ClientError
+from botocore.stub import ANY, Stubber
+from fastapi import HTTPException
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.application.dto.upload import (
+    ArtifactByHash,
+    ArtifactUploadComplete,
+    MultipartUploadComplete,
+    MultipartUploadCreate,
+    UploadUrlRequest,
+)
+from app.application.services.artifact_service import ArtifactService
+from app.application.services.multipart_upload_service import MultipartUploadService
+from app.core.config import settings
+from app.domain.enums.artifact_status import ArtifactStatus
+from app.domain.enums.upload_status import UploadStatus
+from app.infrastructure.database.models.artifacts.multipart_upload_part import (
+    MultipartUploadPartModel,
+)
+from app.infrastructure.database.models.meetings.meeting import MeetingModel
+from app.infrastructure.database.models.outbox.outbox_event import OutboxEventModel
+from app.infrastructure.database.models.teams.team import TeamModel
+from app.infrastructure.database.repositories.artifact_repository import ArtifactRepository
+from app.infrastructure.database.repositories.base_repository import BaseRepository
+from app.infrastructure.database.repositories.meeting_repository import MeetingRepository
+from app.infrastructure.database.repositories.multipart_upload_repository import (
+    MultipartUploadRepository,
+)
+from app.infrastructure.s3_storage.s3_client import S3Client, content_key
+
+
+def _stub_store_content(stubber: Stubber, key, data: bytes, stored: bool = False):
+    """Ответы S3 фоновой задаче: хеш загруженного файла и перенос под ключ по содержимому"""
+    stubber.add_response(
+        "get_object",
+        {"Body": StreamingBody(BytesIO(data), len(data))},
+        {"Bucket": "artifacts", "Key": key},
+    )
+    if not stored:
+        # Управляемое копирование boto3 сначала узнает размер исходного объекта
+        stubber.add_response("head_object", {"ContentLength": len(data)})
+        stubber.add_response("copy_object", {})
+    stubber.add_response("delete_object", {}, {"Bucket": "artifacts", "Key": key})
+
+
+async def _create_meetings(session: AsyncSession, count: int) -> list:
+    team = await BaseRepository(TeamModel, session).create(TeamModel(name="Artifacts"))
+    return [
+        (await MeetingRepository(session).create(MeetingModel(
+            name=f"Demo {i}", date=datetime.now(tz=timezone.utc), team_id=team.id
+        ))).id
+        for i in range(count)
+    ]
+
+
+async def _uploaded_events(session: AsyncSession) -> list[dict]:
+    result = await session.scalars(
+        select(OutboxEventModel.payload).where(OutboxEventModel.name == "ArtifactUploaded")
+    )
+    return list(result)
+
+
+@pytest.mark.asyncio
+async def test_meeting_artifact_presigned_upload(
+    session: AsyncSession, s3_stubber: Stubber, artifact_s3_client: S3Client
+):
+    service = ArtifactService(
+        ArtifactRepository(session), MeetingRepository(session), artifact_s3_client
+    )
+    [meeting_id] = await _create_meetings(session, 1)
+
+    upload = await service.create_meeting_upload(
+        meeting_id, UploadUrlRequest(filename="demo day.mp4", content_type="video/mp4", size=10)
+    )
+    assert upload.key.startswith(f"meetings/{meeting_id}/")
+    assert upload.key.endswith("/demo_day.mp4")
+    assert upload.fields["key"] == upload.key
+    assert "policy" in upload.fields
+
+    # Бакет без политики: put_bucket_policy не вызывается
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "artifacts"})
+    s3_stubber.add_response(
+        "head_object",
+        {"ContentLength": 10, "ContentType": "video/mp4"},
+        {"Bucket": "artifacts", "Key": upload.key},
+    )
+    # API только проверяет объект, файл не читается
+    artifact = await service.complete_meeting_upload(
+        meeting_id, ArtifactUploadComplete(key=upload.key, name="Запись")
+    )
+    s3_stubber.assert_no_pending_responses()
+    assert artifact.status == ArtifactStatus.PROCESSING
+    assert await _uploaded_events(session) == [{"artifact_id": str(artifact.id)}]
+    with pytest.raises(HTTPException) as error:
+        await service.get_meeting_file(meeting_id, artifact.id)
+    assert error.value.status_code == 409
+
+    _stub_store_content(s3_stubber, upload.key, b"0123456789")
+    await service.store_upload(artifact.id)
+    # Повторная доставка задачи ничего не делает
+    await service.store_upload(artifact.id)
+
+    [stored] = await service.get_meeting_artifacts(meeting_id)
+    sha256 = hashlib.sha256(b"0123456789").hexdigest()
+    assert stored.id == artifact.id
+    assert (stored.status, stored.size, stored.sha256) == (ArtifactStatus.READY, 10, sha256)
+    assert (await service.get_meeting_file(meeting_id, artifact.id))[1] == content_key(sha256)
+    # Файл отдается потоком уже без открытой транзакции сессии запроса
+    assert not session.in_transaction()
+
+    with pytest.raises(HTTPException):
+        await service.complete_meeting_upload(
+            meeting_id, ArtifactUploadComplete(key=f"meetings/{uuid4()}/x/y.mp4", name="Чужой")
+        )
+
+
+@pytest.mark.asyncio
+async def test_stale_processing_artifact_is_requeued_and_removable(
+    session: AsyncSession, monkeypatch, s3_stubber: Stubber, artifact_s3_client: S3Client
+):
+    service = ArtifactService(
+        ArtifactRepository(session), MeetingRepository(session), artifact_s3_client
+    )
+    [meeting_id] = await _create_meetings(session, 1)
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "artifacts"})
+    keys = [f"meetings/{meeting_id}/{uuid4()}/rec.mp4" for _ in range(2)]
+    artifacts = []
+    for key, name in zip(keys, ("Потеряна", "Исчерпала попытки")):
+        s3_stubber.add_response("head_object", {"ContentLength": 10}, {"Bucket": "artifacts", "Key": key})
+        artifacts.append(await service.complete_meeting_upload(
+            meeting_id, ArtifactUploadComplete(key=key, name=name)
+        ))
+    lost, dead = artifacts
+
+    # Задача в dead letter: артефакт больше не ждет обработки
+    await service.fail_upload(dead.id)
+    with pytest.raises(HTTPException) as error:
+        await service.get_meeting_file(meeting_id, dead.id)
+    assert error.value.status_code == 404
+
+    # Пока обработка не зависла, повторов нет и удалять нельзя
+    assert await service.requeue_stale_uploads() == 0
+    with pytest.raises(HTTPException) as error:
+        await service.remove_meeting_artifact(meeting_id, lost.id)
+    assert error.value.status_code == 409
+
+    monkeypatch.setattr(settings.s3, "artifact_processing_timeout", 0)
+    assert await service.requeue_stale_uploads() == 1
+    assert await _uploaded_events(session) == [
+        {"artifact_id": str(lost.id)},
+        {"artifact_id": str(dead.id)},
+        {"artifact_id": str(lost.id)},
+    ]
+    # Зависший артефакт удаляется вместе с загруженной копией
+    s3_stubber.add_response("delete_object", {}, {"Bucket": "artifacts", "Key": keys[0]})
+    await service.remove_meeting_artifact(meeting_id, lost.id)
+    s3_stubber.assert_no_pending_responses()
+    assert [a.id for a in await service.get_meeting_artifacts(meeting_id)] == [dead.id]
+
+
+async def _chunks(data: bytes, size: int = 64 * 1024):
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+@pytest.mark.asyncio
+async def test_meeting_artifact_multipart_upload(
+    session: AsyncSession, monkeypatch, s3_stubber: Stubber, artifact_s3_client: S3Client
+):
+    monkeypatch.setattr(settings.s3.multipart, "part_size", 1)
+    s3_client = artifact_s3_client
+    service = MultipartUploadService(
+        MultipartUploadRepository(session),
+        ArtifactService(ArtifactRepository(session), MeetingRepository(session), s3_client),
+        MeetingRepository(session),
+        s3_client,
+    )
+    # Ошибка внутри unit of work откатывает сессию и сбрасывает загруженные объекты
+    [meeting_id] = await _create_meetings(session, 1)
+    # Часть округляется до 1 МБ: две части, вторая из 10 байт
+    data = b"x" * (1024 * 1024) + b"0123456789"
+
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "artifacts"})
+    s3_stubber.add_response(
+        "create_multipart_upload",
+        {"UploadId": "s3-upload"},
+        {"Bucket": "artifacts", "Key": ANY, "ContentType": "video/mp4"},
+    )
+    upload = await service.initiate(
+        meeting_id,
+        MultipartUploadCreate(filename="rec.mp4", content_type="video/mp4", size=len(data)),
+    )
+    assert (upload.part_count, upload.part_size) == (2, 1024 * 1024)
+
+    # Части в любом порядке; после обрыва состояние показывает загруженные
+    for number, part, etag in ((2, data[1024 * 1024:], '"e2"'), (1, data[:1024 * 1024], '"e1"')):
+        s3_stubber.add_response(
+            "upload_part",
+            {"ETag": etag},
+            {"Bucket": "artifacts", "Key": ANY, "UploadId": "s3-upload",
+             "PartNumber": number, "Body": ANY, "ContentLength": len(part),
+             "ContentMD5": ANY},
+        )
+        await service.upload_part(meeting_id, upload.id, number, _chunks(part))
+        if number == 2:
+            state = await service.get(meeting_id, upload.id)
+            assert [p.part_number for p in state.parts] == [2]
+            with pytest.raises(HTTPException):
+                await service.complete(meeting_id, upload.id, MultipartUploadComplete(name="Запись"))
+
+    with pytest.raises(HTTPException):
+        # Размер части не совпадает с ожидаемым
+        await service.upload_part(meeting_id, upload.id, 2, _chunks(b"short"))
+
+    # S3 отклонил сборку: загрузка возвращается в IN_PROGRESS, части можно перезагрузить
+    s3_stubber.add_client_error("complete_multipart_upload", "InvalidPart", http_status_code=400)
+    with pytest.raises(ClientError):
+        await service.complete(meeting_id, upload.id, MultipartUploadComplete(name="Запись"))
+    assert (await service.get(meeting_id, upload.id)).status == "IN_PROGRESS"
+
+    s3_stubber.add_response(
+        "complete_multipart_upload",
+        {},
+        {"Bucket": "artifacts", "Key": ANY, "UploadId": "s3-upload",
+         "MultipartUpload": {"Parts": [{"PartNumber": 1, "ETag": '"e1"'},
+                                       {"PartNumber": 2, "ETag": '"e2"'}]}},
+    )
+    artifact = await service.complete(meeting_id, upload.id, MultipartUploadComplete(name="Запись"))
+    s3_stubber.assert_no_pending_responses()
+
+    assert artifact.size == len(data)
+    assert artifact.status == ArtifactStatus.PROCESSING
+    state = await service.get(meeting_id, upload.id)
+    assert state.status == "COMPLETED" and state.artifact_id == artifact.id
+
+    _stub_store_content(s3_stubber, ANY, data)
+    await service.artifact_service.store_upload(artifact.id)
+    [stored] = await service.artifact_service.get_meeting_artifacts(meeting_id)
+    assert stored.status == ArtifactStatus.READY
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_multipart_complete_resumes_interrupted_assembly(
+    session: AsyncSession, s3_stubber: Stubber, artifact_s3_client: S3Client
+):
+    upload_repo = MultipartUploadRepository(session)
+    service = MultipartUploadService(
+        upload_repo,
+        ArtifactService(ArtifactRepository(session), MeetingRepository(session), artifact_s3_client),
+        MeetingRepository(session),
+        artifact_s3_client,
+    )
+    [meeting_id] = await _create_meetings(session, 1)
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "artifacts"})
+    s3_stubber.add_response("create_multipart_upload", {"UploadId": "s3-upload"})
+    upload = await service.initiate(
+        meeting_id, MultipartUploadCreate(filename="rec.mp4", content_type="video/mp4", size=5)
+    )
+    await upload_repo.upsert_part(upload.id, 1, '"e1"', 5)
+    # Процесс упал после коммита ASSEMBLING, но S3 успел собрать объект
+    await upload_repo.update_by_id(upload.id, {"status": UploadStatus.ASSEMBLING})
+
+    s3_stubber.add_client_error("complete_multipart_upload", "NoSuchUpload", http_status_code=404)
+    s3_stubber.add_response(
+        "head_object", {"ContentLength": 5}, {"Bucket": "artifacts", "Key": ANY}
+    )
+    artifact = await service.complete(meeting_id, upload.id, MultipartUploadComplete(name="Запись"))
+
+    state = await service.get(meeting_id, upload.id)
+    assert state.status == "COMPLETED" and state.artifact_id == artifact.id
+    assert state.parts == []
+    with pytest.raises(HTTPException):
+        await service.complete(meeting_id, upload.id, MultipartUploadComplete(name="Запись"))
+
+
+@pytest.mark.asyncio
+async def test_abort_stale_claims_uploads_and_backs_off_failures(
+    session: AsyncSession, s3_stubber: Stubber, artifact_s3_client: S3Client
+):
+    upload_repo = MultipartUploadRepository(session)
+    service = MultipartUploadService(
+        upload_repo,
+        ArtifactService(ArtifactRepository(session), MeetingRepository(session), artifact_s3_client),
+        MeetingRepository(session),
+        artifact_s3_client,
+    )
+    [meeting_id] = await _create_meetings(session, 1)
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "artifacts"})
+    uploads = []
+    for days in (3, 2):
+        s3_stubber.add_response("create_multipart_upload", {"UploadId": f"s3-{days}"})
+        upload = await service.initiate(
+            meeting_id, MultipartUploadCreate(filename="rec.mp4", content_type="video/mp4", size=5)
+        )
+        await upload_repo.upsert_part(upload.id, 1, '"e1"', 5)
+        await session.execute(
+            update(MultipartUploadPartModel)
+            .where(MultipartUploadPartModel.upload_id == upload.id)
+            .values(uploaded_at=datetime.now(tz=timezone.utc) - timedelta(days=days))
+        )
+        await upload_repo.update_by_id(
+            upload.id, {"updated_at": datetime.now(tz=timezone.utc) - timedelta(days=days)}
+        )
+        uploads.append(upload)
+    failing, stale = uploads
+
+    # Первая загрузка не прерывается в S3, вторая обрабатывается все равно
+    s3_stubber.add_client_error("abort_multipart_upload", "InternalError", http_status_code=500)
+    s3_stubber.add_response(
+        "abort_multipart_upload", {},
+        {"Bucket": "artifacts", "Key": ANY, "UploadId": "s3-2"},
+    )
+    assert await service.abort_stale() == 2
+    s3_stubber.assert_no_pending_responses()
+    assert not session.in_transaction()
+
+    failing_state = await service.get(meeting_id, failing.id)
+    stale_state = await service.get(meeting_id, stale.id)
+    assert failing_state.status == UploadStatus.ABORTING
+    assert (stale_state.status, stale_state.parts) == (UploadStatus.ABORTED, [])
+    with pytest.raises(HTTPException):
+        await service.upload_part(meeting_id, failing.id, 1, _chunks(b"01234"))
+    # Повтор неудачной загрузки - только через stale_after
+    assert await service.abort_stale() == 0
+
+
+@pytest.mark.asyncio
+async def test_meeting_artifact_content_deduplication(
+    session: AsyncSession, s3_stubber: Stubber, artifact_s3_client: S3Client
+):
+    service = ArtifactService(
+        ArtifactRepository(session), MeetingRepository(session), artifact_s3_client
+    )
+    meeting_ids = await _create_meetings(session, 3)
+    data = b"slides"
+    sha256 = hashlib.sha256(data).hexdigest()
+
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "artifacts"})
+    artifacts = []
+    for meeting_id, name, stored in ((meeting_ids[0], "Слайды", False), (meeting_ids[1], "Доклад", True)):
+        upload = await service.create_meeting_upload(
+            meeting_id, UploadUrlRequest(filename="slides.pdf", content_type="application/pdf", size=6)
+        )
+        s3_stubber.add_response(
+            "head_object",
+            {"ContentLength": 6, "ContentType": "application/pdf"},
+            {"Bucket": "artifacts", "Key": upload.key},
+        )
+        artifact = await service.complete_meeting_upload(
+            meeting_id, ArtifactUploadComplete(key=upload.key, name=name)
+        )
+        # Повторная загрузка того же файла не копирует его второй раз
+        _stub_store_content(s3_stubber, upload.key, data, stored=stored)
+        await service.store_upload(artifact.id)
+        artifacts.append(artifact)
+    s3_stubber.assert_no_pending_responses()
+
+    # У каждой загрузки свой артефакт со своим названием, файл общий
+    first, second = [(await service.get_meeting_artifacts(m))[0] for m in meeting_ids[:2]]
+    assert (first.name, second.name) == ("Слайды", "Доклад")
+    assert first.id != second.id and first.sha256 == second.sha256 == sha256
+
+    # Третья встреча привязывает файл по хешу, без загрузки
+    linked = await service.link_meeting_content(
+        meeting_ids[2], ArtifactByHash(sha256=sha256, size=6, name="Материалы", type="FILE")
+    )
+    assert linked.name == "Материалы" and linked.id not in {first.id, second.id}
+    assert linked.content_type == "application/pdf"
+    with pytest.raises(HTTPException):
+        await service.link_meeting_content(
+            meeting_ids[2], ArtifactByHash(sha256="0" * 64, size=6, name="Нет")
+        )
+    blob = await ArtifactRepository(session).get_blob(sha256)
+    await session.refresh(blob)
+    assert blob.ref_count == 3
+
+    # Файл удаляется только вместе с последним артефактом
+    await service.remove_meeting_artifact(meeting_ids[0], first.id)
+    await service.remove_meeting_artifact(meeting_ids[1], second.id)
+    assert await service.get_meeting_artifacts(meeting_ids[2]) != []
+    s3_stubber.add_response(
+        "delete_object", {}, {"Bucket": "artifacts", "Key": content_key(sha256)}
+    )
+    await service.remove_meeting_artifact(meeting_ids[2], linked.id)
+    s3_stubber.assert_no_pending_responses()
+
+    assert await ArtifactRepository(session).get_blob(sha256) is None
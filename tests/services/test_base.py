@@ -1,10 +1,37 @@
 import pytest
-from uuid import uuid4
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+from uuid import UUID, uuid4
+from botocore.stub import ANY, Stubber
+from fastapi import UploadFile
+from starlette.datastructures import Headers
 from app.infrastructure.database.repositories.base_repository import BaseRepository
 from app.application.services.base_service import BaseService
 from app.infrastructure.database.models.teams.team import TeamModel
 from app.domain.entities.teams.team import Team
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.application.services.auth_service import AuthService
+from app.application.services.curator_service import CuratorService
+from app.application.services.meeting_service import MeetingService
+from app.application.services.team_service import TeamService
+from app.domain.events import MeetingCompleted, TaskCarriedOver
+from app.infrastructure.database.models import CuratorModel
+from app.infrastructure.database.models.meetings.meeting import MeetingModel
+from app.infrastructure.database.models.meetings.meeting_task import MeetingTaskModel
+from app.infrastructure.database.models.meetings.task import TaskModel
+from app.infrastructure.database.repositories.meeting_repository import MeetingRepository
+from app.infrastructure.database.repositories.curator_repository import CuratorRepository
+from app.infrastructure.database.repositories.meeting_task_repository import MeetingTaskRepository
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+from app.infrastructure.database.repositories.team_repository import TeamRepository
+from app.infrastructure.database.repositories.token_repository import TokenRepository
+from app.infrastructure.database.models.outbox.outbox_event import OutboxEventModel
+from app.infrastructure.database.repositories.outbox_repository import OutboxRepository
+from app.infrastructure.database.unit_of_work import UnitOfWork
+from app.infrastructure.msBroker.memory import InMemoryBroker
+from app.infrastructure.msBroker.outbox import OutboxRelay
+from app.infrastructure.s3_storage.s3_client import S3Client
 
 
 @pytest.mark.asyncio
@@ -43,3 +70,187 @@ async def test_team_service_crud_with_domain(session: AsyncSession):
 
     fetched_none = await service.get_by_id(created.id)
     assert fetched_none is None
+
+
+@pytest.mark.asyncio
+async def test_to_schemas_matches_per_row_conversion(session: AsyncSession):
+    service = TeamService(TeamRepository(session))
+    created = await service._repo.create(TeamModel(name="Loaded", group_link="https://t.me/a"))
+    # У второй строки нет group_link в __dict__: она читается через атрибуты
+    rows = [created, TeamModel(id=uuid4(), name="Transient")]
+
+    converted = service._to_schemas(rows)
+
+    assert converted == [service._to_schema(row) for row in rows]
+    assert converted[1].group_link is None
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error(session: AsyncSession):
+    repo = BaseRepository(TeamModel, session)
+    service = BaseService[TeamModel, Team](repo)
+
+    with pytest.raises(RuntimeError):
+        async with service._uow:
+            created = await repo.create(TeamModel(name="Team Rollback"))
+            async with service._uow:
+                await repo.update(created, {"group_link": "https://t.me/rollback"})
+            raise RuntimeError
+
+    teams = await repo.get_list(name="Team Rollback")
+    assert teams == []
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_hash_and_verify():
+    hashed = await AuthService.get_hashed_pass("password123")
+    assert await AuthService.verify_password("password123", hashed)
+    assert not await AuthService.verify_password("wrong-password", hashed)
+
+
+@pytest.mark.asyncio
+async def test_upload_avatar_with_stubbed_s3(
+    session: AsyncSession, s3_stubber: Stubber, boto_client
+):
+    s3_client = S3Client("curators", {"Version": "2012-10-17"}, client=boto_client)
+    service = CuratorService(
+        CuratorRepository(session), AuthService(TokenRepository(session)), s3_client
+    )
+    curator = await CuratorRepository(session).create(CuratorModel(
+        first_name="Avatar",
+        last_name="Owner",
+        email=f"{uuid4()}@example.com",
+        hashed_password="x",
+    ))
+    avatar = UploadFile(
+        BytesIO(b"png-bytes"),
+        filename="me.png",
+        headers=Headers({"content-type": "image/png"}),
+    )
+
+    # Бакет проверяется один раз на клиент, а не на каждый запрос
+    s3_stubber.add_response("head_bucket", {}, {"Bucket": "curators"})
+    s3_stubber.add_response("put_bucket_policy", {}, {"Bucket": "curators", "Policy": ANY})
+    for _ in range(2):
+        s3_stubber.add_response(
+            "put_object",
+            {"ETag": '"etag"'},
+            {"Bucket": "curators", "Key": f"/avatars/{curator.id}/me.png",
+             "Body": ANY, "ContentType": "image/png"},
+        )
+    await service.upload_avatar(avatar, curator.id)
+    updated = await service.upload_avatar(avatar, curator.id)
+
+    assert updated.avatar_s3_path.endswith(f"/curators/avatars/{curator.id}/me.png")
+    assert await service.get_avatar_key(curator.id) == f"avatars/{curator.id}/me.png"
+    assert not session.in_transaction()
+
+
+@pytest.mark.asyncio
+async def test_stream_all_meetings_in_batches(session: AsyncSession):
+    team = TeamModel(name="Stream team")
+    session.add(team)
+    await session.flush()
+    start = datetime.now(tz=timezone.utc)
+    session.add_all(
+        MeetingModel(name=f"Meeting {n}", date=start + timedelta(days=n), team_id=team.id)
+        for n in range(5)
+    )
+    await session.flush()
+    service = MeetingService(
+        MeetingRepository(session),
+        TaskRepository(session),
+        MeetingTaskRepository(session),
+        TeamRepository(session),
+    )
+
+    batches = [batch async for batch in service.stream_all_meetings(batch_size=2)]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    names = [meeting.name for batch in batches for meeting in batch]
+    assert names == [f"Meeting {n}" for n in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_complete_meeting_carries_over_tasks_via_outbox(session: AsyncSession):
+    broker = InMemoryBroker(
+        max_attempts=1, retry_base_delay=0, retry_max_delay=0, concurrency={}
+    )
+    relay = OutboxRelay(broker, batch_size=10, poll_interval=1, max_attempts=3)
+    service = MeetingService(
+        MeetingRepository(session),
+        TaskRepository(session),
+        MeetingTaskRepository(session),
+        TeamRepository(session),
+    )
+    carried = []
+    carried_events = []
+
+    @broker.handler("carry_over")
+    async def carry_over(payload):
+        carried.append(await service.carry_over_tasks(UUID(payload["meeting_id"])))
+
+    @relay.subscribe(TaskCarriedOver)
+    async def on_carried(event):
+        carried_events.append(event)
+
+    relay.forward(MeetingCompleted, "carry_over")
+
+    team = await BaseRepository(TeamModel, session).create(TeamModel(name="Carry over"))
+    now = datetime.now(tz=timezone.utc)
+    current, upcoming = [
+        await MeetingRepository(session).create(MeetingModel(
+            name=name, date=now + timedelta(days=days), team_id=team.id
+        ))
+        for name, days in (("Current", 1), ("Upcoming", 8))
+    ]
+    current_id, upcoming_id = current.id, upcoming.id
+    tasks = [
+        await TaskRepository(session).create(TaskModel(description=f"Task {i}", is_completed=i == 0))
+        for i in range(3)
+    ]
+    session.add_all(MeetingTaskModel(meeting_id=current_id, task_id=task.id) for task in tasks)
+    await session.flush()
+
+    # Событие записано в транзакции завершения встречи. Очередь в памяти
+    # не переживает перезапуск: relay выполняет задачу до удаления события
+    await service.complete_meeting(current_id)
+    assert await relay.publish_batch(session) == 1
+    assert carried == [2]
+    assert all(queue.empty() for queue in broker._queues.values())
+
+    assert await relay.publish_batch(session) == 2
+    assert {event.task_id for event in carried_events} == {task.id for task in tasks[1:]}
+    assert await relay.publish_batch(session) == 0
+    # Повторная доставка задачи ничего не дублирует
+    assert await service.carry_over_tasks(current_id) == 0
+    links = await MeetingTaskRepository(session).get_by_meeting_id(upcoming_id)
+    assert {link.task_id for link in links} == {task.id for task in tasks[1:]}
+
+
+@pytest.mark.asyncio
+async def test_outbox_keeps_event_until_in_memory_job_succeeds(session: AsyncSession):
+    broker = InMemoryBroker(
+        max_attempts=1, retry_base_delay=0, retry_max_delay=0, concurrency={}
+    )
+    relay = OutboxRelay(broker, batch_size=10, poll_interval=1, max_attempts=3)
+    calls = []
+
+    @broker.handler("carry_over")
+    async def carry_over(payload):
+        calls.append(payload["meeting_id"])
+        if len(calls) == 1:
+            raise RuntimeError("worker died")
+
+    relay.forward(MeetingCompleted, "carry_over")
+    event = MeetingCompleted(meeting_id=uuid4(), team_id=uuid4())
+    async with UnitOfWork(session):
+        OutboxRepository(session).add_events(event)
+
+    # Задача упала: событие остается и доставляется следующей пачкой
+    assert await relay.publish_batch(session) == 0
+    [row] = await session.scalars(select(OutboxEventModel))
+    assert row.attempts == 1
+    assert await relay.publish_batch(session) == 1
+    assert calls == [str(event.meeting_id)] * 2
+    assert list(await session.scalars(select(OutboxEventModel))) == []
+
@@ -0,0 +1,88 @@
+import pytest
+from datetime import datetime, timezone
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.application.dto.meeting import MeetingUpdate
+from app.application.dto.task import TaskCreate, TaskUpdate
+from app.application.services.meeting_service import MeetingService
+from app.application.services.task_service import TaskService
+from app.domain.enums.meeting_status import MeetingStatus
+from app.infrastructure.database.models.meetings.meeting import MeetingModel
+from app.infrastructure.database.models.outbox.outbox_event import OutboxEventModel
+from app.infrastructure.database.models.teams.team import TeamModel
+from app.infrastructure.database.repositories.base_repository import BaseRepository
+from app.infrastructure.database.repositories.meeting_repository import MeetingRepository
+from app.infrastructure.database.repositories.meeting_task_repository import MeetingTaskRepository
+from app.infrastructure.database.repositories.task_repository import TaskRepository
+from app.infrastructure.database.repositories.team_repository import TeamRepository
+
+
+async def _events(session: AsyncSession) -> list[tuple[str, dict]]:
+    result = await session.execute(
+        select(OutboxEventModel.name, OutboxEventModel.payload).order_by(OutboxEventModel.id)
+    )
+    return [tuple(row) for row in result]
+
+
+async def _create_meeting(session: AsyncSession) -> MeetingModel:
+    team = await BaseRepository(TeamModel, session).create(TeamModel(name="Events"))
+    return await MeetingRepository(session).create(MeetingModel(
+        name="Demo", date=datetime.now(tz=timezone.utc), team_id=team.id
+    ))
+
+
+@pytest.mark.asyncio
+async def test_meeting_patch_status_emits_transition_event_once(session: AsyncSession):
+    service = MeetingService(
+        MeetingRepository(session),
+        TaskRepository(session),
+        MeetingTaskRepository(session),
+        TeamRepository(session),
+    )
+    meeting = await _create_meeting(session)
+    meeting_id = meeting.id
+    payload = {"meeting_id": str(meeting_id), "team_id": str(meeting.team_id)}
+
+    await service.update(MeetingUpdate(name="Renamed"), meeting_id)
+    await service.update(MeetingUpdate(status=MeetingStatus.COMPLETED), meeting_id)
+    await service.update(MeetingUpdate(status=MeetingStatus.COMPLETED), meeting_id)
+    assert await _events(session) == [("MeetingCompleted", payload)]
+
+    # Как и cancel_meeting, PATCH не отменяет завершенную встречу
+    with pytest.raises(HTTPException) as error:
+        await service.update(MeetingUpdate(status=MeetingStatus.CANCELED), meeting_id)
+    assert error.value.status_code == 400
+
+    await service.update(MeetingUpdate(status=MeetingStatus.SCHEDULED), meeting_id)
+    updated = await service.update(MeetingUpdate(status=MeetingStatus.CANCELED), meeting_id)
+    assert updated.status == MeetingStatus.CANCELED
+    assert await _events(session) == [
+        ("MeetingCompleted", payload),
+        ("MeetingCanceled", payload),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_task_patch_and_meeting_links_emit_events(session: AsyncSession):
+    service = TaskService(
+        TaskRepository(session),
+        MeetingRepository(session),
+        MeetingTaskRepository(session),
+    )
+    meeting = await _create_meeting(session)
+    task = await service.create(TaskCreate(description="Standalone"))
+    link = {"task_id": str(task.id), "meeting_id": str(meeting.id)}
+
+    await service.add_task_to_meeting(meeting.id, task.id)
+    await service.update(TaskUpdate(is_completed=True), task.id)
+    await service.update(TaskUpdate(is_completed=True), task.id)
+    await service.remove_task_from_meeting(meeting.id, task.id)
+    with pytest.raises(HTTPException):
+        await service.remove_task_from_meeting(meeting.id, task.id)
+
+    assert await _events(session) == [
+        ("TaskAddedToMeeting", link),
+        ("TaskCompleted", {"task_id": str(task.id)}),
+        ("TaskRemovedFromMeeting", link),
+    ]
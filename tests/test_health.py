@@ -1,4 +1,6 @@
-from app.main import main_app
+import pytest
+from app.core.config import settings
+from app.main import check_shared_state, main_app
 from fastapi.testclient import TestClient
 
 test_client = TestClient(main_app)
@@ -7,3 +9,25 @@ test_client = TestClient(main_app)
 def test_root_status_code():
     response = test_client.get("/api/health")
     assert response.status_code == 200
+    assert response.headers["server-timing"].startswith("db;dur=")
+
+
+def test_metrics_use_route_template():
+    test_client.get("/api/health")
+    test_client.get("/api/unknown/123")
+    metrics = test_client.get("/metrics").text
+    assert 'path="/api/health"' in metrics
+    # Путь без маршрута не создает свою серию
+    assert 'path="<unmatched>"' in metrics
+    assert "/api/unknown/123" not in metrics
+    assert "http_requests_in_progress" in metrics
+    assert "http_response_size_bytes" in metrics
+
+
+def test_multiple_workers_require_shared_cache(monkeypatch):
+    monkeypatch.setattr(settings.run, "workers", 4)
+    monkeypatch.setattr(settings.cache, "url", "")
+    with pytest.raises(RuntimeError, match="CACHE__URL"):
+        check_shared_state()
+    monkeypatch.setattr(settings.cache, "url", "redis://cache:6379/0")
+    check_shared_state()